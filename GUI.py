@@ -1,12 +1,20 @@
 import sys, os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from PyQt6.QtWidgets import QApplication, QMainWindow, QStackedWidget
+# IMPORT_PROFILE=1 logs per-module import cost (installed before the heavy imports below)
+from utils.import_profiler import profile_imports_from_env
+IMPORT_PROFILER = profile_imports_from_env()
+
+from PyQt6.QtCore import QTimer
+from config.config import GLOBAL_CONFIG
+from PyQt6.QtWidgets import QApplication, QMainWindow, QStackedWidget, QWidget
 from ui.course_ui import Ui_MainWindow as CourseUI
 from ui.student_ui import Ui_MainWindow as StudentUI
 from ui.payment_ui import Ui_MainWindow as PaymentUI
 from ui.analysis_ui import Ui_MainWindow as AnalysisUI
 from application.course_ex import CourseManagementEx
+from database.summary.student_course_score import ensure_student_course_score_async
+from utils.table.table_manager import TableViewManager
 
 # ====== FRAME CHO MỖI UI ======
 class CourseFrame(QMainWindow):
@@ -16,11 +24,21 @@ class CourseFrame(QMainWindow):
         self.ui.setupUi(self)
         self.logic = CourseManagementEx(self.ui)
 
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.logic.on_page_shown()
+
+    def hideEvent(self, event):
+        # Navigating away drops any query still running for this page
+        self.logic.cancel_pending()
+        super().hideEvent(event)
+
 class StudentFrame(QMainWindow):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.ui = StudentUI()
         self.ui.setupUi(self)
+        self.table = TableViewManager(self.ui.student_table) # Column titles: TableViewManager.HEADERS
 
 
 class PaymentFrame(QMainWindow):
@@ -28,6 +46,7 @@ class PaymentFrame(QMainWindow):
         super().__init__(parent)
         self.ui = PaymentUI()
         self.ui.setupUi(self)
+        self.table = TableViewManager(self.ui.payment_table) # Column titles: TableViewManager.HEADERS
 
 
 class AnalysisFrame(QMainWindow):
@@ -38,56 +57,104 @@ class AnalysisFrame(QMainWindow):
 
 # ====== MAIN WINDOW CHÍNH ======
 class MainApp(QMainWindow):
-    def __init__(self):
+    # (attribute name, factory) per page, in menu order. Frames are built on first use.
+    PAGES = [
+        ("course_frame", CourseFrame),     # index 0
+        ("student_frame", StudentFrame),   # index 1
+        ("payment_frame", PaymentFrame),   # index 2
+        ("analysis_frame", AnalysisFrame), # index 3
+    ]
+    # Delay between pre-warming two pages, so the event loop stays responsive
+    PREWARM_INTERVAL_MS = 150
+
+    def __init__(self, prewarm: bool = True):
         super().__init__()
         self.setWindowTitle("Hệ thống quản lý khóa học")
+        self.prewarm = prewarm
+        self._prewarm_started = False
+        self.recommendation_warmup = None
 
         # Tạo stacked widget
         self.stacked_widget = QStackedWidget()
         self.setCentralWidget(self.stacked_widget)
 
-        # Tạo các frame con
-        self.course_frame = CourseFrame(self)
-        self.student_frame = StudentFrame(self)
-        self.payment_frame = PaymentFrame(self)
-        self.analysis_frame = AnalysisFrame(self)
-
-        # Thêm frame vào stacked widget
-        self.stacked_widget.addWidget(self.course_frame)   # index 0
-        self.stacked_widget.addWidget(self.student_frame)  # index 1
-        self.stacked_widget.addWidget(self.payment_frame)  # index 2
-        self.stacked_widget.addWidget(self.analysis_frame) # index 3
+        # Mỗi trang giữ chỗ bằng một widget rỗng cho tới khi được mở lần đầu
+        self.frames: dict[int, QMainWindow] = {}
+        for attr_name, _ in self.PAGES:
+            setattr(self, attr_name, None)
+            self.stacked_widget.addWidget(QWidget())
 
         # Mặc định mở tab "Course"
-        self.stacked_widget.setCurrentIndex(0)
-
-        # Gắn sự kiện cho menu
-        self.connect_menus()
-
-    def connect_menus(self):
-        """Kết nối 4 nút menu giữa các frame"""
-        frames = [
-            self.course_frame,
-            self.student_frame,
-            self.payment_frame,
-            self.analysis_frame
-        ]
-
-        # Gán hành vi cho tất cả menu của từng frame
-        for frame in frames:
-            ui = frame.ui
-            ui.menu_course.clicked.connect(lambda: self.switch_to(0))
-            ui.menu_student.clicked.connect(lambda: self.switch_to(1))
-            ui.menu_payment.clicked.connect(lambda: self.switch_to(2))
-            ui.menu_analysis.clicked.connect(lambda: self.switch_to(3))
-            ui.menu_logout.clicked.connect(self.logout)
+        self.switch_to(0)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self.prewarm and not self._prewarm_started:
+            # Build the remaining pages one by one once the first page has painted
+            self._prewarm_started = True
+            QTimer.singleShot(self.PREWARM_INTERVAL_MS, self._prewarm_next)
+
+    def ensure_frame(self, index: int) -> QMainWindow:
+        """Builds the page at index (replacing its placeholder) if it does not exist yet."""
+        frame = self.frames.get(index)
+        if frame is not None:
+            return frame
+
+        attr_name, factory = self.PAGES[index]
+        frame = factory(self)
+        placeholder = self.stacked_widget.widget(index)
+        self.stacked_widget.insertWidget(index, frame)
+        self.stacked_widget.removeWidget(placeholder)
+        placeholder.deleteLater()
+
+        self.frames[index] = frame
+        setattr(self, attr_name, frame)
+        self.connect_menus(frame)
+        return frame
+
+    def _prewarm_next(self):
+        """Builds the next page that has not been opened yet, then schedules the one after."""
+        pending = [index for index in range(len(self.PAGES)) if index not in self.frames]
+        if not pending:
+            if GLOBAL_CONFIG.WARMUP_ON_IDLE and self.recommendation_warmup is None:
+                # All pages are built: use the idle time to fill the recommendation cache
+                QTimer.singleShot(GLOBAL_CONFIG.WARMUP_IDLE_DELAY_MS, self.start_recommendation_warmup)
+            return
+        current = self.stacked_widget.currentIndex()
+        self.ensure_frame(pending[0])
+        self.stacked_widget.setCurrentIndex(current) # Pre-warming never changes the visible page
+        QTimer.singleShot(self.PREWARM_INTERVAL_MS, self._prewarm_next)
+
+    def start_recommendation_warmup(self):
+        """Fills the recommendation cache on a background thread (model loading included)."""
+        if self.recommendation_warmup is None:
+            from inference.warmup import RecommendationWarmup
+            self.recommendation_warmup = RecommendationWarmup()
+        self.recommendation_warmup.start()
+
+    def closeEvent(self, event):
+        if self.recommendation_warmup is not None:
+            self.recommendation_warmup.stop(timeout=0) # Daemon thread; resumes from its checkpoint next time
+        super().closeEvent(event)
+
+    def connect_menus(self, frame: QMainWindow):
+        """Kết nối 4 nút menu của một frame"""
+        ui = frame.ui
+        ui.menu_course.clicked.connect(lambda: self.switch_to(0))
+        ui.menu_student.clicked.connect(lambda: self.switch_to(1))
+        ui.menu_payment.clicked.connect(lambda: self.switch_to(2))
+        ui.menu_analysis.clicked.connect(lambda: self.switch_to(3))
+        ui.menu_logout.clicked.connect(self.logout)
 
     def switch_to(self, index: int):
         """Chuyển tab theo index"""
+        self.ensure_frame(index)
         self.stacked_widget.setCurrentIndex(index)
 
     def logout(self):
         """Thoát ứng dụng"""
+        if self.recommendation_warmup is not None:
+            self.recommendation_warmup.stop(timeout=0)
         QApplication.quit()
 
 
@@ -96,5 +163,8 @@ if __name__ == "__main__":
     import sys
     app = QApplication(sys.argv)
     window = MainApp()
+    ensure_student_course_score_async(parent=window) # Score queries read the summary table; created on first run
     window.show()
+    if IMPORT_PROFILER:
+        QTimer.singleShot(0, lambda: IMPORT_PROFILER.report("startup")) # Runs once the first window has painted
     sys.exit(app.exec())
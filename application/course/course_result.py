@@ -1,34 +1,106 @@
 from ui.course_result import Ui_MainWindow
 from PyQt6.QtWidgets import QMainWindow, QLabel, QHBoxLayout, QVBoxLayout, QWidget
 from utils.logger import get_class_logger
-from database.course.course import get_n_highest_score_student, get_dropout_percentage, get_student_score_statistic
-from database.student.student import get_student_score_per_course
+from database.course.dashboard import CourseDashboard, get_course_dashboard, get_cached_course_dashboard
 from utils.plot.plot_manager import PlotManager
 from utils.plot.student_score import StudentScoreVisualizer
 from utils.plot.course import CourseInfoVisualizer
+from utils.plot.render_pipeline import PlotRenderPipeline
+from database.async_execute_service import AsyncDBExecuteService
 
 class CourseResultEx(QMainWindow):
+  TOP_N = 5
+  SCORE_PLOT_TITLE = "Student Average Score Distribution"
+  DROPOUT_PLOT_TITLE = "Dropout/Retention Rate"
   
-  def __init__(self):
-    super().__init__()
+  def __init__(self, code_module: str | None = None, code_presentation: str | None = None, parent=None):
+    super().__init__(parent)
     self.ui = Ui_MainWindow()
     self.ui.setupUi(self)
   
     self.logger = get_class_logger(__name__, __class__.__name__)
+    self.db_async = AsyncDBExecuteService(parent=self)
+    self.plot_pipeline = PlotRenderPipeline(parent=self)
+    self.code_module = code_module
+    self.code_presentation = code_presentation
+    self._dashboard_task = None
+    self._reload_on_show = False
+    if code_module and code_presentation:
+      self.pre_run_the_page()
+
+  def show_course(self, code_module: str, code_presentation: str):
+    """Switches the page to another course, reusing the already built widgets."""
+    self.code_module = code_module
+    self.code_presentation = code_presentation
     self.pre_run_the_page()
     
-    
   def pre_run_the_page(self):
-    self.visualize_student_score_distibution()
-    self.show_top_5_students()
-    self.visualize_drop_out_rate()
-    self.show_course_statistic_info()
+    """
+    Renders the current course: straight from the dashboard cache when it was
+    viewed recently, otherwise skeleton state first and one background load.
+    """
+    self.setWindowTitle(f"Course result - {self.code_module} {self.code_presentation}")
+    if self._dashboard_task is not None:
+      self._dashboard_task.cancel() # Only the latest selected course is rendered
+
+    cached = get_cached_course_dashboard(self.code_module, self.code_presentation, self.TOP_N)
+    if cached is not None:
+      self._dashboard_task = None
+      self.render_dashboard(cached)
+      return
+
+    self.show_loading_state()
+    self._dashboard_task = self.db_async.call(get_course_dashboard, code_module=self.code_module,
+                                              code_presentation=self.code_presentation, top_n=self.TOP_N,
+                                              on_result=self.render_dashboard)
+
+  def render_dashboard(self, dashboard: CourseDashboard | None):
+    """Fills every block of the page from one dashboard object."""
+    if dashboard is None:
+      self.logger.error(f"Course dashboard for {self.code_module}/{self.code_presentation} could not be loaded.")
+      dashboard = CourseDashboard(code_module=self.code_module, code_presentation=self.code_presentation,
+                                  scores={}, score_histogram=None, top_students=[], dropout={}, statistics={})
+    elif (dashboard['code_module'], dashboard['code_presentation']) != (self.code_module, self.code_presentation):
+      return # Result of a course the user already navigated away from
+    self.visualize_student_score_distibution(dashboard['scores'], dashboard['score_histogram'])
+    self.show_top_5_students(dashboard['top_students'])
+    self.show_course_statistic_info(dashboard['statistics'])
+    self.visualize_drop_out_rate(dashboard['dropout'])
+
+  def show_loading_state(self):
+    """Placeholder text and empty plots while the dashboard queries run."""
+    for label in (self.ui.mean_stu_score, self.ui.max_stu_score, self.ui.min_stu_score, self.ui.mode_stu_score):
+      label.setText("...")
+    for i in range(1, 6):
+      label = getattr(self.ui, f"course_result_{i}", None)
+      if label is not None:
+        label.setText(f"{i}. Loading...")
+    for target_widget in (self.ui.line_chart, self.ui.pie_chart):
+      try:
+        with PlotManager.deferred_draw(target_widget):
+          PlotManager.clear(target_widget).set_title("Loading...")
+      except Exception as e:
+        self.logger.error(f"Failed to show loading plot: {e}", exc_info=True)
+
+  def showEvent(self, event):
+    super().showEvent(event)
+    if self._reload_on_show and self.code_module:
+      self._reload_on_show = False
+      self.pre_run_the_page()
+
+  def hideEvent(self, event):
+    # Leaving the page drops queries that are still running; reload them when it comes back
+    if self.db_async.pending_count or self.plot_pipeline.pending_count:
+      self._reload_on_show = True
+      self.db_async.cancel_all()
+      self.plot_pipeline.cancel_all()
+    super().hideEvent(event)
   
   def connect_all(self):
     
     pass
     
-  def visualize_student_score_distibution(self):
+  def visualize_student_score_distibution(self, score_data: dict, score_histogram: dict | None = None):
     target_widget = self.ui.line_chart
     if not target_widget:
       self.logger.error("Target widget 'verticalLayoutWidget' for plot not found. Cannot load score distribution.")
@@ -36,21 +108,21 @@ class CourseResultEx(QMainWindow):
 
     self.logger.info("Loading student score distribution plot...")
     try:
-      # 1. Fetch data
-      score_data = get_student_score_per_course()
-      self.logger.debug(f"Fetched {len(score_data) if score_data else 0} score records.")
-
-      # 2. Call the PlotManager static method, passing the TARGET WIDGET and data
-      #    This method finds/creates canvas, clears, plots, and redraws.
-      plot_instance = StudentScoreVisualizer.create_score_distribution(target_widget, score_data)
-
-      # 3. Optionally use the returned instance for immediate configuration
-      if plot_instance and plot_instance.has_plot:
-        plot_instance.set_title("Student Average Score Distribution") # Example config
-        self.logger.info("Score distribution plot created and configured.")
-      elif plot_instance: # Plot instance exists but has_plot is false (e.g., "No Data" or "Error")
-        self.logger.warning("Plot generated, but indicates no data or an error state (check plot title).")
-      # No 'else' needed as static method should always return a PlotManager instance
+      # 1. Data was fetched in the background by pre_run_the_page
+      if score_histogram is not None: # Bins mode: the database already binned the scores
+        self.logger.debug(f"Fetched {len(score_histogram['bins'])} score bins ({score_histogram['count']} students).")
+        compute, data = StudentScoreVisualizer.compute_distribution_from_bins, score_histogram
+      else:
+        self.logger.debug(f"Fetched {len(score_data.get('avg_score', [])) if score_data else 0} score records.")
+        compute, data = StudentScoreVisualizer.compute_distribution, score_data
+
+      # 2. Histogram/KDE are computed on the thread pool; only the artists are drawn here.
+      #    A newer course replaces a render that is still computing, and a course rendered
+      #    before shows its cached image until the live plot is ready.
+      cache_key = PlotManager.image_cache_key(target_widget, StudentScoreVisualizer.PLOT_KIND,
+                                              {'title': self.SCORE_PLOT_TITLE, 'compute': compute.__name__}, data)
+      self.plot_pipeline.render(target_widget, compute, StudentScoreVisualizer.draw_distribution, data,
+                                on_drawn=self._configure_score_distribution, cache_key=cache_key)
 
     except Exception as e:
       self.logger.error(f"Error during score distribution loading/plotting: {e}", exc_info=True)
@@ -60,11 +132,19 @@ class CourseResultEx(QMainWindow):
           PlotManager.clear(target_widget).set_title("Error Loading Data")
       except Exception as clear_err:
         self.logger.error(f"Failed to clear plot after error: {clear_err}", exc_info=True)
+
+  def _configure_score_distribution(self, plot_instance: PlotManager):
+    # Optionally use the returned instance for immediate configuration
+    if plot_instance.has_plot:
+      plot_instance.set_title(self.SCORE_PLOT_TITLE) # Example config
+      self.logger.info("Score distribution plot created and configured.")
+    else: # has_plot is false (e.g., "No Data" or "Error")
+      self.logger.warning("Plot generated, but indicates no data or an error state (check plot title).")
 # ...existing code...
-  def show_top_5_students(self):
+  def show_top_5_students(self, students: list[dict]):
     """
     Fill the existing UI labels course_result_1 .. course_result_5 with
-    "rank. Name — score" using get_n_highest_score_student.
+    "rank. Name — score" from the dashboard top_students rows.
     """
     try:
       top5_frame = getattr(self.ui, "course_result_top5", None)
@@ -72,9 +152,7 @@ class CourseResultEx(QMainWindow):
         self.logger.error("UI does not have 'course_result_top5' frame. Cannot load top-5 students.")
         return
 
-      students = get_n_highest_score_student(code_module='AAA',
-                                             code_presentation='2013J',
-                                             n=5) or []
+      students = students or []
       self.logger.debug(f"Fetched {len(students)} top student records.")
 
       def _get_field(obj, keys):
@@ -118,15 +196,22 @@ class CourseResultEx(QMainWindow):
     except Exception as e:
       self.logger.error(f"Failed to load top-5 students: {e}", exc_info=True)
     
-  def show_course_statistic_info(self):
-    stu_statistic_score = get_student_score_statistic(code_module='AAA',code_presentation='2013J')
+  def show_course_statistic_info(self, stu_statistic_score: dict):
+    stu_statistic_score = stu_statistic_score or {}
     self.ui.mean_stu_score.setText(str(stu_statistic_score.get('mean_score')))
     self.ui.max_stu_score.setText(str(stu_statistic_score.get('max_score')))
     self.ui.min_stu_score.setText(str(stu_statistic_score.get('min_score')))
     self.ui.mode_stu_score.setText(str(stu_statistic_score.get('mode_score')))
   
-  def visualize_drop_out_rate(self):
-    data = get_dropout_percentage(code_module='AAA',code_presentation='2013J')
-    plot_manager = CourseInfoVisualizer.create_dropout_rate_pie(data=data, target_widget=self.ui.pie_chart)
-    plot_manager.set_title("Dropout/Retention Rate")
+  def visualize_drop_out_rate(self, data: dict):
+    data = data or {}
+    cache_key = PlotManager.image_cache_key(self.ui.pie_chart, CourseInfoVisualizer.PIE_KIND,
+                                            {'title': self.DROPOUT_PLOT_TITLE}, data)
+    # Nothing to compute: drawn right away, still with the cached image and caching of the render
+    self.plot_pipeline.render_now(self.ui.pie_chart, self._draw_drop_out_rate, data, cache_key=cache_key)
+
+  def _draw_drop_out_rate(self, target_widget: QWidget, data: dict) -> PlotManager:
+    plot_manager = CourseInfoVisualizer.create_dropout_rate_pie(data=data, target_widget=target_widget)
+    plot_manager.set_title(self.DROPOUT_PLOT_TITLE)
+    return plot_manager
     
\ No newline at end of file
@@ -1,21 +1,31 @@
 import mysql.connector
+from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QIcon, QPixmap
-from media.resource_from_qt import *  # load Qt resources
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QMessageBox, QPushButton, QLabel)
 from database.connection_manager import DBConnectionManager
 from database.execute_service import DBExecuteService
+from database.async_execute_service import AsyncDBExecuteService
+from database.course.course import get_course_paginator
+from media.resources import load_resources
+
+load_resources() # Register the :/Icons and :/Images resources before any UI uses them
 
 class CourseManagementEx:
     def __init__(self, ui):
         self.ui = ui
         self.current_page = 1
         self.per_page = 6
-        self.courses = []
+        self.total_pages = 1
+        self.courses = [] # Rows of the current page only
+        self.courses_loaded = False
+        self.db_async = AsyncDBExecuteService()
+        self.paginator = get_course_paginator(self.per_page)
+        self._page_task = None
+        self.result_page = None # CourseResultEx, built on the first course click
 
         self.setup_icons()
         self.connect_signals()
         self.load_courses_from_db()
-        self.display_courses()
 
     # ---------------- ICON SETUP ----------------
     def setup_icons(self):
@@ -39,22 +49,73 @@ class CourseManagementEx:
         self.ui.btn_next.clicked.connect(self.next_page)
         self.ui.btn_previous.clicked.connect(self.previous_page)
 
+        # Clicking a course card opens its result page
+        for i in range(1, 7):
+            card = getattr(self.ui, f"course_{i}")
+            card.setCursor(Qt.CursorShape.PointingHandCursor)
+            card.mouseReleaseEvent = lambda event, index=i - 1: self.on_course_card_clicked(index, event)
+
+    def on_course_card_clicked(self, index: int, event):
+        if event.button() != Qt.MouseButton.LeftButton or not self.courses_loaded or index >= len(self.courses):
+            return
+        course = self.courses[index]
+        self.open_course_result(course["code_module"], course["code_presentation"])
+
+    def open_course_result(self, code_module: str, code_presentation: str):
+        """Shows the result page of a course; one window is reused for every course."""
+        if self.result_page is None:
+            # Imported here so the plotting stack only loads once a result page is opened
+            from application.course.course_result import CourseResultEx
+            self.result_page = CourseResultEx()
+        self.result_page.show_course(code_module, code_presentation)
+        self.result_page.show()
+        self.result_page.raise_()
+        self.result_page.activateWindow()
+
     def load_courses_from_db(self):
-        query = """
-            SELECT code_module, code_presentation, module_presentation_length
-            FROM courses 
-            ORDER BY code_module, code_presentation;
-        """
-        self.courses = DBExecuteService.fetch_all(query) or []
+        """Shows the skeleton grid right away and fetches the current page in the background."""
+        self.courses_loaded = False
+        self.display_loading_state()
+        if self._page_task is not None:
+            self._page_task.cancel() # Only the latest page request matters
+        self._page_task = self.db_async.call(self._fetch_page, self.current_page,
+                                             on_result=self.on_courses_loaded)
+
+    def _fetch_page(self, page: int) -> tuple[list[dict], int, int]:
+        """Worker thread: cached total count + one keyset page of per_page rows."""
+        total_pages = self.paginator.total_pages()
+        page = min(max(1, page), total_pages)
+        return self.paginator.fetch_page(page), page, total_pages
+
+    def on_courses_loaded(self, result: tuple[list[dict], int, int]):
+        self.courses, self.current_page, self.total_pages = result
+        self.courses_loaded = True
+        self.display_courses()
+
+    # ---------------- PAGE LIFECYCLE ----------------
+    def on_page_shown(self):
+        """Reloads the grid if an earlier load was cancelled by navigating away."""
+        if not self.courses_loaded and self.db_async.pending_count == 0:
+            self.load_courses_from_db()
+
+    def cancel_pending(self):
+        """Drops in-flight queries when the page is hidden."""
+        self.db_async.cancel_all()
 
     # ---------------- DISPLAY DATA ----------------
-    def display_courses(self):
-        total_pages = max(1, (len(self.courses) + self.per_page - 1) // self.per_page)
-        self.current_page = min(self.current_page, total_pages)
+    def display_loading_state(self):
+        """Skeleton state: every card shows a placeholder until the data arrives."""
+        for i in range(1, 7):
+            getattr(self.ui, f"course_code_module{i}").setText("Loading...")
+            getattr(self.ui, f"course_code_presentation{i}").setText("")
+            getattr(self.ui, f"presentation{i}").setText("")
+            getattr(self.ui, f"course_{i}").show()
+        self.ui.btn_previous.setEnabled(False)
+        self.ui.btn_next.setEnabled(False)
 
-        start = (self.current_page - 1) * self.per_page
-        end = start + self.per_page
-        data = self.courses[start:end]
+    def display_courses(self):
+        total_pages = self.total_pages
+        data = self.courses
 
         frames = [
             self.ui.course_1, self.ui.course_2, self.ui.course_3,
@@ -143,12 +204,12 @@ class CourseManagementEx:
     # ---------------------- Điều khiển chuyển trang ----------------------
     def go_to_page(self, page):
         self.current_page = page
-        self.display_courses()
+        self.load_courses_from_db()
 
     def next_page(self):
         self.current_page += 1
-        self.display_courses()
+        self.load_courses_from_db()
 
     def previous_page(self):
         self.current_page -= 1
-        self.display_courses()
+        self.load_courses_from_db()
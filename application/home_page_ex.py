@@ -5,24 +5,34 @@ from typing import Optional # Import Optional for type hinting
 from PyQt6.QtWidgets import QMainWindow, QApplication, QWidget, QVBoxLayout
 
 from ui.home_page import Ui_MainWindow
-from database.student.student import get_student_score_per_course
+from config.config import GLOBAL_CONFIG
+from database.student.student import get_student_score_columns, get_student_score_histogram
+from database.async_execute_service import AsyncDBExecuteService
 from utils.logger import get_class_logger
 
 # --- Import ONLY PlotManager (factory/controller class) ---
 # MplCanvas is managed internally by PlotManager's static methods
 from utils.plot.plot_manager import PlotManager
+from utils.plot.student_score import StudentScoreVisualizer
+from utils.plot.render_pipeline import PlotRenderPipeline
 
 # ====================================================================
 # Main Application Window Class (Using PlotManager Statics - Simplified)
 # ====================================================================
 
 class CourseManagementEx(QMainWindow):
+    SCORE_PLOT_TITLE = "Student Average Score Distribution (Final Title)"
+
     def __init__(self):
         super().__init__()
         self.ui = Ui_MainWindow()
         self.ui.setupUi(self)
         self.logger = get_class_logger(__name__, self.__class__.__name__)
         self.logger.info("Initializing CourseManagementEx window...")
+        self.db_async = AsyncDBExecuteService(parent=self)
+        self.plot_pipeline = PlotRenderPipeline(parent=self)
+        self.score_bins_mode = GLOBAL_CONFIG.SCORE_HISTOGRAM_BIN_WIDTH > 0
+        self._reload_on_show = False # Set when hiding the window dropped a load that was still running
 
         # --- No attribute to hold the display canvas ---
         # The MplCanvas existence is managed by PlotManager static methods
@@ -53,7 +63,7 @@ class CourseManagementEx(QMainWindow):
 
 
     def load_student_score_distribution(self):
-        """Fetches score data and uses PlotManager static method to draw the plot."""
+        """Shows a loading plot right away and fetches score data in the background."""
         # Target the specific QWidget container holding the canvas
         target_widget = self.ui.verticalLayoutWidget
         if not target_widget:
@@ -62,30 +72,75 @@ class CourseManagementEx(QMainWindow):
 
         self.logger.info("Loading student score distribution plot...")
         try:
-            # 1. Fetch data
-            score_data = get_student_score_per_course()
-            self.logger.debug(f"Fetched {len(score_data) if score_data else 0} score records.")
-
-            # 2. Call the PlotManager static method, passing the TARGET WIDGET and data
-            #    This method finds/creates canvas, clears, plots, and redraws.
-            plot_instance = PlotManager.create_score_distribution(target_widget, score_data)
-
-            # 3. Optionally use the returned instance for immediate configuration
-            if plot_instance and plot_instance.has_plot:
-                plot_instance.set_title("Student Average Score Distribution (Final Title)") # Example config
-                self.logger.info("Score distribution plot created and configured.")
-            elif plot_instance: # Plot instance exists but has_plot is false (e.g., "No Data" or "Error")
-                self.logger.warning("Plot generated, but indicates no data or an error state (check plot title).")
-            # No 'else' needed as static method should always return a PlotManager instance
+            # 1. Skeleton state while the aggregation query runs (one draw for clear + title)
+            with PlotManager.deferred_draw(target_widget):
+                PlotManager.clear(target_widget).set_title("Loading...")
+        except Exception as e:
+            self.logger.error(f"Failed to show loading plot: {e}", exc_info=True)
+
+        # 2. Fetch data off the GUI thread; the plot is drawn when it arrives.
+        #    Bins mode only transfers the histogram the database computed, not every score.
+        fetch = get_student_score_histogram if self.score_bins_mode else get_student_score_columns
+        self.db_async.call(fetch,
+                           on_result=self.render_student_score_distribution,
+                           on_error=self._on_score_distribution_error)
+
+    def render_student_score_distribution(self, score_data: dict | None):
+        """Draws the score distribution (score columns, or a histogram in bins mode) once the query has returned."""
+        target_widget = self.ui.verticalLayoutWidget
+        try:
+            if self.score_bins_mode:
+                if score_data is None:
+                    raise RuntimeError("Score histogram query failed.")
+                self.logger.debug(f"Fetched {len(score_data['bins'])} score bins ({score_data['count']} students).")
+                compute = StudentScoreVisualizer.compute_distribution_from_bins
+            else:
+                self.logger.debug(f"Fetched {len(score_data.get('avg_score', [])) if score_data else 0} score records.")
+                compute = StudentScoreVisualizer.compute_distribution
+
+            # Histogram/KDE are computed on the thread pool; only the artists are drawn on this thread.
+            # An identical earlier render is shown from the plot image cache in the meantime.
+            cache_key = PlotManager.image_cache_key(target_widget, StudentScoreVisualizer.PLOT_KIND,
+                                                    {'title': self.SCORE_PLOT_TITLE, 'compute': compute.__name__},
+                                                    score_data)
+            self.plot_pipeline.render(target_widget, compute,
+                                      StudentScoreVisualizer.draw_distribution, score_data,
+                                      on_drawn=self._configure_score_distribution, cache_key=cache_key)
 
         except Exception as e:
-            self.logger.error(f"Error during score distribution loading/plotting: {e}", exc_info=True)
-            # Attempt to display an error message on the plot area via PlotManager.clear
-            try:
-                if target_widget: # Check again if target_widget exists
-                    PlotManager.clear(target_widget).set_title("Error Loading Data")
-            except Exception as clear_err:
-                 self.logger.error(f"Failed to clear plot after error: {clear_err}", exc_info=True)
+            self._on_score_distribution_error(e)
+
+    def _configure_score_distribution(self, plot_instance: PlotManager):
+        # Optionally use the returned instance for immediate configuration
+        if plot_instance.has_plot:
+            plot_instance.set_title(self.SCORE_PLOT_TITLE) # Example config
+            self.logger.info("Score distribution plot created and configured.")
+        else: # has_plot is false (e.g., "No Data" or "Error")
+            self.logger.warning("Plot generated, but indicates no data or an error state (check plot title).")
+
+    def _on_score_distribution_error(self, e: Exception):
+        target_widget = self.ui.verticalLayoutWidget
+        self.logger.error(f"Error during score distribution loading/plotting: {e}", exc_info=e)
+        # Attempt to display an error message on the plot area via PlotManager.clear
+        try:
+            if target_widget: # Check again if target_widget exists
+                PlotManager.clear(target_widget).set_title("Error Loading Data")
+        except Exception as clear_err:
+             self.logger.error(f"Failed to clear plot after error: {clear_err}", exc_info=True)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._reload_on_show:
+            self._reload_on_show = False
+            self.load_student_score_distribution()
+
+    def hideEvent(self, event):
+        # Hiding the window drops in-flight queries; reload them when it is shown again
+        if self.db_async.pending_count or self.plot_pipeline.pending_count:
+            self._reload_on_show = True
+            self.db_async.cancel_all()
+            self.plot_pipeline.cancel_all()
+        super().hideEvent(event)
 
 
     def clear_current_plot(self):
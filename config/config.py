@@ -34,6 +34,28 @@ class ConfigManager:
         self.DB_PASSWORD = os.getenv("DB_PASSWORD")
         self.DB_NAME =os.getenv("DB_NAME")
         
+        # Connection pool (shared by every DBConnectionManager in the process)
+        self.DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", 5))
+        self.DB_POOL_IDLE_TIMEOUT_SEC = float(os.getenv("DB_POOL_IDLE_TIMEOUT_SEC", 300))
+        self.DB_POOL_HEALTH_CHECK = os.getenv("DB_POOL_HEALTH_CHECK", "true").lower() in ("1", "true", "yes")
+
+        # Read query result cache in DBExecuteService (TTL 0 disables caching)
+        self.QUERY_CACHE_TTL_SEC = float(os.getenv("QUERY_CACHE_TTL_SEC", 300))
+        self.QUERY_CACHE_MAX_ENTRIES = int(os.getenv("QUERY_CACHE_MAX_ENTRIES", 256))
+        self.QUERY_CACHE_MAX_MB = float(os.getenv("QUERY_CACHE_MAX_MB", 64))
+        # Parameter sets per statement/transaction in DBExecuteService.execute_many()
+        self.DB_BULK_BATCH_SIZE = int(os.getenv("DB_BULK_BATCH_SIZE", 1000))
+        # Rows per chunk for DBExecuteService.stream()
+        self.STREAM_CHUNK_SIZE = int(os.getenv("STREAM_CHUNK_SIZE", 10000))
+        # Computed course dashboards kept for recently viewed courses
+        self.DASHBOARD_CACHE_SIZE = int(os.getenv("DASHBOARD_CACHE_SIZE", 32))
+        self.DASHBOARD_CACHE_TTL_SEC = float(os.getenv("DASHBOARD_CACHE_TTL_SEC", 600))
+        # Score distributions are binned by the database at this width (score points); 0 ships raw scores instead
+        self.SCORE_HISTOGRAM_BIN_WIDTH = float(os.getenv("SCORE_HISTOGRAM_BIN_WIDTH", 2.0))
+        # Rendered plots (PNG) shown instantly on revisits; PLOT_CACHE_MAX_MB 0 disables the cache
+        self.PLOT_CACHE_DIR = os.getenv("PLOT_CACHE_DIR") or str(PROJECT_ROOT / ".plot_cache")
+        self.PLOT_CACHE_MAX_MB = float(os.getenv("PLOT_CACHE_MAX_MB", 64))
+        
         # ---------------------
         # ML and Application Settings
         # ---------------------
@@ -42,7 +64,31 @@ class ConfigManager:
         
         # --- ADD THIS LINE ---
         self.FEATURE_DATA_PATH = os.getenv("FEATURE_DATA_PATH", "data/features.csv")
+        # Compiled, memory-mapped copy of FEATURE_DATA_PATH (default: '<FEATURE_DATA_PATH>.cache')
+        self.FEATURE_CACHE_DIR = os.getenv("FEATURE_CACHE_DIR") or None
+        self.FEATURE_CACHE_VERIFY_HASH = os.getenv("FEATURE_CACHE_VERIFY_HASH", "false").lower() in ("1", "true", "yes")
         self.DEFAULT_TIMEOUT_SEC = int(os.getenv("DEFAULT_TIMEOUT_SEC", 60))
+        # In-memory recommendation tier in front of the studentRecommendations table
+        self.RECOMMENDATION_CACHE_SIZE = int(os.getenv("RECOMMENDATION_CACHE_SIZE", 50000))
+        self.RECOMMENDATION_CACHE_TTL_SEC = float(os.getenv("RECOMMENDATION_CACHE_TTL_SEC", 3600))
+        # Recommendation writes are buffered and flushed as one bulk upsert when either limit is hit
+        self.RECOMMENDATION_WRITE_BUFFER_SIZE = int(os.getenv("RECOMMENDATION_WRITE_BUFFER_SIZE", 500))
+        self.RECOMMENDATION_WRITE_BUFFER_MAX_AGE_SEC = float(os.getenv("RECOMMENDATION_WRITE_BUFFER_MAX_AGE_SEC", 5))
+        # Rows cached by another model version: served until re-scored (or re-predicted on lookup if false)
+        self.RECOMMENDATION_SERVE_STALE = os.getenv("RECOMMENDATION_SERVE_STALE", "true").lower() in ("1", "true", "yes")
+        # Background re-scoring of stale rows after a model change
+        self.RESCORE_ON_START = os.getenv("RESCORE_ON_START", "true").lower() in ("1", "true", "yes")
+        self.RESCORE_BATCH_SIZE = int(os.getenv("RESCORE_BATCH_SIZE", 500))
+        self.RESCORE_PAUSE_SEC = float(os.getenv("RESCORE_PAUSE_SEC", 1.0))
+        # Cache warm-up (python -m inference.warmup, or started by the GUI once idle)
+        self.WARMUP_ON_IDLE = os.getenv("WARMUP_ON_IDLE", "false").lower() in ("1", "true", "yes")
+        self.WARMUP_IDLE_DELAY_MS = int(os.getenv("WARMUP_IDLE_DELAY_MS", 5000))
+        self.WARMUP_IDLE_SEC = float(os.getenv("WARMUP_IDLE_SEC", 2.0))
+        self.WARMUP_BATCH_SIZE = int(os.getenv("WARMUP_BATCH_SIZE", 500))
+        self.WARMUP_PAUSE_SEC = float(os.getenv("WARMUP_PAUSE_SEC", 0.5))
+        self.WARMUP_CHECKPOINT_PATH = os.getenv("WARMUP_CHECKPOINT_PATH", "data/warmup_checkpoint.json")
+        # Qt resources: "rcc" memory-maps media/resources.rcc, "python" imports media/resource_from_qt.py
+        self.QT_RESOURCE_MODE = os.getenv("QT_RESOURCE_MODE", "rcc").lower()
         
         # ---------------------
         # Logger
@@ -0,0 +1,48 @@
+# database/async_execute_service.py
+from typing import Any, Callable
+
+from PyQt6.QtCore import QObject
+from database.execute_service import DBExecuteService
+from utils.async_task import AsyncTaskRunner, TaskHandle
+
+class AsyncDBExecuteService(AsyncTaskRunner):
+    """
+    Non-blocking counterpart of DBExecuteService for GUI code.
+
+    Queries run on a worker thread (each borrowing a pooled connection) and the
+    results are delivered to the callbacks on the GUI thread. Call cancel_all()
+    when the owning page is hidden so stale results are never rendered.
+    """
+    def __init__(self, parent: QObject | None = None):
+        super().__init__(parent)
+
+    def fetch_one(self, query: str, params: tuple = None,
+                  on_result: Callable[[dict | None], None] | None = None,
+                  on_error: Callable[[Exception], None] | None = None) -> TaskHandle:
+        """Runs DBExecuteService.fetch_one in the background."""
+        return self.submit(DBExecuteService.fetch_one, query, params,
+                           on_result=on_result, on_error=on_error)
+
+    def fetch_all(self, query: str, params: tuple = None,
+                  on_result: Callable[[list[dict]], None] | None = None,
+                  on_error: Callable[[Exception], None] | None = None) -> TaskHandle:
+        """Runs DBExecuteService.fetch_all in the background."""
+        return self.submit(DBExecuteService.fetch_all, query, params,
+                           on_result=on_result, on_error=on_error)
+
+    def execute_query(self, query: str, params: tuple = None, return_id: bool = False,
+                      on_result: Callable[[int | bool], None] | None = None,
+                      on_error: Callable[[Exception], None] | None = None) -> TaskHandle:
+        """Runs DBExecuteService.execute_query in the background."""
+        return self.submit(DBExecuteService.execute_query, query, params, return_id,
+                           on_result=on_result, on_error=on_error)
+
+    def call(self, fn: Callable[..., Any], *args,
+             on_result: Callable[[Any], None] | None = None,
+             on_error: Callable[[Exception], None] | None = None,
+             **kwargs) -> TaskHandle:
+        """
+        Runs a query function (e.g. database.course.course.get_dropout_percentage)
+        in the background and hands its return value to on_result.
+        """
+        return self.submit(fn, *args, on_result=on_result, on_error=on_error, **kwargs)
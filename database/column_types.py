@@ -0,0 +1,66 @@
+# database/column_types.py
+"""
+Maps MySQL result columns (cursor.description) to NumPy dtypes and turns
+raw row tuples into typed column arrays, without a per-row dict in between.
+"""
+from typing import Any, Sequence
+
+from mysql.connector import FieldType
+from utils.lazy_import import lazy_import
+
+np = lazy_import("numpy")
+
+_INTEGER_TYPES = {FieldType.TINY, FieldType.SHORT, FieldType.INT24, FieldType.LONG,
+                  FieldType.LONGLONG, FieldType.YEAR, FieldType.BIT}
+_FLOAT_TYPES = {FieldType.FLOAT, FieldType.DOUBLE, FieldType.DECIMAL, FieldType.NEWDECIMAL}
+_DATETIME_TYPES = {FieldType.DATE, FieldType.NEWDATE, FieldType.DATETIME, FieldType.TIMESTAMP}
+
+
+def column_names(description: Sequence[tuple]) -> list[str]:
+    return [column[0] for column in description]
+
+
+def numpy_dtype(column: tuple) -> Any:
+    """
+    NumPy dtype for one cursor.description entry.
+
+    Integers become int64 (float64 if the column is nullable, so NULL can be
+    NaN), DECIMAL/FLOAT/DOUBLE become float64, dates and datetimes become
+    datetime64[us] (NULL -> NaT); everything else stays object.
+    """
+    type_code = column[1]
+    nullable = bool(column[6]) if len(column) > 6 else True
+    if type_code in _INTEGER_TYPES:
+        return np.dtype(np.float64 if nullable else np.int64)
+    if type_code in _FLOAT_TYPES:
+        return np.dtype(np.float64)
+    if type_code in _DATETIME_TYPES:
+        return np.dtype("datetime64[us]")
+    return np.dtype(object)
+
+
+def to_array(values: Sequence[Any], dtype: Any) -> Any:
+    """Builds a typed array from one column of raw values (None -> NaN/NaT)."""
+    if dtype.kind in "if":
+        try:
+            return np.fromiter(values, dtype=dtype, count=len(values))
+        except TypeError: # A NULL in the column
+            return np.fromiter((np.nan if v is None else v for v in values), dtype=np.float64, count=len(values))
+    if dtype.kind == "M":
+        return np.array(values, dtype=dtype)
+    array = np.empty(len(values), dtype=object) # Assigning avoids NumPy unpacking str/bytes-like values
+    array[:] = values
+    return array
+
+
+def rows_to_columns(rows: Sequence[tuple], description: Sequence[tuple]) -> dict[str, Any]:
+    """Transposes raw row tuples into {column name: typed NumPy array}."""
+    transposed = list(zip(*rows)) if rows else [()] * len(description)
+    return {column[0]: to_array(values, numpy_dtype(column))
+            for column, values in zip(description, transposed)}
+
+
+def rows_to_records(rows: Sequence[tuple], description: Sequence[tuple]) -> Any:
+    """Raw row tuples as a NumPy record array with one typed field per column."""
+    columns = rows_to_columns(rows, description)
+    return np.rec.fromarrays(list(columns.values()), names=list(columns.keys()))
@@ -1,7 +1,9 @@
 # database/connection.py
-from matplotlib.backend_bases import cursors
+from typing import Iterator
+
 import mysql.connector
 from config.config import GLOBAL_CONFIG
+from database.connection_pool import DBConnectionPool
 from utils.logger import get_class_logger
 
 logger = get_class_logger(__name__, "DBConnectionManager")
@@ -9,44 +11,42 @@ logger = get_class_logger(__name__, "DBConnectionManager")
 class DBConnectionManager:
     """
     Context Manager for MySQL database connections. 
-    Guarantees that the connection and cursor are closed and transactions are committed.
+    Borrows a warm connection from the process-wide DBConnectionPool and guarantees
+    that the cursor is closed, transactions are committed (or rolled back) and the
+    connection is handed back to the pool.
     """
     def __init__(self, commit_on_success: bool = True,
-                 table: str = None):
+                 table: str = None,
+                 pool: DBConnectionPool | None = None):
         self._conn = None
         self.cursor = None
         self._commit_on_success = commit_on_success
+        self._discard_connection = False
         self.config = GLOBAL_CONFIG
         self.logger = logger
         self.database = self.config.DB_NAME
-        logger.info(f"info of database connection is: ")
+        self.pool = pool if pool is not None else DBConnectionPool.get_instance()
 
     def __enter__(self):
-        """Opens the connection and creates a cursor."""
+        """Checks a connection out of the pool and creates a cursor."""
         try:
-            # 1. Establish the connection using config values
-            self._conn = mysql.connector.connect(
-                host=self.config.DB_HOST,
-                port=self.config.DB_PORT,
-                user=self.config.DB_USER,
-                password=self.config.DB_PASSWORD,
-                # Set database name if you have one configured
-                database=self.database, 
-                connection_timeout=self.config.DEFAULT_TIMEOUT_SEC
-            )
-            logger.info('Connected to MySQL successfully')
+            # 1. Borrow a (possibly already warm) connection from the pool
+            self._conn = self.pool.acquire()
             # 2. Create the cursor
             self.cursor = self._conn.cursor(dictionary=True) # dictionary=True returns rows as dicts
-            logger.debug("Database connection established and cursor opened.")
+            logger.debug("Database connection checked out and cursor opened.")
             return self
 
-        except mysql.connector.Error as e:
+        except (mysql.connector.Error, TimeoutError) as e:
             logger.critical(f"Failed to connect to MySQL database: {e}", exc_info=True)
+            if self._conn is not None:
+                self.pool.release(self._conn, discard=True)
+                self._conn = None
             # Raise the exception to prevent the 'with' block from executing
             raise
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        """Closes the cursor and connection, handling commit/rollback."""
+        """Closes the cursor, handles commit/rollback and returns the connection to the pool."""
         try:
             if self.cursor:
                 self.cursor.close()
@@ -60,8 +60,8 @@ class DBConnectionManager:
                         self._conn.commit()
                         logger.debug("Transaction committed successfully.")
                     else:
-                        # Read-only: no commit/rollback needed
-                        logger.debug("No commit requested; closing connection without rollback.")
+                        # Read-only: the pool resets the snapshot on release
+                        logger.debug("No commit requested; returning connection to the pool.")
                 else:
                     # Exception occurred — rollback
                     try:
@@ -69,15 +69,24 @@ class DBConnectionManager:
                         logger.warning(f"Transaction rolled back due to exception: {exc_val}")
                     except Exception as rb_err:
                         logger.error(f"Rollback failed: {rb_err}", exc_info=True)
-
-                self._conn.close()
-                logger.debug("Database connection closed.")
+                        self._discard_connection = True
 
         except Exception as e:
             logger.error(f"Error during database cleanup: {e}", exc_info=True)
+            self._discard_connection = True
+
+        finally:
+            if self._conn:
+                self.pool.release(self._conn, discard=self._discard_connection)
+                self._conn = None
+                logger.debug("Database connection returned to the pool.")
 
         return False
     
+    def commit(self) -> None:
+        """Commits the work done so far, e.g. between the batches of a bulk write."""
+        self._conn.commit()
+
     def fetch_one(self,
                   query: str,
                   params: tuple = None) -> dict:
@@ -88,4 +97,47 @@ class DBConnectionManager:
                    query: str,
                    params: tuple) -> list[dict]:
         self.cursor.execute(query, params)
-        return self.cursor.fetchall()
\ No newline at end of file
+        return self.cursor.fetchall()
+
+    def fetch_raw(self,
+                  query: str,
+                  params: tuple = None) -> tuple[list[tuple], list[tuple]]:
+        """Returns (cursor.description, rows as plain tuples), skipping the per-row dicts."""
+        cursor = self._conn.cursor(buffered=True)
+        try:
+            cursor.execute(query, params)
+            return cursor.description or [], cursor.fetchall()
+        finally:
+            cursor.close()
+
+    def stream(self,
+               query: str,
+               params: tuple = None,
+               chunk_size: int = 10000) -> Iterator[tuple[list[tuple], list[tuple]]]:
+        """
+        Runs a query on an unbuffered cursor and yields (cursor.description, rows)
+        chunks of at most chunk_size raw tuples, so only one chunk is held
+        in memory at a time.
+
+        Must be fully consumed inside the `with` block. If the consumer stops
+        early, the connection still has unread rows, so it is discarded
+        instead of being returned to the pool.
+        """
+        cursor = self._conn.cursor(buffered=False) # Tuples, rows read from the socket as fetched
+        finished = False
+        try:
+            cursor.execute(query, params)
+            description = cursor.description
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    break
+                yield description, rows
+            finished = True
+        finally:
+            if not finished:
+                self._discard_connection = True
+            try:
+                cursor.close()
+            except Exception as e:
+                logger.debug(f"Closing an unfinished streaming cursor failed: {e}")
@@ -0,0 +1,231 @@
+# database/connection_pool.py
+from __future__ import annotations # Allow type hinting DBConnectionPool within the class
+import threading
+import time
+from collections import deque
+
+import mysql.connector
+from config.config import GLOBAL_CONFIG
+from utils.logger import get_class_logger
+
+logger = get_class_logger(__name__, "DBConnectionPool")
+
+class DBConnectionPool:
+    """
+    Process-wide pool of warm MySQL connections.
+
+    Connections are handed out by acquire() and given back by release(). Idle
+    connections older than the idle timeout are closed instead of reused, and
+    every checkout can optionally ping the server so a dropped connection is
+    replaced transparently. Use DBConnectionPool.get_instance() to share the
+    single pool of the process.
+    """
+    _instance: DBConnectionPool | None = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self,
+                 pool_size: int | None = None,
+                 idle_timeout_sec: float | None = None,
+                 health_check: bool | None = None,
+                 checkout_timeout_sec: float | None = None):
+        """
+        Initialize an empty pool. Connections are opened lazily on demand.
+
+        Args:
+            pool_size: Maximum number of open connections (idle + in use).
+            idle_timeout_sec: Idle connections older than this are closed on checkout.
+            health_check: If True, ping every connection before handing it out.
+            checkout_timeout_sec: How long acquire() waits for a free slot before failing.
+        """
+        self.config = GLOBAL_CONFIG
+        self.pool_size = pool_size if pool_size is not None else self.config.DB_POOL_SIZE
+        self.idle_timeout_sec = idle_timeout_sec if idle_timeout_sec is not None else self.config.DB_POOL_IDLE_TIMEOUT_SEC
+        self.health_check = health_check if health_check is not None else self.config.DB_POOL_HEALTH_CHECK
+        self.checkout_timeout_sec = checkout_timeout_sec if checkout_timeout_sec is not None else self.config.DEFAULT_TIMEOUT_SEC
+
+        self._idle: deque = deque() # (connection, released_at) pairs, most recent on the right
+        self._in_use = 0
+        self._condition = threading.Condition()
+        self._stats = {
+            'created': 0,
+            'reused': 0,
+            'checkouts': 0,
+            'waits': 0,
+            'closed_idle': 0,
+            'closed_unhealthy': 0,
+            'discarded': 0,
+        }
+
+    @classmethod
+    def get_instance(cls) -> DBConnectionPool:
+        """Returns the process-wide pool, creating it on first use."""
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+                    logger.info(f"Created connection pool (size={cls._instance.pool_size}, "
+                                f"idle_timeout={cls._instance.idle_timeout_sec}s).")
+        return cls._instance
+
+    # --- Checkout / Checkin ---
+
+    def acquire(self):
+        """
+        Checks out a connection, reusing a warm idle one when possible.
+
+        Raises:
+            mysql.connector.Error: If a new connection cannot be opened.
+            TimeoutError: If the pool stays exhausted for checkout_timeout_sec.
+        """
+        deadline = time.monotonic() + self.checkout_timeout_sec
+        with self._condition:
+            self._stats['checkouts'] += 1
+
+        while True:
+            conn = self._reserve(deadline)
+            if conn is None:
+                break # Slot reserved, open a new connection below
+
+            # Validate outside the lock so a slow ping does not block other threads
+            if self.health_check and not self._is_healthy(conn):
+                self._close_quietly(conn)
+                with self._condition:
+                    self._in_use -= 1
+                    self._stats['closed_unhealthy'] += 1
+                    self._condition.notify()
+                continue
+
+            with self._condition:
+                self._stats['reused'] += 1
+            return conn
+
+        try:
+            conn = self._connect()
+        except Exception:
+            with self._condition:
+                self._in_use -= 1
+                self._condition.notify()
+            raise
+
+        with self._condition:
+            self._stats['created'] += 1
+        return conn
+
+    def release(self, conn, discard: bool = False) -> None:
+        """
+        Returns a connection to the pool.
+
+        Any open transaction is rolled back so the next user starts from a
+        fresh snapshot. Broken connections, or ones flagged with discard=True,
+        are closed instead of being kept.
+        """
+        if conn is None:
+            return
+
+        if not discard:
+            try:
+                if conn.in_transaction:
+                    conn.rollback()
+            except Exception as e:
+                logger.warning(f"Could not reset pooled connection, discarding it: {e}")
+                discard = True
+
+        with self._condition:
+            self._in_use -= 1
+            if discard:
+                self._stats['discarded'] += 1
+            else:
+                self._idle.append((conn, time.monotonic()))
+            self._condition.notify()
+
+        if discard:
+            self._close_quietly(conn)
+
+    # --- Maintenance ---
+
+    def close_all(self) -> None:
+        """Closes every idle connection. Connections in use are closed when released."""
+        with self._condition:
+            idle = list(self._idle)
+            self._idle.clear()
+        for conn, _ in idle:
+            self._close_quietly(conn)
+        logger.info(f"Closed {len(idle)} idle pooled connections.")
+
+    def stats(self) -> dict:
+        """Returns a snapshot of pool counters plus current idle/in-use sizes."""
+        with self._condition:
+            snapshot = dict(self._stats)
+            snapshot['idle'] = len(self._idle)
+            snapshot['in_use'] = self._in_use
+            snapshot['pool_size'] = self.pool_size
+        return snapshot
+
+    # --- Internal Helpers ---
+
+    def _reserve(self, deadline: float):
+        """
+        Reserves a pool slot, waiting while the pool is exhausted.
+
+        Returns an idle connection (already counted as in use), or None when a
+        free slot was reserved and the caller must open a new connection.
+        """
+        expired = []
+        try:
+            with self._condition:
+                while True:
+                    now = time.monotonic()
+                    # Oldest idle connections sit on the left; drop the expired ones
+                    while self._idle and now - self._idle[0][1] > self.idle_timeout_sec:
+                        conn, _ = self._idle.popleft()
+                        self._stats['closed_idle'] += 1
+                        expired.append(conn)
+
+                    if self._idle:
+                        conn, _ = self._idle.pop()
+                        self._in_use += 1
+                        return conn
+
+                    if self._in_use < self.pool_size:
+                        self._in_use += 1
+                        return None
+
+                    remaining = deadline - now
+                    if remaining <= 0:
+                        raise TimeoutError(f"No database connection available after {self.checkout_timeout_sec}s "
+                                           f"(pool size {self.pool_size}).")
+                    self._stats['waits'] += 1
+                    self._condition.wait(remaining)
+        finally:
+            for conn in expired:
+                self._close_quietly(conn)
+
+    def _connect(self):
+        """Opens a brand new connection using config values."""
+        conn = mysql.connector.connect(
+            host=self.config.DB_HOST,
+            port=self.config.DB_PORT,
+            user=self.config.DB_USER,
+            password=self.config.DB_PASSWORD,
+            database=self.config.DB_NAME,
+            connection_timeout=self.config.DEFAULT_TIMEOUT_SEC
+        )
+        logger.info('Opened new pooled MySQL connection')
+        return conn
+
+    @staticmethod
+    def _is_healthy(conn) -> bool:
+        """Pings the server without reconnecting; False means the connection is dead."""
+        try:
+            conn.ping(reconnect=False)
+            return True
+        except Exception as e:
+            logger.debug(f"Pooled connection failed health check: {e}")
+            return False
+
+    @staticmethod
+    def _close_quietly(conn) -> None:
+        try:
+            conn.close()
+        except Exception as e:
+            logger.debug(f"Error while closing pooled connection: {e}")
@@ -1,46 +1,48 @@
 from database.execute_service import DBExecuteService as db
+from database.pagination import KeysetPaginator
+from database.summary.student_course_score import TABLE as SCORE_SUMMARY_TABLE
+
+def get_course_paginator(per_page: int) -> KeysetPaginator:
+  """Keyset paginator over the course catalogue, ordered by (code_module, code_presentation)."""
+  return KeysetPaginator(table='courses',
+                         key_columns=['code_module', 'code_presentation'],
+                         select_columns=['code_module', 'code_presentation', 'module_presentation_length'],
+                         page_size=per_page)
 
 def get_all_course():
-  data = db.fetch_all(query="""
-               select stu_info.id_student, courses.code_module, courses.code_presentation, avg(stu_assess.score) as avg_score from 
-              courses join assessments assess on courses.code_module = assess.code_module and courses.code_presentation = assess.code_presentation 
-              join studentAssessment stu_assess on assess.id_assessment = stu_assess.id_assessment
-              join studentInfo stu_info  on stu_info.id_student = stu_assess.id_student
-              group by  stu_info.id_student, courses.code_module, courses.code_presentation
+  data = db.fetch_all(query=f"""
+               select id_student, code_module, code_presentation, avg_score
+               from {SCORE_SUMMARY_TABLE}
                """)
   return data
 
 def get_n_highest_score_student(code_module: str, code_presentation: str, n:int):
-  data = db.fetch_all(query="""
-                      select id_student, courses.code_module, courses.code_presentation, AVG(score) as avg_student_score  from courses 
-                      join assessments on courses.code_module = assessments.code_module and courses.code_presentation = assessments.code_presentation
-                      join studentAssessment stu_assessment on stu_assessment.id_assessment = assessments.id_assessment
-                      WHERE assessments.code_module = %s and courses.code_presentation = %s
-                      group by stu_assessment.id_student
-                      ORDER BY avg_student_score DESC
+  data = db.fetch_all(query=f"""
+                      select id_student, code_module, code_presentation, avg_score as avg_student_score
+                      from {SCORE_SUMMARY_TABLE}
+                      WHERE code_module = %s and code_presentation = %s
+                      ORDER BY avg_score DESC
                       limit %s
 """, params=(code_module,code_presentation,n))
   return data
 def get_dropout_percentage(code_module: str, code_presentation: str):
   data= db.fetch_one(query="""
                      SELECT
-                    SUM(CASE WHEN date_unregistration IS NULL THEN 1 ELSE 0 END) * 100.0 / COUNT(*) AS Dropout,
-                    SUM(CASE WHEN date_unregistration IS NULL THEN 0 ELSE 1 END) * 100.0 / COUNT(*) AS Retention
+                    SUM(CASE WHEN date_unregistration IS NULL THEN 0 ELSE 1 END) * 100.0 / COUNT(*) AS Dropout,
+                    SUM(CASE WHEN date_unregistration IS NULL THEN 1 ELSE 0 END) * 100.0 / COUNT(*) AS Retention
                 FROM
-                    studentRegistration;
+                    studentRegistration
                     where code_module =%s and code_presentation = %s
 
                      """,params=(code_module,code_presentation))
   return data
 
 def get_student_score_statistic(code_module: str, code_presentation: str)-> dict:
-  data = db.fetch_one(query="""
+  data = db.fetch_one(query=f"""
                       WITH student_score AS (
-    SELECT AVG(score) as avg_score
-    FROM studentAssessment stu_assess 
-    JOIN assessments ON stu_assess.id_assessment = assessments.id_assessment
-    WHERE code_module =%s AND code_presentation = %s
-    GROUP BY id_student
+    SELECT avg_score
+    FROM {SCORE_SUMMARY_TABLE}
+    WHERE code_module =%s AND code_presentation = %s AND avg_score IS NOT NULL
 )
 SELECT 
     MIN(avg_score) as min_score,
@@ -56,4 +58,4 @@ SELECT
 FROM 
     student_score;
                       """, params=(code_module,code_presentation))
-  return data
\ No newline at end of file
+  return data
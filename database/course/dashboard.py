@@ -0,0 +1,225 @@
+from typing import Any, TypedDict
+
+from config.config import GLOBAL_CONFIG
+from database import column_types
+from database.connection_manager import DBConnectionManager
+from database.query_cache import QueryResultCache
+from database.student.student import ScoreHistogram, score_histogram_from_columns
+from database.summary.student_course_score import TABLE as SCORE_SUMMARY_TABLE
+from utils.logger import get_class_logger
+from utils.lru_cache import TTLLRUCache
+from utils.lazy_import import lazy_import
+
+np = lazy_import("numpy")
+
+logger = get_class_logger(__name__, "CourseDashboard")
+
+class CourseDashboard(TypedDict):
+  """Everything the course result page shows for one (code_module, code_presentation)."""
+  code_module: str
+  code_presentation: str
+  scores: dict[str, Any]    # 'id_student', 'avg_score' NumPy columns for every scored student, best first
+                            # (empty in bins mode)
+  score_histogram: ScoreHistogram | None # Scores binned by the database (bins mode only)
+  top_students: list[dict]  # id_student, avg_student_score of the top_n students
+  dropout: dict             # {'Dropout': %, 'Retention': %}, empty if nobody registered
+  statistics: dict          # min_score, max_score, mean_score, mode_score (None without scores)
+
+# One pass over the (code_module, code_presentation, avg_score) index of the summary;
+# top-N and min/max/mean/mode are all derived from this ordered result
+_COURSE_SCORES_QUERY = f"""
+  SELECT id_student, avg_score
+  FROM {SCORE_SUMMARY_TABLE}
+  WHERE code_module = %s AND code_presentation = %s AND avg_score IS NOT NULL
+  ORDER BY avg_score DESC, id_student
+"""
+# Bins mode: one statement returns the top-N rows, the histogram bins, min/max, the
+# mode and the registration counts as tagged rows (part, key, v1, v2, v3), so only
+# O(bins + top_n) rows leave the server in a single round-trip.
+_COURSE_WHERE = "code_module = %s AND code_presentation = %s"
+_BINNED_DASHBOARD_QUERY = f"""
+  (SELECT 'top' AS part, id_student AS k, avg_score AS v1, NULL AS v2, NULL AS v3
+   FROM {SCORE_SUMMARY_TABLE}
+   WHERE {_COURSE_WHERE} AND avg_score IS NOT NULL
+   ORDER BY avg_score DESC, id_student
+   LIMIT %s)
+  UNION ALL
+  (SELECT 'bin', FLOOR(avg_score / %s), COUNT(*), SUM(avg_score), SUM(avg_score * avg_score)
+   FROM {SCORE_SUMMARY_TABLE}
+   WHERE {_COURSE_WHERE} AND avg_score IS NOT NULL
+   GROUP BY 2)
+  UNION ALL
+  (SELECT 'range', NULL, MIN(avg_score), MAX(avg_score), NULL
+   FROM {SCORE_SUMMARY_TABLE}
+   WHERE {_COURSE_WHERE})
+  UNION ALL
+  (SELECT 'mode', NULL, avg_score, NULL, NULL
+   FROM {SCORE_SUMMARY_TABLE}
+   WHERE {_COURSE_WHERE} AND avg_score IS NOT NULL
+   GROUP BY avg_score
+   ORDER BY COUNT(*) DESC, avg_score
+   LIMIT 1)
+  UNION ALL
+  (SELECT 'registration', NULL, COUNT(*), COUNT(date_unregistration), NULL
+   FROM studentRegistration
+   WHERE {_COURSE_WHERE})
+"""
+_REGISTRATION_QUERY = """
+  SELECT COUNT(*) AS registered, COUNT(date_unregistration) AS unregistered
+  FROM studentRegistration
+  WHERE code_module = %s AND code_presentation = %s
+"""
+
+# Recently viewed dashboards, keyed by (code_module, code_presentation, top_n, bin_width)
+_dashboard_cache = TTLLRUCache(max_entries=GLOBAL_CONFIG.DASHBOARD_CACHE_SIZE,
+                               default_ttl_sec=GLOBAL_CONFIG.DASHBOARD_CACHE_TTL_SEC)
+_SOURCE_TABLES = frozenset({SCORE_SUMMARY_TABLE.lower(), "studentregistration"})
+
+def _on_tables_written(tables: frozenset[str] | None) -> None:
+  if tables is None or tables & _SOURCE_TABLES:
+    _dashboard_cache.clear()
+
+QueryResultCache.add_invalidation_listener(_on_tables_written)
+
+def get_course_dashboard(code_module: str, code_presentation: str, top_n: int = 5,
+                         use_cache: bool = True, bin_width: float | None = None) -> CourseDashboard | None:
+  """
+  Loads the whole course dashboard over a single pooled connection.
+
+  Args:
+    code_module: Module code, e.g. 'AAA'.
+    code_presentation: Presentation code, e.g. '2013J'.
+    top_n: Number of best students returned in top_students.
+    use_cache: Serve (and store) the dashboard from the per-course LRU cache.
+    bin_width: Bins mode: return score_histogram binned at this width instead of every
+               score (default SCORE_HISTOGRAM_BIN_WIDTH; 0 returns the raw scores).
+
+  Returns:
+    The dashboard, or None if the database could not be queried.
+  """
+  bin_width = _resolve_bin_width(bin_width)
+  if use_cache:
+    cached = get_cached_course_dashboard(code_module, code_presentation, top_n, bin_width)
+    if cached is not None:
+      return cached
+  generation = QueryResultCache.generation()
+  if bin_width:
+    dashboard = _load_binned_dashboard(code_module, code_presentation, top_n, bin_width)
+  else:
+    dashboard = _load_dashboard(code_module, code_presentation, top_n)
+  if dashboard is not None and use_cache and generation == QueryResultCache.generation(): # Skip if a write raced the load
+    _dashboard_cache.set((code_module, code_presentation, top_n, bin_width), dashboard)
+  return dashboard
+
+def _load_dashboard(code_module: str, code_presentation: str, top_n: int) -> CourseDashboard | None:
+  """Raw mode: every score of the course, with the statistics computed here."""
+  try:
+    with DBConnectionManager(commit_on_success=False) as conn:
+      params = (code_module, code_presentation)
+      description, rows = conn.fetch_raw(_COURSE_SCORES_QUERY, params)
+      registration = conn.fetch_one(_REGISTRATION_QUERY, params)
+    scores = column_types.rows_to_columns(rows, description)
+  except Exception as e:
+    logger.error(f"Failed to load dashboard for {code_module}/{code_presentation}: {e}", exc_info=True)
+    return None
+
+  logger.debug(f"Loaded dashboard for {code_module}/{code_presentation}: {len(rows)} scored students.")
+  dashboard = CourseDashboard(
+    code_module=code_module,
+    code_presentation=code_presentation,
+    scores=scores,
+    score_histogram=None,
+    top_students=_top_students(scores, top_n),
+    dropout=_dropout_rates(registration),
+    statistics=_score_statistics(scores['avg_score']),
+  )
+  return dashboard
+
+def _load_binned_dashboard(code_module: str, code_presentation: str, top_n: int,
+                           bin_width: float) -> CourseDashboard | None:
+  """Bins mode: the database bins and aggregates in one statement, so the transfer is O(bins + top_n)."""
+  course = (code_module, code_presentation)
+  params = course + (top_n,) + (bin_width,) + course + course + course + course
+  try:
+    with DBConnectionManager(commit_on_success=False) as conn:
+      _, rows = conn.fetch_raw(_BINNED_DASHBOARD_QUERY, params)
+  except Exception as e:
+    logger.error(f"Failed to load binned dashboard for {code_module}/{code_presentation}: {e}", exc_info=True)
+    return None
+
+  parts: dict[str, list[tuple]] = {'top': [], 'bin': [], 'range': [], 'mode': [], 'registration': []}
+  for part, key, v1, v2, v3 in rows:
+    parts[part].append((key, v1, v2, v3))
+  # UNION ALL does not keep the order of its parts; restore best-first and ascending bins here
+  top_rows = sorted(parts['top'], key=lambda row: (-float(row[1]), int(row[0])))
+  top = {'id_student': np.array([int(row[0]) for row in top_rows], dtype=np.int64),
+         'avg_score': np.array([float(row[1]) for row in top_rows], dtype=np.float64)}
+  bin_rows = sorted(parts['bin'], key=lambda row: int(row[0]))
+  histogram = score_histogram_from_columns({
+    'bin': np.array([int(row[0]) for row in bin_rows], dtype=np.int64),
+    'n': np.array([int(row[1]) for row in bin_rows], dtype=np.int64),
+    'score_sum': np.array([float(row[2]) for row in bin_rows], dtype=np.float64),
+    'score_sq_sum': np.array([float(row[3]) for row in bin_rows], dtype=np.float64),
+  }, bin_width)
+  _, registered, unregistered, _ = parts['registration'][0] if parts['registration'] else (None, 0, 0, None)
+
+  logger.debug(f"Loaded binned dashboard for {code_module}/{code_presentation}: "
+               f"{histogram['count']} scored students in {len(histogram['bins'])} bins.")
+  if histogram['count'] == 0:
+    statistics = _score_statistics(np.empty(0))
+  else:
+    _, min_score, max_score, _ = parts['range'][0]
+    statistics = {
+      'min_score': float(min_score),
+      'max_score': float(max_score),
+      'mean_score': round(histogram['mean'], 4),
+      'mode_score': float(parts['mode'][0][1]),
+    }
+  return CourseDashboard(
+    code_module=code_module,
+    code_presentation=code_presentation,
+    scores={},
+    score_histogram=histogram,
+    top_students=_top_students(top, top_n),
+    dropout=_dropout_rates({'registered': registered, 'unregistered': unregistered}),
+    statistics=statistics,
+  )
+
+def get_cached_course_dashboard(code_module: str, code_presentation: str, top_n: int = 5,
+                                bin_width: float | None = None) -> CourseDashboard | None:
+  """Returns the cached dashboard without touching the database (safe on the GUI thread)."""
+  return _dashboard_cache.get((code_module, code_presentation, top_n, _resolve_bin_width(bin_width)))
+
+def invalidate_course_dashboards() -> None:
+  """Drops every cached dashboard, e.g. after data was changed outside DBExecuteService."""
+  _dashboard_cache.clear()
+
+def dashboard_cache_stats() -> dict:
+  return _dashboard_cache.stats()
+
+def _resolve_bin_width(bin_width: float | None) -> float:
+  return float(GLOBAL_CONFIG.SCORE_HISTOGRAM_BIN_WIDTH if bin_width is None else bin_width)
+
+def _top_students(scores: dict[str, Any], top_n: int) -> list[dict]:
+  return [{'id_student': int(id_student), 'avg_student_score': float(score)}
+          for id_student, score in zip(scores['id_student'][:top_n], scores['avg_score'][:top_n])]
+
+def _score_statistics(values) -> dict:
+  """min/max/mean/mode of a score array; ties for the mode go to the lowest score."""
+  if len(values) == 0:
+    return {'min_score': None, 'max_score': None, 'mean_score': None, 'mode_score': None}
+  unique, counts = np.unique(values, return_counts=True) # unique is ascending, argmax takes the first
+  return {
+    'min_score': float(unique[0]),
+    'max_score': float(unique[-1]),
+    'mean_score': round(float(values.mean()), 4),
+    'mode_score': float(unique[counts.argmax()]),
+  }
+
+def _dropout_rates(registration: dict | None) -> dict:
+  """Percentages of registered students who unregistered (dropout) or stayed (retention)."""
+  registered = int(registration['registered']) if registration else 0
+  if registered == 0:
+    return {}
+  dropout = int(registration['unregistered']) * 100.0 / registered
+  return {'Dropout': dropout, 'Retention': 100.0 - dropout}
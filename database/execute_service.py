@@ -1,41 +1,142 @@
 # database/crud.py
+from contextlib import closing
+from typing import Any, Iterator
+
 from database.connection_manager import DBConnectionManager
+from database.connection_pool import DBConnectionPool
+from database.query_cache import QueryResultCache
+from config.config import GLOBAL_CONFIG
+from database import column_types
 from utils.logger import get_class_logger
 
 logger = get_class_logger(__name__, "DBExecuteService")
 
+_CACHE_MISS = object()
+
 class DBExecuteService:
     """
     A service class that executes custom SQL queries, handling
     connection management, transaction commitment, and data retrieval.
+    All calls share the process-wide connection pool, so repeated queries
+    reuse warm connections instead of reconnecting.
+
+    Read results are cached (see QueryResultCache) for cache_ttl seconds,
+    and any write through execute_query/execute_many invalidates the cached
+    reads of the tables it touches.
     """
 
     @staticmethod
-    def fetch_one(query: str, params: tuple = None) -> dict | None:
-        """Executes a query and returns a single row as a dictionary."""
+    def fetch_one(query: str, params: tuple = None, cache_ttl: float | None = None) -> dict | None:
+        """
+        Executes a query and returns a single row as a dictionary.
+
+        Args:
+            cache_ttl: Seconds the result may be served from the cache
+                       (None = QUERY_CACHE_TTL_SEC, 0 = always hit the database).
+        """
+        ttl = GLOBAL_CONFIG.QUERY_CACHE_TTL_SEC if cache_ttl is None else cache_ttl
+        if ttl > 0:
+            key = QueryResultCache.make_key(query, params, 'one')
+            cached = QueryResultCache.get(key, _CACHE_MISS)
+            if cached is not _CACHE_MISS:
+                logger.debug("Served fetch_one query from cache.")
+                return dict(cached) if cached is not None else None
+            generation = QueryResultCache.generation()
         try:
             # READ operation - commit_on_success=False
             with DBConnectionManager(commit_on_success=False) as db:
                 result = db.fetch_one(query, params)
                 logger.debug(f"Executed fetch_one query. Result found: {result is not None}")
-                return result
         except Exception as e:
             logger.error(f"Failed to fetch single record with query: {query}", exc_info=True)
             return None
 
+        if ttl > 0:
+            QueryResultCache.set(key, result, ttl, generation)
+            return dict(result) if result is not None else None
+        return result
+
     @staticmethod
-    def fetch_all(query: str, params: tuple = None) -> list[dict]:
-        """Executes a query and returns all rows as a list of dictionaries."""
+    def fetch_all(query: str, params: tuple = None, cache_ttl: float | None = None) -> list[dict]:
+        """
+        Executes a query and returns all rows as a list of dictionaries.
+
+        Args:
+            cache_ttl: Seconds the result may be served from the cache
+                       (None = QUERY_CACHE_TTL_SEC, 0 = always hit the database).
+        """
+        ttl = GLOBAL_CONFIG.QUERY_CACHE_TTL_SEC if cache_ttl is None else cache_ttl
+        if ttl > 0:
+            key = QueryResultCache.make_key(query, params, 'all')
+            cached = QueryResultCache.get(key, _CACHE_MISS)
+            if cached is not _CACHE_MISS:
+                logger.debug(f"Served fetch_all query from cache. Rows returned: {len(cached)}")
+                return [dict(row) for row in cached] # Callers may mutate their rows
+            generation = QueryResultCache.generation()
         try:
             # READ operation - commit_on_success=False
             with DBConnectionManager(commit_on_success=False) as db:
                 results = db.fetch_all(query, params)
                 logger.debug(f"Executed fetch_all query. Rows returned: {len(results)}")
-                return results
         except Exception as e:
             logger.error(f"Failed to fetch all records with query: {query}", exc_info=True)
             return []
 
+        if ttl > 0:
+            QueryResultCache.set(key, results, ttl, generation)
+            return [dict(row) for row in results]
+        return results
+
+    @staticmethod
+    def fetch_columns(query: str, params: tuple = None, cache_ttl: float | None = None) -> dict[str, Any]:
+        """
+        Executes a query and returns the result column-wise as typed NumPy arrays.
+
+        Arrays are built straight from the raw cursor tuples with dtypes taken
+        from the cursor description (see database.column_types), so no dict
+        is created per row.
+
+        Args:
+            cache_ttl: Seconds the result may be served from the cache
+                       (None = QUERY_CACHE_TTL_SEC, 0 = always hit the database).
+
+        Returns:
+            {column name: array} in select order; empty dict on failure.
+        """
+        ttl = GLOBAL_CONFIG.QUERY_CACHE_TTL_SEC if cache_ttl is None else cache_ttl
+        if ttl > 0:
+            key = QueryResultCache.make_key(query, params, 'columns')
+            cached = QueryResultCache.get(key, _CACHE_MISS)
+            if cached is not _CACHE_MISS:
+                logger.debug("Served fetch_columns query from cache.")
+                return {name: values.copy() for name, values in cached.items()}
+            generation = QueryResultCache.generation()
+        try:
+            # READ operation - commit_on_success=False
+            with DBConnectionManager(commit_on_success=False) as db:
+                description, rows = db.fetch_raw(query, params)
+            columns = column_types.rows_to_columns(rows, description)
+            logger.debug(f"Executed fetch_columns query. Rows returned: {len(rows)}")
+        except Exception as e:
+            logger.error(f"Failed to fetch columns with query: {query}", exc_info=True)
+            return {}
+
+        if ttl > 0:
+            QueryResultCache.set(key, columns, ttl, generation)
+            return {name: values.copy() for name, values in columns.items()}
+        return columns
+
+    @staticmethod
+    def fetch_frame(query: str, params: tuple = None, cache_ttl: float | None = None) -> Any:
+        """
+        Executes a query and returns a pandas DataFrame built from fetch_columns().
+
+        Returns:
+            The DataFrame (empty on failure).
+        """
+        import pandas as pd # Only callers that want a DataFrame pay for pandas
+        return pd.DataFrame(DBExecuteService.fetch_columns(query, params, cache_ttl), copy=False)
+
     @staticmethod
     def execute_query(query: str, params: tuple = None, return_id: bool = False) -> int | bool:
         """
@@ -66,4 +167,96 @@ class DBExecuteService:
                 
         except Exception as e:
             logger.error(f"Failed to execute query: {query}. Transaction rolled back.", exc_info=True)
-            return False
\ No newline at end of file
+            return False
+        finally:
+            QueryResultCache.invalidate_for_write(query)
+
+    @staticmethod
+    def execute_many(query: str, params_seq: list[tuple], batch_size: int | None = None) -> int | bool:
+        """
+        Executes one write statement for many parameter tuples, batch_size tuples per transaction.
+
+        For INSERT statements mysql.connector rewrites each batch into a single
+        multi-row VALUES statement, so a bulk upsert costs one round trip per
+        batch. All batches run on one pooled connection and each batch is
+        committed on its own, which keeps transactions (and lock times) short.
+
+        Args:
+            query (str): The SQL statement with %s placeholders.
+            params_seq (list[tuple]): One parameter tuple per row.
+            batch_size (int | None): Tuples per statement/transaction (default DB_BULK_BATCH_SIZE).
+
+        Returns:
+            The number of affected rows, or False if a batch failed. The failed
+            batch is rolled back; batches before it stay committed.
+        """
+        if not params_seq:
+            return 0
+        batch_size = batch_size or GLOBAL_CONFIG.DB_BULK_BATCH_SIZE
+        row_count = 0
+        committed = 0
+        try:
+            with DBConnectionManager() as db:
+                for start in range(0, len(params_seq), batch_size):
+                    batch = params_seq[start:start + batch_size]
+                    db.cursor.executemany(query, batch)
+                    row_count += max(db.cursor.rowcount, 0)
+                    db.commit()
+                    committed += len(batch)
+                logger.info(f"Executed {len(params_seq)} parameter sets in batches of {batch_size}. Rows affected: {row_count}")
+                return row_count
+        except Exception as e:
+            logger.error(f"Failed to execute batch query after {committed}/{len(params_seq)} parameter sets: {query}. "
+                         "Current batch rolled back.", exc_info=True)
+            return False
+        finally:
+            QueryResultCache.invalidate_for_write(query)
+
+    @staticmethod
+    def stream(query: str, params: tuple = None, chunk_size: int | None = None,
+               as_numpy: bool = False) -> Iterator[list[tuple] | Any]:
+        """
+        Streams a large result in fixed-size chunks with constant memory.
+
+        Rows are read from an unbuffered cursor, chunk_size at a time, and are
+        never cached. The pooled connection is held until the generator is
+        exhausted or closed (close it, or use contextlib.closing, when
+        stopping early).
+
+        Args:
+            chunk_size: Rows per chunk (default STREAM_CHUNK_SIZE).
+            as_numpy: Yield NumPy record arrays with typed columns instead of lists of tuples.
+
+        Yields:
+            Lists of row tuples, or record arrays when as_numpy is True.
+
+        Raises:
+            Any database error. Unlike the other methods this does not return
+            an empty result, since a silently truncated stream looks like a
+            complete one.
+        """
+        chunk_size = chunk_size or GLOBAL_CONFIG.STREAM_CHUNK_SIZE
+        total = 0
+        try:
+            with DBConnectionManager(commit_on_success=False) as db:
+                with closing(db.stream(query, params, chunk_size)) as chunks: # Closed before the connection is released
+                    for description, rows in chunks:
+                        total += len(rows)
+                        yield column_types.rows_to_records(rows, description) if as_numpy else rows
+            logger.debug(f"Streamed {total} rows in chunks of {chunk_size}.")
+        except GeneratorExit:
+            logger.debug(f"Stream closed by the consumer after {total} rows.")
+            raise
+        except Exception:
+            logger.error(f"Failed while streaming query after {total} rows: {query}", exc_info=True)
+            raise
+
+    @staticmethod
+    def pool_stats() -> dict:
+        """Returns usage counters of the shared connection pool (created, reused, idle, in_use, ...)."""
+        return DBConnectionPool.get_instance().stats()
+
+    @staticmethod
+    def cache_stats() -> dict:
+        """Returns hit/miss/eviction counters of the query result cache."""
+        return QueryResultCache.stats()
@@ -0,0 +1,118 @@
+# database/pagination.py
+import threading
+import time
+
+from database.execute_service import DBExecuteService
+from utils.logger import get_class_logger
+
+logger = get_class_logger(__name__, "KeysetPaginator")
+
+class KeysetPaginator:
+    """
+    Server-side keyset (seek) pagination over a single table.
+
+    Pages are fetched with "WHERE (keys) > (last key of previous page)
+    ORDER BY keys LIMIT page_size", so each page reads only page_size rows
+    through the key index no matter how deep the page is. The last key of
+    every visited page and the total row count are cached, so moving
+    back and forth costs one small query per page.
+    """
+    def __init__(self, table: str, key_columns: list[str], select_columns: list[str],
+                 page_size: int, count_ttl_sec: float = 300):
+        """
+        Args:
+            table: Table to page through (trusted identifier, not user input).
+            key_columns: Unique, indexed ordering columns, e.g. the primary key.
+            select_columns: Columns returned for each row (must include key_columns).
+            page_size: Rows per page.
+            count_ttl_sec: How long the cached total row count stays valid.
+        """
+        missing = [col for col in key_columns if col not in select_columns]
+        if missing:
+            raise ValueError(f"select_columns must include the key columns {missing}.")
+        self.table = table
+        self.key_columns = list(key_columns)
+        self.select_columns = list(select_columns)
+        self.page_size = page_size
+        self.count_ttl_sec = count_ttl_sec
+
+        self._lock = threading.Lock()
+        self._total_count: int | None = None
+        self._counted_at = 0.0
+        self._last_keys: dict[int, tuple] = {} # page number -> key of its last row
+
+    # --- Public API ---
+
+    def total_count(self, refresh: bool = False) -> int:
+        """Returns the number of rows in the table, cached for count_ttl_sec."""
+        with self._lock:
+            expired = time.monotonic() - self._counted_at > self.count_ttl_sec
+            if self._total_count is None or expired or refresh:
+                row = DBExecuteService.fetch_one(f"SELECT COUNT(*) AS total FROM {self.table}",
+                                                 cache_ttl=0 if refresh else None)
+                self._total_count = int(row['total']) if row else 0
+                self._counted_at = time.monotonic()
+                logger.debug(f"Counted {self._total_count} rows in {self.table}.")
+            return self._total_count
+
+    def total_pages(self) -> int:
+        return max(1, (self.total_count() + self.page_size - 1) // self.page_size)
+
+    def fetch_page(self, page: int) -> list[dict]:
+        """
+        Fetches one page (1-based) with a seek query.
+
+        Args:
+            page: Page number; values below 1 are treated as 1.
+
+        Returns:
+            Up to page_size rows as dictionaries.
+        """
+        page = max(1, page)
+        with self._lock:
+            after_key = self._after_key_for(page)
+            if page > 1 and after_key is None:
+                return [] # Page is past the end of the table
+
+            order_by = ", ".join(self.key_columns)
+            query = f"SELECT {', '.join(self.select_columns)} FROM {self.table}"
+            params: tuple = ()
+            if after_key is not None:
+                query += f" WHERE ({order_by}) > ({', '.join(['%s'] * len(self.key_columns))})"
+                params = after_key
+            query += f" ORDER BY {order_by} LIMIT %s"
+
+            rows = DBExecuteService.fetch_all(query, params + (self.page_size,))
+            if rows:
+                self._last_keys[page] = self._key_of(rows[-1])
+            logger.debug(f"Fetched page {page} of {self.table}: {len(rows)} rows.")
+            return rows
+
+    def invalidate(self) -> None:
+        """Forgets the cached count and page boundaries (call after inserts/deletes)."""
+        with self._lock:
+            self._total_count = None
+            self._last_keys.clear()
+
+    # --- Internal Helpers ---
+
+    def _key_of(self, row: dict) -> tuple:
+        return tuple(row[col] for col in self.key_columns)
+
+    def _after_key_for(self, page: int) -> tuple | None:
+        """Key of the last row before the given page. Caller holds the lock."""
+        if page == 1:
+            return None
+        if page - 1 in self._last_keys:
+            return self._last_keys[page - 1]
+
+        # Jumping to a page never visited: read just the boundary key from the index
+        order_by = ", ".join(self.key_columns)
+        row = DBExecuteService.fetch_one(
+            f"SELECT {order_by} FROM {self.table} ORDER BY {order_by} LIMIT 1 OFFSET %s",
+            ((page - 1) * self.page_size - 1,)
+        )
+        if row is None:
+            return None
+        self._last_keys[page - 1] = self._key_of(row)
+        return self._last_keys[page - 1]
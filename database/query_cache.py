@@ -0,0 +1,148 @@
+# database/query_cache.py
+import re
+import sys
+import threading
+from typing import Any, Callable
+
+from config.config import GLOBAL_CONFIG
+from utils.lru_cache import TTLLRUCache
+from utils.logger import get_class_logger
+
+logger = get_class_logger(__name__, "QueryResultCache")
+
+# Tables read by a query
+_READ_TABLE_PATTERN = re.compile(r"\b(?:FROM|JOIN)\s+`?(\w+)`?", re.IGNORECASE)
+# Tables written by a statement
+_WRITE_TABLE_PATTERN = re.compile(
+    r"\b(?:INSERT\s+(?:IGNORE\s+)?INTO|REPLACE\s+INTO|UPDATE|DELETE\s+FROM|FROM|JOIN|"
+    r"TRUNCATE(?:\s+TABLE)?|(?:ALTER|DROP|CREATE)\s+TABLE(?:\s+IF\s+(?:NOT\s+)?EXISTS)?)\s+`?(\w+)`?",
+    re.IGNORECASE
+)
+_WHITESPACE = re.compile(r"\s+")
+# Rows measured to estimate the memory of a result
+_SIZE_SAMPLE_ROWS = 20
+
+
+class QueryResultCache:
+    """
+    Process-wide cache of read query results used by DBExecuteService.
+
+    Entries are keyed by normalized SQL + params, expire after a per-query TTL
+    and are evicted LRU once the entry or memory budget is exceeded. Every
+    write through DBExecuteService invalidates the cached reads of the tables
+    it touches (plus tables registered as derived from them).
+    """
+    _cache = TTLLRUCache(
+        max_entries=GLOBAL_CONFIG.QUERY_CACHE_MAX_ENTRIES,
+        default_ttl_sec=GLOBAL_CONFIG.QUERY_CACHE_TTL_SEC,
+        max_bytes=int(GLOBAL_CONFIG.QUERY_CACHE_MAX_MB * 1024 * 1024),
+        size_of=lambda value: QueryResultCache._estimate_size(value)
+    )
+    # base table -> tables whose content changes with it (e.g. trigger-maintained summaries)
+    _dependents: dict[str, set[str]] = {}
+    # Bumped by every write, so a read that raced with a write is not cached
+    _generation = 0
+    # Makes the generation bump + invalidation and set()'s check + store atomic with each other
+    _lock = threading.Lock()
+    # Callbacks told which tables a write touched (None = unknown, assume all)
+    _listeners: list[Callable[[frozenset[str] | None], None]] = []
+
+    @staticmethod
+    def make_key(query: str, params: Any, kind: str) -> tuple:
+        """Builds the cache key; kind separates fetch_one from fetch_all results."""
+        normalized = _WHITESPACE.sub(" ", query).strip().rstrip(";").strip()
+        tables = frozenset(name.lower() for name in _READ_TABLE_PATTERN.findall(normalized))
+        try:
+            params_key = tuple(params) if params is not None else ()
+            hash(params_key)
+        except TypeError:
+            params_key = repr(params)
+        return (kind, normalized, params_key, tables)
+
+    @classmethod
+    def get(cls, key: tuple, default: Any = None) -> Any:
+        return cls._cache.get(key, default)
+
+    @classmethod
+    def generation(cls) -> int:
+        """Write counter; read it before running a query and pass it to set()."""
+        return cls._generation
+
+    @classmethod
+    def set(cls, key: tuple, value: Any, ttl_sec: float | None = None, generation: int | None = None) -> None:
+        """Stores a result unless a write happened since `generation` was read."""
+        with cls._lock:
+            if generation is not None and generation != cls._generation:
+                return
+            cls._cache.set(key, value, ttl_sec)
+
+    @classmethod
+    def add_dependency(cls, base_table: str, derived_table: str) -> None:
+        """Declares that writes to base_table also change derived_table."""
+        cls._dependents.setdefault(base_table.lower(), set()).add(derived_table.lower())
+
+    @classmethod
+    def add_invalidation_listener(cls, callback: Callable[[frozenset[str] | None], None]) -> None:
+        """
+        Registers a callback run after every write, so caches built on top of
+        query results (e.g. computed dashboards) can drop what became stale.
+        It receives the lowercased affected tables, or None if unknown.
+        """
+        cls._listeners.append(callback)
+
+    @classmethod
+    def invalidate_for_write(cls, query: str) -> int:
+        """Drops cached reads of every table the write statement touches."""
+        tables = {name.lower() for name in _WRITE_TABLE_PATTERN.findall(query)}
+        if not tables:
+            # Unknown statement shape (e.g. trigger DDL): be safe and drop everything
+            with cls._lock:
+                cls._generation += 1
+                removed = len(cls._cache)
+                cls._cache.clear()
+            cls._notify(None)
+            return removed
+
+        pending = list(tables)
+        while pending:
+            for derived in cls._dependents.get(pending.pop(), ()):
+                if derived not in tables:
+                    tables.add(derived)
+                    pending.append(derived)
+
+        with cls._lock: # Listeners run outside the lock; they may read the cache again
+            cls._generation += 1
+            removed = cls._cache.invalidate_where(lambda key: bool(key[3] & tables))
+        if removed:
+            logger.debug(f"Invalidated {removed} cached result(s) for tables {sorted(tables)}.")
+        cls._notify(frozenset(tables))
+        return removed
+
+    @classmethod
+    def clear(cls) -> None:
+        cls._cache.clear()
+
+    @classmethod
+    def stats(cls) -> dict:
+        return cls._cache.stats()
+
+    @classmethod
+    def _notify(cls, tables: frozenset[str] | None) -> None:
+        for callback in cls._listeners:
+            try:
+                callback(tables)
+            except Exception as e:
+                logger.error(f"Invalidation listener {callback!r} failed: {e}", exc_info=True)
+
+    @staticmethod
+    def _estimate_size(value: Any) -> int:
+        """Rough memory estimate of a row dict or a list of row dicts, from a sample of rows."""
+        if isinstance(value, dict) and all(hasattr(v, 'nbytes') for v in value.values()):
+            return sum(int(v.nbytes) for v in value.values()) # Columnar result (fetch_columns)
+        rows = value if isinstance(value, list) else [value]
+        if not rows or rows[0] is None:
+            return sys.getsizeof(value)
+        sample = rows[:_SIZE_SAMPLE_ROWS]
+        per_row = sum(sys.getsizeof(row) + sum(sys.getsizeof(v) for v in (row.values() if isinstance(row, dict) else row))
+                      for row in sample) / len(sample)
+        return int(sys.getsizeof(rows) + per_row * len(rows))
@@ -1,24 +1,87 @@
+from typing import Any, TypedDict
+
+from config.config import GLOBAL_CONFIG
 from database.execute_service import DBExecuteService as db
+from database.summary.student_course_score import TABLE as SCORE_SUMMARY_TABLE
+from utils.lazy_import import lazy_import
+
+np = lazy_import("numpy")
+
+class ScoreHistogram(TypedDict):
+  """avg_score distribution pre-binned by the database: O(bins) to transfer and draw."""
+  bin_width: float
+  bins: Any       # Index of every non-empty bin (bin i covers [i * bin_width, (i + 1) * bin_width)), ascending
+  counts: Any     # Students per bin
+  count: int      # Students in total
+  mean: float     # Exact, from the per-bin sums (NaN without scores)
+  variance: float # Exact sample variance, from the per-bin sums of squares (NaN below 2 scores)
+
+# Per-bin count, sum and sum of squares: exact mean/variance without shipping the scores
+SCORE_HISTOGRAM_QUERY = f"""
+  select floor(avg_score / %s) as bin, count(*) as n,
+         sum(avg_score) as score_sum, sum(avg_score * avg_score) as score_sq_sum
+  from {SCORE_SUMMARY_TABLE}
+  where avg_score is not null{{course_filter}}
+  group by bin
+  order by bin
+"""
+COURSE_FILTER = " and code_module = %s and code_presentation = %s"
 
 def get_student_score_per_course():
-  data = db.fetch_all(query="""
-               select stu_info.id_student, courses.code_module, courses.code_presentation, avg(stu_assess.score) as avg_score from 
-              courses join assessments assess on courses.code_module = assess.code_module and courses.code_presentation = assess.code_presentation 
-              join studentAssessment stu_assess on assess.id_assessment = stu_assess.id_assessment
-              join studentInfo stu_info  on stu_info.id_student = stu_assess.id_student
-              group by  stu_info.id_student, courses.code_module, courses.code_presentation
+  data = db.fetch_all(query=f"""
+               select id_student, code_module, code_presentation, avg_score
+               from {SCORE_SUMMARY_TABLE}
                """)
   return data
 
 def get_top_5_highest_score_student():
-  data = db.fetch_all(query="""
-                      select stu_info.id_student, courses.code_module, courses.code_presentation, avg(stu_assess.score) as avg_score from 
-
-  courses join assessments assess on courses.code_module = assess.code_module and courses.code_presentation = assess.code_presentation 
-  join studentAssessment stu_assess on assess.id_assessment = stu_assess.id_assessment
-  join studentInfo stu_info  on stu_info.id_student = stu_assess.id_student
-  group by  stu_info.id_student, courses.code_module, courses.code_presentation
+  data = db.fetch_all(query=f"""
+                      select id_student, code_module, code_presentation, avg_score
+                      from {SCORE_SUMMARY_TABLE}
   ORDER by avg_score DESC
   limit 5""")
   return data
 
+def get_student_score_columns():
+  """avg_score of every student in every course, as NumPy columns (no per-row dicts)."""
+  return db.fetch_columns(query=f"""
+               select id_student, avg_score
+               from {SCORE_SUMMARY_TABLE}
+               where avg_score is not null
+               """)
+
+def get_student_score_histogram(bin_width: float | None = None, code_module: str | None = None,
+                                code_presentation: str | None = None) -> ScoreHistogram | None:
+  """
+  avg_score histogram computed with FLOOR(avg_score / bin_width) ... GROUP BY.
+
+  Args:
+    bin_width: Width of a bin in score points (default SCORE_HISTOGRAM_BIN_WIDTH).
+    code_module, code_presentation: Restrict to one course (both required), else every course.
+
+  Returns:
+    The histogram, or None if the query failed.
+  """
+  bin_width = float(bin_width or GLOBAL_CONFIG.SCORE_HISTOGRAM_BIN_WIDTH)
+  if bin_width <= 0:
+    raise ValueError(f"bin_width must be positive, got {bin_width}")
+  if code_module and code_presentation:
+    query = SCORE_HISTOGRAM_QUERY.format(course_filter=COURSE_FILTER)
+    params = (bin_width, code_module, code_presentation)
+  else:
+    query = SCORE_HISTOGRAM_QUERY.format(course_filter="")
+    params = (bin_width,)
+  columns = db.fetch_columns(query, params)
+  if not columns:
+    return None
+  return score_histogram_from_columns(columns, bin_width)
+
+def score_histogram_from_columns(columns: dict[str, Any], bin_width: float) -> ScoreHistogram:
+  """Builds the histogram from the bin/n/score_sum/score_sq_sum columns of SCORE_HISTOGRAM_QUERY."""
+  counts = columns['n'].astype(np.int64)
+  count = int(counts.sum())
+  total = float(columns['score_sum'].sum())
+  mean = total / count if count else float('nan')
+  variance = (float(columns['score_sq_sum'].sum()) - total * mean) / (count - 1) if count > 1 else float('nan')
+  return ScoreHistogram(bin_width=bin_width, bins=columns['bin'].astype(np.int64), counts=counts,
+                        count=count, mean=mean, variance=max(variance, 0.0) if count > 1 else variance)
@@ -0,0 +1,212 @@
+"""
+Maintained per-student-per-course score summary (studentCourseScore).
+
+One row per (id_student, code_module, code_presentation) holding the sum and
+count of the student's assessment scores, with avg_score as a stored generated
+column. Triggers on studentAssessment apply every insert/update/delete as a
+delta, so dashboard queries read indexed rows instead of re-aggregating the
+four-way join.
+
+Both entry points (main.py, GUI.py) run ensure_student_course_score() on the
+thread pool at startup (ensure_student_course_score_async), which creates and
+fills the table and installs the triggers on a database that does not have
+them yet. To set up or repair by hand:
+
+    python -m database.summary.student_course_score [--rebuild]
+
+--rebuild recreates every trigger and recomputes every row.
+"""
+from database.connection_manager import DBConnectionManager
+from database.execute_service import DBExecuteService as db
+from database.query_cache import QueryResultCache
+from utils.logger import get_class_logger
+
+logger = get_class_logger(__name__, "StudentCourseScore")
+
+TABLE = "studentCourseScore"
+# The triggers below rewrite the summary on every studentAssessment write
+QueryResultCache.add_dependency("studentAssessment", TABLE)
+
+CREATE_TABLE_QUERY = f"""
+  CREATE TABLE IF NOT EXISTS {TABLE} (
+    id_student INT NOT NULL,
+    code_module VARCHAR(45) NOT NULL,
+    code_presentation VARCHAR(45) NOT NULL,
+    score_sum DECIMAL(14,4) NOT NULL DEFAULT 0,
+    score_count INT NOT NULL DEFAULT 0,
+    avg_score DECIMAL(10,4) GENERATED ALWAYS AS (ROUND(score_sum / NULLIF(score_count, 0), 4)) STORED,
+    PRIMARY KEY (id_student, code_module, code_presentation),
+    INDEX idx_course_avg_score (code_module, code_presentation, avg_score)
+  )
+"""
+
+# Applies one studentAssessment row (NEW or OLD) as a +/- delta on the summary
+_ADD_ROW_DELTA = f"""
+  INSERT INTO {TABLE} (id_student, code_module, code_presentation, score_sum, score_count)
+  SELECT NEW.id_student, a.code_module, a.code_presentation, COALESCE(NEW.score, 0), NEW.score IS NOT NULL
+  FROM assessments a WHERE a.id_assessment = NEW.id_assessment
+  ON DUPLICATE KEY UPDATE score_sum = score_sum + VALUES(score_sum),
+                          score_count = score_count + VALUES(score_count)
+"""
+_REMOVE_ROW_DELTA = f"""
+  UPDATE {TABLE} s
+  JOIN assessments a ON a.code_module = s.code_module AND a.code_presentation = s.code_presentation
+  SET s.score_sum = s.score_sum - COALESCE(OLD.score, 0),
+      s.score_count = s.score_count - (OLD.score IS NOT NULL)
+  WHERE a.id_assessment = OLD.id_assessment AND s.id_student = OLD.id_student
+"""
+
+TRIGGERS = {
+  "trg_studentAssessment_score_ai": f"""
+    CREATE TRIGGER trg_studentAssessment_score_ai AFTER INSERT ON studentAssessment
+    FOR EACH ROW {_ADD_ROW_DELTA}
+  """,
+  "trg_studentAssessment_score_au": f"""
+    CREATE TRIGGER trg_studentAssessment_score_au AFTER UPDATE ON studentAssessment
+    FOR EACH ROW BEGIN
+      {_REMOVE_ROW_DELTA};
+      {_ADD_ROW_DELTA};
+    END
+  """,
+  "trg_studentAssessment_score_ad": f"""
+    CREATE TRIGGER trg_studentAssessment_score_ad AFTER DELETE ON studentAssessment
+    FOR EACH ROW {_REMOVE_ROW_DELTA}
+  """,
+}
+
+INSTALLED_TRIGGERS_QUERY = """
+  SELECT TRIGGER_NAME AS name FROM information_schema.TRIGGERS
+  WHERE TRIGGER_SCHEMA = DATABASE() AND EVENT_OBJECT_TABLE = 'studentAssessment'
+"""
+
+# Full aggregation, used for the initial load and for repairs
+_AGGREGATE_SELECT = """
+  SELECT stu_assess.id_student, assess.code_module, assess.code_presentation,
+         COALESCE(SUM(stu_assess.score), 0), COUNT(stu_assess.score)
+  FROM studentAssessment stu_assess
+  JOIN assessments assess ON assess.id_assessment = stu_assess.id_assessment
+"""
+
+
+def create_student_course_score_table() -> bool:
+  """Creates the summary table if it does not exist yet."""
+  return db.execute_query(CREATE_TABLE_QUERY) is not False
+
+
+def install_student_course_score_triggers(names: list[str] | None = None) -> bool:
+  """(Re)creates the triggers that keep the summary in sync with studentAssessment (all if names is None)."""
+  names = list(TRIGGERS) if names is None else names
+  try:
+    with DBConnectionManager() as conn:
+      for name in names:
+        ddl = TRIGGERS[name]
+        conn.cursor.execute(f"DROP TRIGGER IF EXISTS {name}")
+        conn.cursor.execute(ddl)
+    logger.info(f"Installed {len(names)} trigger(s) maintaining {TABLE}.")
+    return True
+  except Exception as e:
+    logger.error(f"Failed to install {TABLE} triggers: {e}", exc_info=True)
+    return False
+
+
+def rebuild_student_course_score() -> bool:
+  """Recomputes the whole summary from studentAssessment in one transaction."""
+  try:
+    with DBConnectionManager() as conn:
+      conn.cursor.execute(f"DELETE FROM {TABLE}")
+      conn.cursor.execute(f"""
+        INSERT INTO {TABLE} (id_student, code_module, code_presentation, score_sum, score_count)
+        {_AGGREGATE_SELECT}
+        GROUP BY stu_assess.id_student, assess.code_module, assess.code_presentation
+      """)
+      logger.info(f"Rebuilt {TABLE}: {conn.cursor.rowcount} rows.")
+    QueryResultCache.invalidate_for_write(f"DELETE FROM {TABLE}")
+    return True
+  except Exception as e:
+    logger.error(f"Failed to rebuild {TABLE}: {e}", exc_info=True)
+    return False
+
+
+def refresh_student_course_score(id_students: list[int]) -> bool:
+  """
+  Recomputes the summary rows of the given students only, e.g. after a bulk
+  load that bypassed the triggers.
+  """
+  if not id_students:
+    return True
+  placeholders = ", ".join(["%s"] * len(id_students))
+  try:
+    with DBConnectionManager() as conn:
+      conn.cursor.execute(f"DELETE FROM {TABLE} WHERE id_student IN ({placeholders})", tuple(id_students))
+      conn.cursor.execute(f"""
+        INSERT INTO {TABLE} (id_student, code_module, code_presentation, score_sum, score_count)
+        {_AGGREGATE_SELECT}
+        WHERE stu_assess.id_student IN ({placeholders})
+        GROUP BY stu_assess.id_student, assess.code_module, assess.code_presentation
+      """, tuple(id_students))
+    QueryResultCache.invalidate_for_write(f"DELETE FROM {TABLE}")
+    return True
+  except Exception as e:
+    logger.error(f"Failed to refresh {TABLE} for {len(id_students)} students: {e}", exc_info=True)
+    return False
+
+
+def ensure_student_course_score(reinstall_triggers: bool = False) -> bool:
+  """
+  Creates the table, installs the missing triggers and rebuilds the summary
+  when it is empty or a trigger had to be (re)installed, since writes made
+  while a trigger was missing never reached it. Triggers go in before the
+  rebuild, so no write falls between the two. Cheap when everything is in place.
+
+  Args:
+    reinstall_triggers: Drop and recreate every trigger (then rebuild), to repair them.
+  """
+  if not create_student_course_score_table():
+    return False
+  row = db.fetch_one(f"SELECT EXISTS(SELECT 1 FROM {TABLE}) AS has_rows", cache_ttl=0)
+  if row is None:
+    return False
+  if reinstall_triggers:
+    to_install = list(TRIGGERS)
+  else:
+    installed = {row['name'] for row in db.fetch_all(INSTALLED_TRIGGERS_QUERY, cache_ttl=0)}
+    to_install = [name for name in TRIGGERS if name not in installed]
+  if to_install and not install_student_course_score_triggers(to_install):
+    return False
+  if row.get('has_rows') and not to_install:
+    return True
+  if to_install and row.get('has_rows'):
+    logger.warning(f"Installed {len(to_install)} {TABLE} trigger(s) on a filled table; rebuilding to catch up missed writes.")
+  return rebuild_student_course_score()
+
+
+
+def ensure_student_course_score_async(parent):
+  """
+  Runs ensure_student_course_score() on the thread pool, so the first window
+  does not wait for its round-trips (or a first-run rebuild), and logs a failure.
+
+  Args:
+    parent: QObject owning the task (e.g. the main window).
+
+  Returns:
+    The TaskHandle of the check.
+  """
+  from database.async_execute_service import AsyncDBExecuteService # Qt is only needed by GUI callers
+  runner = AsyncDBExecuteService(parent=parent)
+
+  def report(ok: bool) -> None:
+    if not ok:
+      logger.error(f"{TABLE} could not be set up; score pages stay empty until "
+                   f"'python -m database.summary.student_course_score' succeeds.")
+
+  def failed(e: Exception) -> None:
+    logger.error(f"Setting up {TABLE} failed: {e}", exc_info=e)
+
+  return runner.call(ensure_student_course_score, on_result=report, on_error=failed)
+
+
+if __name__ == "__main__":
+  import sys
+  ok = ensure_student_course_score(reinstall_triggers="--rebuild" in sys.argv)
+  sys.exit(0 if ok else 1)
@@ -0,0 +1,273 @@
+# inference/feature_store.py
+from __future__ import annotations # Allow type hinting FeatureStore within the class
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Tuple
+
+import numpy as np
+from utils.logger import get_class_logger
+from utils.lazy_import import lazy_import
+
+pd = lazy_import("pandas") # Only needed when (re)building the cache from the CSV
+
+logger = get_class_logger(__name__, "FeatureStore")
+
+class FeatureStore:
+    """
+    Preprocessed, indexed view of the student feature data.
+
+    Holds one C-contiguous float32 matrix whose columns are already sanitized
+    and ordered to the model's schema, plus a hash index from id_student to
+    row offset, so looking a student up is an O(1) row slice with no
+    DataFrame allocation.
+
+    FeatureStore.load() keeps a compiled copy of the CSV next to it (.npy
+    arrays + meta.json) and memory-maps it on later starts, so the CSV is only
+    parsed again when the source file changes and processes share the pages.
+    """
+    ENGAGEMENT_COLUMN: str = 'engagement_classification'
+    CACHE_FORMAT_VERSION: int = 1
+    CACHE_FILES: Tuple[str, ...] = ('student_ids.npy', 'matrix.npy', 'engagement.npy')
+
+    def __init__(self, student_ids: np.ndarray, matrix: np.ndarray,
+                 engagement: np.ndarray, columns: List[str]):
+        """
+        Args:
+            student_ids: id_student of every row (int64).
+            matrix: Model input matrix, one row per student (float32, C-contiguous).
+            engagement: Engagement class per row (float32, NaN when unparsable).
+            columns: Sanitized feature names, in matrix column order.
+        """
+        self.student_ids: np.ndarray = student_ids
+        self.matrix: np.ndarray = matrix
+        self.engagement: np.ndarray = engagement
+        self.columns: List[str] = columns
+        # First row of a student wins, like the original boolean-mask lookup
+        self.index: Dict[int, int] = {}
+        for row, student_id in enumerate(student_ids.tolist()):
+            self.index.setdefault(student_id, row)
+
+    # --- Construction ---
+
+    @classmethod
+    def from_dataframe(cls, feature_df: pd.DataFrame, non_feature_columns: Iterable[str],
+                       feature_names: List[str] | None = None) -> FeatureStore:
+        """
+        Builds the store from the raw feature DataFrame.
+
+        Args:
+            feature_df: Raw feature data with an 'id_student' column.
+            non_feature_columns: Columns that are not model inputs.
+            feature_names: Column order expected by the model. If None, the
+                           sanitized CSV order is used.
+
+        Raises:
+            ValueError: If 'id_student' or a feature expected by the model is missing.
+        """
+        if 'id_student' not in feature_df.columns:
+            raise ValueError("Feature data has no 'id_student' column.")
+
+        student_ids = feature_df['id_student'].to_numpy(dtype=np.int64)
+        if cls.ENGAGEMENT_COLUMN in feature_df.columns:
+            engagement = pd.to_numeric(feature_df[cls.ENGAGEMENT_COLUMN], errors='coerce').to_numpy(dtype=np.float32)
+        else:
+            engagement = np.full(len(feature_df), np.nan, dtype=np.float32)
+
+        drop = [col for col in non_feature_columns if col in feature_df.columns]
+        features = feature_df.drop(columns=drop)
+        features.columns = [cls.sanitize_column_name(col) for col in features.columns]
+
+        columns = list(feature_names) if feature_names is not None else list(features.columns)
+        missing = [col for col in columns if col not in features.columns]
+        if missing:
+            raise ValueError(f"Feature data is missing model feature(s): {missing[:5]}")
+
+        matrix = np.ascontiguousarray(features[columns].to_numpy(dtype=np.float32))
+        logger.info(f"Built feature store: {matrix.shape[0]} rows x {matrix.shape[1]} features "
+                    f"({matrix.nbytes / 1e6:.1f} MB).")
+        return cls(student_ids, matrix, engagement, columns)
+
+    @classmethod
+    def load(cls, csv_path: str | os.PathLike, non_feature_columns: Iterable[str],
+             feature_names: List[str] | None = None, cache_dir: str | os.PathLike | None = None,
+             verify_hash: bool = False) -> FeatureStore:
+        """
+        Opens the compiled feature cache of csv_path, (re)building it when stale.
+
+        The cache is valid while the CSV keeps the same size and mtime (or, with
+        verify_hash, the same SHA-256) and the model expects the same columns.
+
+        Args:
+            csv_path: Source feature CSV.
+            non_feature_columns: Columns that are not model inputs.
+            feature_names: Column order expected by the model (None = CSV order).
+            cache_dir: Where the compiled files live. Defaults to '<csv_path>.cache'.
+            verify_hash: Fall back to a content hash when size/mtime changed.
+
+        Raises:
+            FileNotFoundError: If the CSV does not exist.
+            ValueError: If the CSV lacks 'id_student' or a model feature.
+        """
+        csv_path = Path(csv_path)
+        cache_dir = Path(cache_dir) if cache_dir else csv_path.with_name(csv_path.name + '.cache')
+        source_stat = csv_path.stat() # Raises FileNotFoundError like pd.read_csv would
+
+        non_feature_columns = sorted(non_feature_columns)
+        meta = cls._read_cache_meta(cache_dir)
+        if meta is not None and meta.get('non_feature_columns') == non_feature_columns \
+                and cls._cache_is_current(meta, csv_path, source_stat, feature_names, cache_dir, verify_hash):
+            try:
+                store = cls._open_cache(cache_dir, meta)
+                logger.info(f"Opened memory-mapped feature cache {cache_dir} ({len(store)} students).")
+                return store
+            except Exception as e:
+                logger.warning(f"Feature cache {cache_dir} is unreadable, rebuilding: {e}")
+
+        logger.info(f"Compiling feature cache for {csv_path}...")
+        feature_df = pd.read_csv(csv_path)
+        store = cls.from_dataframe(feature_df, non_feature_columns, feature_names)
+        try:
+            cls._write_cache(cache_dir, store, csv_path, source_stat, non_feature_columns, verify_hash)
+            return cls._open_cache(cache_dir, cls._read_cache_meta(cache_dir))
+        except Exception as e:
+            logger.warning(f"Could not write feature cache {cache_dir}; using in-memory store: {e}")
+            return store
+
+    # --- Compiled Cache Helpers ---
+
+    @staticmethod
+    def _read_cache_meta(cache_dir: Path) -> Dict[str, Any] | None:
+        try:
+            with open(cache_dir / 'meta.json', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    @classmethod
+    def _cache_is_current(cls, meta: Dict[str, Any], csv_path: Path, source_stat: os.stat_result,
+                          feature_names: List[str] | None, cache_dir: Path, verify_hash: bool) -> bool:
+        if meta.get('format_version') != cls.CACHE_FORMAT_VERSION:
+            return False
+        if feature_names is not None and meta.get('columns') != list(feature_names):
+            logger.info("Model feature schema changed; feature cache is stale.")
+            return False
+        if not all((cache_dir / name).exists() for name in cls.CACHE_FILES):
+            return False
+        if meta.get('source_size') == source_stat.st_size and meta.get('source_mtime_ns') == source_stat.st_mtime_ns:
+            return True
+        if verify_hash and meta.get('source_sha256') and meta.get('source_size') == source_stat.st_size:
+            if cls._file_sha256(csv_path) == meta['source_sha256']:
+                # Same content with a new mtime (e.g. fresh checkout): refresh the stamp only
+                meta['source_mtime_ns'] = source_stat.st_mtime_ns
+                cls._write_json_atomic(cache_dir / 'meta.json', meta)
+                return True
+        logger.info(f"{csv_path} changed since the feature cache was built.")
+        return False
+
+    @classmethod
+    def _open_cache(cls, cache_dir: Path, meta: Dict[str, Any]) -> FeatureStore:
+        """Memory-maps the compiled arrays read-only."""
+        student_ids, matrix, engagement = (np.load(cache_dir / name, mmap_mode='r') for name in cls.CACHE_FILES)
+        return cls(student_ids, matrix, engagement, list(meta['columns']))
+
+    @classmethod
+    def _write_cache(cls, cache_dir: Path, store: FeatureStore, csv_path: Path, source_stat: os.stat_result,
+                     non_feature_columns: List[str], with_hash: bool) -> None:
+        """Writes the arrays, then meta.json last so a half-written cache is never trusted."""
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        meta_path = cache_dir / 'meta.json'
+        if meta_path.exists():
+            meta_path.unlink()
+
+        for name, array in zip(cls.CACHE_FILES, (store.student_ids, store.matrix, store.engagement)):
+            tmp_path = cache_dir / (name + '.tmp')
+            with open(tmp_path, 'wb') as f:
+                np.save(f, np.ascontiguousarray(array))
+            os.replace(tmp_path, cache_dir / name)
+
+        meta = {
+            'format_version': cls.CACHE_FORMAT_VERSION,
+            'source_path': str(csv_path),
+            'source_size': source_stat.st_size,
+            'source_mtime_ns': source_stat.st_mtime_ns,
+            'source_sha256': cls._file_sha256(csv_path) if with_hash else None,
+            'columns': store.columns,
+            'non_feature_columns': non_feature_columns,
+            'rows': int(store.matrix.shape[0]),
+        }
+        cls._write_json_atomic(meta_path, meta)
+        logger.info(f"Wrote feature cache to {cache_dir}.")
+
+    @staticmethod
+    def _write_json_atomic(path: Path, data: Dict[str, Any]) -> None:
+        tmp_path = path.with_name(path.name + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def _file_sha256(path: Path) -> str:
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                digest.update(block)
+        return digest.hexdigest()
+
+    # --- Helpers ---
+
+    @staticmethod
+    def sanitize_column_name(name: Any) -> str:
+        """Strips the characters XGBoost rejects in feature names ('[', ']', '<')."""
+        return str(name).replace('[', '').replace(']', '').replace('<', '')
+
+    @staticmethod
+    def model_feature_names(model: Any) -> List[str] | None:
+        """Returns the feature order the model was trained with, if it records one."""
+        names = getattr(model, 'feature_names_in_', None)
+        if names is None and hasattr(model, 'get_booster'):
+            try:
+                names = model.get_booster().feature_names
+            except Exception:
+                names = None
+        return [str(name) for name in names] if names is not None else None
+
+    # --- Lookups ---
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def __contains__(self, student_id: int) -> bool:
+        return student_id in self.index
+
+    def get_row(self, student_id: int) -> np.ndarray | None:
+        """Returns the (1, n_features) model input of a student, or None if unknown."""
+        row = self.index.get(student_id)
+        if row is None:
+            return None
+        return self.matrix[row:row + 1]
+
+    def get_engagement(self, student_id: int) -> int | None:
+        """Returns the engagement class of a student, or None if unknown/unparsable."""
+        row = self.index.get(student_id)
+        if row is None or np.isnan(self.engagement[row]):
+            return None
+        return int(self.engagement[row])
+
+    def get_rows(self, student_ids: Iterable[int]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Gathers the rows of many students.
+
+        Returns:
+            (row_offsets, found_ids): offsets into matrix/engagement and the ids
+            that were found, in request order. Unknown ids are skipped.
+        """
+        found = [(self.index[sid], sid) for sid in student_ids if sid in self.index]
+        rows = np.fromiter((row for row, _ in found), dtype=np.int64, count=len(found))
+        ids = np.fromiter((sid for _, sid in found), dtype=np.int64, count=len(found))
+        return rows, ids
+
+    def unique_rows(self) -> np.ndarray:
+        """Row offsets of every distinct student (first row per student)."""
+        return np.fromiter(self.index.values(), dtype=np.int64, count=len(self.index))
@@ -1,12 +1,24 @@
-import pandas as pd
-import joblib
+from __future__ import annotations # Annotations must not trigger the lazy imports below
+import hashlib
 import sys
-from typing import TypedDict, List, Tuple, Any, Dict # Added imports
+import time
+import warnings
+from typing import TypedDict, List, Tuple, Any, Dict, Iterable # Added imports
 
 # --- Configuration and Database Imports ---
 from config.config import GLOBAL_CONFIG
 from database.execute_service import DBExecuteService as db
+from inference.feature_store import FeatureStore
+from inference.rescore import StaleRecommendationRescorer
+from inference.write_buffer import RecommendationWriteBuffer
 from utils.logger import get_class_logger
+from utils.lazy_import import lazy_import
+from utils.lru_cache import TTLLRUCache
+
+# pandas and joblib (plus the model libraries unpickled through it) load on first use
+pd = lazy_import("pandas")
+np = lazy_import("numpy")
+joblib = lazy_import("joblib")
 
 # Configure logger for this module/class
 logger = get_class_logger(__name__, "RecommendationService")
@@ -64,22 +76,83 @@ class RecommendationService:
     }
 
 
-    def __init__(self):
+    # Columns of the feature CSV that are not model inputs
+    NON_FEATURE_COLUMNS: List[str] = ['id_student', 'study_method_preference', 'final_result']
+    # UPSERT used for both single and bulk writes to the cache table
+    CACHE_UPSERT_QUERY: str = """
+            INSERT INTO studentRecommendations (id_student, predicted_study_method, engagement_level, model_version)
+            VALUES (%s, %s, %s, %s)
+            ON DUPLICATE KEY UPDATE predicted_study_method = VALUES(predicted_study_method),
+                                   engagement_level = VALUES(engagement_level),
+                                   model_version = VALUES(model_version)
+            """
+    # Fingerprint of the model that produced each cached row (NULL for rows written before versioning)
+    MODEL_VERSION_COLUMN_QUERY: str = """
+            SELECT COUNT(*) AS present FROM information_schema.COLUMNS
+            WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'studentRecommendations' AND COLUMN_NAME = 'model_version'
+            """
+    ADD_MODEL_VERSION_COLUMN_QUERY: str = """
+            ALTER TABLE studentRecommendations
+            ADD COLUMN model_version VARCHAR(64) NULL,
+            ADD INDEX idx_model_version (model_version)
+            """
+    # Max number of ids per "IN (...)" cache lookup
+    CACHE_LOOKUP_CHUNK_SIZE: int = 1000
+
+
+    def __init__(self, start_rescorer: bool | None = None):
         """
         Initializes the service, loading the model and feature data from
         paths specified in GLOBAL_CONFIG.
+
+        Args:
+            start_rescorer: Start re-scoring stale cached rows in the background
+                            (default RESCORE_ON_START). RecommendationWarmup passes
+                            False, since it re-scores stale rows itself.
         """
         # Type hints for instance attributes
-        
-        self.model, self.feature_df = self._load_artifacts()
+        self._feature_df: pd.DataFrame | None = None
+        self.model, self.feature_store = self._load_artifacts()
+        # Cached rows are only trusted when they were produced by this exact model
+        self.model_version: str | None = self._model_fingerprint(self.model, GLOBAL_CONFIG.MODEL_PATH)
+        self._ensure_cache_schema()
+        # Single predictions are written to the cache table in bulk, not one statement each
+        self.write_buffer = RecommendationWriteBuffer(self.CACHE_UPSERT_QUERY, self.model_version)
+        # In-memory tier in front of the studentRecommendations table: id_student -> (study, engagement)
+        self.memory_cache = TTLLRUCache(max_entries=GLOBAL_CONFIG.RECOMMENDATION_CACHE_SIZE,
+                                        default_ttl_sec=GLOBAL_CONFIG.RECOMMENDATION_CACHE_TTL_SEC)
+        # Re-scores rows of older models in the background instead of on demand
+        self.rescorer = StaleRecommendationRescorer(self)
+        # time.monotonic() of the last interactive lookup; background warm-up waits while this is recent
+        self.last_lookup_at: float = 0.0
+        if start_rescorer is None:
+            start_rescorer = GLOBAL_CONFIG.RESCORE_ON_START
+        if start_rescorer and self.model is not None:
+            self.rescorer.start()
+
+    @property
+    def feature_df(self) -> pd.DataFrame | None:
+        """
+        Raw feature CSV as a DataFrame, parsed on first access only.
+        Predictions use feature_store; this is kept for ad-hoc analysis.
+        """
+        if self._feature_df is None:
+            try:
+                self._feature_df = pd.read_csv(GLOBAL_CONFIG.FEATURE_DATA_PATH)
+                if 'id_student' in self._feature_df.columns:
+                    # Ensure correct type for matching
+                    self._feature_df['id_student'] = self._feature_df['id_student'].astype(int)
+            except Exception as e:
+                logger.error(f"Error loading feature data: {e}", exc_info=True)
+        return self._feature_df
 
-    def _load_artifacts(self) -> Tuple[Any | None, pd.DataFrame | None]:
-        """Loads the model and feature DataFrame from disk."""
+    def _load_artifacts(self) -> Tuple[Any | None, FeatureStore | None]:
+        """Loads the model and opens the memory-mapped feature store from disk."""
         model_path: str = GLOBAL_CONFIG.MODEL_PATH
         data_path: str = GLOBAL_CONFIG.FEATURE_DATA_PATH
         
         model: Any | None = None
-        feature_df: pd.DataFrame | None = None
+        feature_store: FeatureStore | None = None
         
         # Load Model
         try:
@@ -90,106 +163,278 @@ class RecommendationService:
         except Exception as e:
             logger.error(f"Error loading model: {e}. Prediction disabled.", exc_info=True)
             
-        # Load Feature Data
+        # Load Feature Data (compiled cache, rebuilt from the CSV only when it changed)
         try:
-            feature_df = pd.read_csv(data_path)
-            if 'id_student' in feature_df.columns:
-                 # Ensure correct type for matching
-                 feature_df['id_student'] = feature_df['id_student'].astype(int)
+            feature_names = FeatureStore.model_feature_names(model) if model is not None else None
+            feature_store = FeatureStore.load(data_path, self.NON_FEATURE_COLUMNS, feature_names,
+                                              cache_dir=GLOBAL_CONFIG.FEATURE_CACHE_DIR,
+                                              verify_hash=GLOBAL_CONFIG.FEATURE_CACHE_VERIFY_HASH)
             logger.info(f"Successfully loaded feature data from {data_path}")
         except FileNotFoundError:
             logger.error(f"Error: Feature data file not found at {data_path}. Prediction disabled.")
         except Exception as e:
             logger.error(f"Error loading feature data: {e}. Prediction disabled.", exc_info=True)
 
-        return model, feature_df
+        return model, feature_store
 
+    @staticmethod
+    def _model_fingerprint(model: Any | None, model_path: str) -> str | None:
+        """
+        Identifies the loaded model: its embedded `model_version` attribute if
+        it has one, otherwise a SHA-256 prefix of the model file.
+        """
+        if model is None:
+            return None
+        embedded = getattr(model, 'model_version', None)
+        if embedded:
+            return str(embedded)[:64]
+        try:
+            digest = hashlib.sha256()
+            with open(model_path, 'rb') as f:
+                for block in iter(lambda: f.read(1 << 20), b''):
+                    digest.update(block)
+            return f"sha256:{digest.hexdigest()[:16]}"
+        except OSError as e:
+            logger.error(f"Could not fingerprint model file {model_path}: {e}", exc_info=True)
+            return None
+
+    def _ensure_cache_schema(self) -> None:
+        """Adds the model_version column to studentRecommendations if it is missing."""
+        row = db.fetch_one(self.MODEL_VERSION_COLUMN_QUERY, cache_ttl=0)
+        if row is None or int(row['present']):
+            return
+        if db.execute_query(self.ADD_MODEL_VERSION_COLUMN_QUERY) is False:
+            logger.error("Failed to add model_version to studentRecommendations; cached rows cannot be validated.")
+        else:
+            logger.info("Added model_version column to studentRecommendations.")
+
+    def _model_predict(self, features: np.ndarray) -> np.ndarray:
+        """Runs model.predict on a preprocessed feature matrix."""
+        with warnings.catch_warnings():
+            # Models fitted on DataFrames warn about missing feature names; the
+            # store already guarantees the trained column order.
+            warnings.filterwarnings("ignore", message="X does not have valid feature names")
+            return np.asarray(self.model.predict(features))
 
     def _get_cached_recommendation(self, student_id: int) -> Tuple[int | None, int | None]:
         """Checks the studentRecommendations table for existing predictions."""
         logger.debug(f"Checking recommendation cache for student_id: {student_id}")
+        remembered = self.memory_cache.get(student_id)
+        if remembered is not None:
+            return remembered
+        pending = self.write_buffer.get(student_id)
+        if pending is not None:
+            return pending # Predicted moments ago, not flushed yet
         cached_result: Dict[str, Any] | None = db.fetch_one(
-            "SELECT predicted_study_method, engagement_level FROM studentRecommendations WHERE id_student = %s",
-            (student_id,)
+            "SELECT predicted_study_method, engagement_level, model_version FROM studentRecommendations WHERE id_student = %s",
+            (student_id,),
+            cache_ttl=0 # memory_cache is the in-process tier for this table
         )
         if cached_result:
-            logger.info(f"Cache hit for student {student_id}.")
             try:
                 # Ensure data from DB is integer
                 study_id = int(cached_result['predicted_study_method'])
                 engage_id = int(cached_result['engagement_level'])
-                return study_id, engage_id
             except (KeyError, TypeError, ValueError) as e:
                 logger.warning(f"Cached data for student {student_id} is corrupt: {e}")
                 return None, None
+
+            if self.model_version is not None and cached_result.get('model_version') != self.model_version:
+                # Produced by another model: let the background job re-score it first
+                self.rescorer.prioritize(student_id)
+                if not GLOBAL_CONFIG.RECOMMENDATION_SERVE_STALE:
+                    logger.info(f"Stale cache row for student {student_id}; re-predicting.")
+                    return None, None
+                logger.info(f"Stale cache hit for student {student_id}; serving it until re-scored.")
+                return study_id, engage_id
+
+            logger.info(f"Cache hit for student {student_id}.")
+            self.memory_cache.set(student_id, (study_id, engage_id))
+            return study_id, engage_id
         logger.info(f"Cache miss for student {student_id}.")
         return None, None
 
     def _predict_and_cache(self, student_id: int) -> Tuple[int | None, int | None]:
         """
-        Runs prediction using the loaded CSV and caches the result.
+        Runs prediction using the preprocessed feature store and caches the result.
         This logic is adapted from your predict.py script.
         """
         # Check if model and data are loaded
-        if self.model is None or self.feature_df is None:
+        if self.model is None or self.feature_store is None:
              logger.warning("Model or feature data not loaded. Cannot predict.")
              return None, None
 
-        # 1. Get student data row from the loaded DataFrame
-        student_data_row: pd.DataFrame = self.feature_df[self.feature_df['id_student'] == student_id]
+        # 1. Get the preprocessed feature row (O(1) index lookup)
+        student_features: np.ndarray | None = self.feature_store.get_row(student_id)
         
-        if student_data_row.empty:
+        if student_features is None:
             logger.warning(f"Student {student_id} not found in {GLOBAL_CONFIG.FEATURE_DATA_PATH}.")
             return None, None
         
-        student_features: pd.DataFrame = student_data_row.copy()
-        
         # 2. Extract Engagement Level (from the CSV data)
-        try:
-            engagement_level_id: int = int(student_features["engagement_classification"].iloc[0])
-        except (KeyError, IndexError, ValueError):
+        engagement_level_id: int | None = self.feature_store.get_engagement(student_id)
+        if engagement_level_id is None:
             logger.warning(f"Could not find/parse 'engagement_classification' for student {student_id}.")
             return None, None
             
-        # 3. Prepare Features for Prediction (from predict.py)
-        cols_to_drop: List[str] = ['id_student', 'study_method_preference', 'final_result']
-        existing_cols_to_drop: List[str] = [col for col in cols_to_drop if col in student_features.columns]
-        
-        student_features = student_features.drop(columns=existing_cols_to_drop)
-
-        # 4. XGBoost Column Name Fix (from predict.py)
-        student_features.columns = student_features.columns.astype(str).str.replace('[', '', regex=False) \
-                                             .str.replace(']', '', regex=False) \
-                                             .str.replace('<', '', regex=False)
-        
-        # 5. Predict Study Method
+        # 3. Predict Study Method
         try:
-            # model.predict usually returns a numpy array
-            predicted_label_array: Any = self.model.predict(student_features)
-            study_method_id: int = int(predicted_label_array[0])
+            study_method_id: int = int(self._model_predict(student_features)[0])
         except Exception as e:
             logger.error(f"Error during model prediction for student {student_id}: {e}", exc_info=True)
             return None, None
 
-        # 6. Save to Cache
+        # 4. Save to Cache
         self._save_recommendation_to_cache(student_id, study_method_id, engagement_level_id)
 
         return study_method_id, engagement_level_id
 
     def _save_recommendation_to_cache(self, student_id: int, study_method_id: int, engagement_level_id: int) -> None:
-        """Saves the prediction results to the database cache table."""
-        logger.debug(f"Saving prediction to cache: Student={student_id}, Study={study_method_id}, Engagement={engagement_level_id}")
-        success: bool | int = db.execute_query(
-            """
-            INSERT INTO studentRecommendations (id_student, predicted_study_method, engagement_level)
-            VALUES (%s, %s, %s)
-            ON DUPLICATE KEY UPDATE predicted_study_method = VALUES(predicted_study_method),
-                                   engagement_level = VALUES(engagement_level)
-            """,
-            (student_id, study_method_id, engagement_level_id)
-        )
-        if not success:
-             logger.warning(f"Failed to save prediction to cache for student {student_id}.")
+        """Queues the prediction for the next bulk write to the database cache table."""
+        logger.debug(f"Buffering prediction for cache: Student={student_id}, Study={study_method_id}, Engagement={engagement_level_id}")
+        self.memory_cache.set(student_id, (study_method_id, engagement_level_id)) # Write-through
+        self.write_buffer.add(student_id, study_method_id, engagement_level_id)
+
+    def flush_cache_writes(self) -> int:
+        """Writes all buffered predictions to the cache table now; returns the number written."""
+        return self.write_buffer.flush()
+
+    def invalidate_cache(self, student_ids: Iterable[int] | None = None, clear_table: bool = False) -> None:
+        """
+        Invalidation hook for data changes. A retrained model needs no call:
+        rows of other model versions are detected and re-scored automatically.
+
+        Args:
+            student_ids: Students to forget; None forgets everyone.
+            clear_table: Also delete the rows from studentRecommendations, so the
+                         next lookups re-predict instead of reading old predictions.
+        """
+        if student_ids is None:
+            self.write_buffer.flush() # Don't let pending rows land after the table was cleared
+            self.memory_cache.clear()
+            if clear_table and db.execute_query("DELETE FROM studentRecommendations") is False:
+                logger.warning("Failed to clear the studentRecommendations table.")
+            logger.info("Recommendation caches invalidated.")
+            return
+
+        ids = [int(sid) for sid in student_ids]
+        self.write_buffer.flush()
+        for sid in ids:
+            self.memory_cache.invalidate(sid)
+        if clear_table:
+            for start in range(0, len(ids), self.CACHE_LOOKUP_CHUNK_SIZE):
+                chunk = ids[start:start + self.CACHE_LOOKUP_CHUNK_SIZE]
+                placeholders = ", ".join(["%s"] * len(chunk))
+                db.execute_query(f"DELETE FROM studentRecommendations WHERE id_student IN ({placeholders})", tuple(chunk))
+
+    def cache_stats(self) -> Dict[str, Any]:
+        """Hit/miss/eviction counters and hit rate of the in-memory tier."""
+        return self.memory_cache.stats()
+
+    # --- Batch (cohort) Scoring ---
+
+    def _get_cached_recommendations_batch(self, student_ids: List[int]) -> Dict[int, Tuple[int, int]]:
+        """Looks up many students in memory, then the rest in the cache table with chunked IN (...) queries."""
+        cached: Dict[int, Tuple[int, int]] = {}
+        for sid in student_ids:
+            remembered = self.memory_cache.get(sid)
+            if remembered is None:
+                remembered = self.write_buffer.get(sid)
+            if remembered is not None:
+                cached[sid] = remembered
+        remaining = [sid for sid in student_ids if sid not in cached]
+
+        for start in range(0, len(remaining), self.CACHE_LOOKUP_CHUNK_SIZE):
+            chunk = remaining[start:start + self.CACHE_LOOKUP_CHUNK_SIZE]
+            placeholders = ", ".join(["%s"] * len(chunk))
+            rows: List[Dict[str, Any]] = db.fetch_all(
+                "SELECT id_student, predicted_study_method, engagement_level, model_version FROM studentRecommendations "
+                f"WHERE id_student IN ({placeholders})",
+                tuple(chunk),
+                cache_ttl=0
+            )
+            for row in rows:
+                if self.model_version is not None and row.get('model_version') != self.model_version:
+                    continue # Older model: re-scored by this batch instead
+                try:
+                    sid = int(row['id_student'])
+                    cached[sid] = (int(row['predicted_study_method']), int(row['engagement_level']))
+                    self.memory_cache.set(sid, cached[sid])
+                except (KeyError, TypeError, ValueError) as e:
+                    logger.warning(f"Cached data for student {row.get('id_student')} is corrupt: {e}")
+        logger.info(f"Batch cache lookup: {len(cached)} hit(s), {len(student_ids) - len(cached)} miss(es).")
+        return cached
+
+    def _predict_batch(self, student_ids: List[int] | None = None) -> Dict[int, Tuple[int, int]]:
+        """
+        Predicts study methods for many students with a single model.predict call.
+
+        Args:
+            student_ids: Students to score. None scores every student in the feature data.
+
+        Returns:
+            Mapping of id_student -> (study_method_id, engagement_level_id).
+        """
+        if self.model is None or self.feature_store is None:
+            logger.warning("Model or feature data not loaded. Cannot predict.")
+            return {}
+
+        store = self.feature_store
+        if student_ids is None:
+            rows = store.unique_rows()
+        else:
+            rows, _ = store.get_rows(student_ids)
+
+        engagement = store.engagement[rows]
+        valid_mask = ~np.isnan(engagement)
+        if not valid_mask.all():
+            logger.warning(f"Skipping {int((~valid_mask).sum())} student(s) with unparsable 'engagement_classification'.")
+        rows = rows[valid_mask]
+        if rows.size == 0:
+            return {}
+
+        try:
+            predicted_labels: np.ndarray = self._model_predict(store.matrix[rows])
+        except Exception as e:
+            logger.error(f"Error during batch model prediction for {rows.size} students: {e}", exc_info=True)
+            return {}
+
+        ids = store.student_ids[rows].tolist()
+        study_ids = predicted_labels.astype(int).tolist()
+        engagement_ids = engagement[valid_mask].astype(int).tolist()
+        logger.info(f"Predicted study methods for {len(ids)} students in one batch.")
+        return {sid: (study, engage) for sid, study, engage in zip(ids, study_ids, engagement_ids)}
+
+    def _save_recommendations_to_cache_batch(self, predictions: Dict[int, Tuple[int, int]]) -> None:
+        """Writes many predictions to the cache table in bulk batches, before returning."""
+        if not predictions:
+            return
+        for sid, prediction in predictions.items():
+            self.memory_cache.set(sid, prediction) # Write-through
+        self.write_buffer.add_many((sid, study, engage) for sid, (study, engage) in predictions.items())
+        self.write_buffer.flush()
+
+    def _build_result(self, study_method_id: int | None, engagement_level_id: int | None) -> RecommendationResult:
+        """Turns predicted ids into the public recommendation structure."""
+        result: RecommendationResult = {
+            'courses': [],
+            'study_method_label': None,
+            'engagement_label': None
+        }
+
+        if study_method_id is None or engagement_level_id is None:
+            result['courses'] = ["Could not generate recommendations for this student."]
+            return result
+
+        # Lookup courses in the map
+        result['courses'] = self.RECOMMENDATIONS.get(study_method_id, {}).get(engagement_level_id, [])
+        if not result['courses']:
+            result['courses'] = ["No specific recommendations found for this combination."]
+
+        # Add labels
+        result['study_method_label'] = self.STUDY_METHOD_MAP.get(study_method_id, f"Unknown ({study_method_id})")
+        result['engagement_label'] = self.ENGAGEMENT_LEVEL_MAP.get(engagement_level_id, f"Unknown ({engagement_level_id})")
+        return result
 
 
     # --- PUBLIC METHOD (with updated type hints) ---
@@ -208,6 +453,7 @@ class RecommendationService:
              # Return matching the TypedDict structure
              return {'courses': ["Invalid student ID provided."], 'study_method_label': None, 'engagement_label': None}
 
+        self.last_lookup_at = time.monotonic()
         study_method_id: int | None
         engagement_level_id: int | None
         study_method_id, engagement_level_id = self._get_cached_recommendation(student_id)
@@ -216,25 +462,50 @@ class RecommendationService:
             # Not in cache, run prediction
             study_method_id, engagement_level_id = self._predict_and_cache(student_id)
 
-        # Prepare final output, explicitly typing the dictionary
-        result: RecommendationResult = {
-            'courses': [],
-            'study_method_label': None,
-            'engagement_label': None
-        }
+        result: RecommendationResult = self._build_result(study_method_id, engagement_level_id)
+        if result['study_method_label'] is not None:
+            logger.info(f"Final recommendations for Student {student_id}: Study={result['study_method_label']}, Engagement={result['engagement_label']}")
+        return result
 
-        if study_method_id is None or engagement_level_id is None:
-            result['courses'] = ["Could not generate recommendations for this student."]
-            return result
+    def get_recommendations_batch(self, student_ids: Iterable[int]) -> Dict[int, RecommendationResult]:
+        """
+        Gets recommendations for many students at once.
 
-        # Lookup courses in the map
-        result['courses'] = self.RECOMMENDATIONS.get(study_method_id, {}).get(engagement_level_id, [])
-        if not result['courses']:
-            result['courses'] = ["No specific recommendations found for this combination."]
+        Cached students are resolved with chunked lookups, all misses are scored
+        with one vectorized model.predict call and saved with one bulk upsert.
 
-        # Add labels
-        result['study_method_label'] = self.STUDY_METHOD_MAP.get(study_method_id, f"Unknown ({study_method_id})")
-        result['engagement_label'] = self.ENGAGEMENT_LEVEL_MAP.get(engagement_level_id, f"Unknown ({engagement_level_id})")
+        Args:
+            student_ids: Student ids to resolve. Invalid ids are skipped.
+
+        Returns:
+            Mapping of id_student -> RecommendationResult.
+        """
+        valid_ids: List[int] = []
+        for student_id in student_ids:
+            try:
+                valid_ids.append(int(student_id))
+            except (ValueError, TypeError):
+                logger.error(f"Invalid student_id provided: {student_id}. Must be an integer.")
+        valid_ids = list(dict.fromkeys(valid_ids)) # De-duplicate, keep order
+
+        predictions = self._get_cached_recommendations_batch(valid_ids)
+        missing_ids = [sid for sid in valid_ids if sid not in predictions]
+        if missing_ids:
+            new_predictions = self._predict_batch(missing_ids)
+            self._save_recommendations_to_cache_batch(new_predictions)
+            predictions.update(new_predictions)
+
+        return {sid: self._build_result(*predictions.get(sid, (None, None))) for sid in valid_ids}
 
-        logger.info(f"Final recommendations for Student {student_id}: Study={result['study_method_label']}, Engagement={result['engagement_label']}")
-        return result
\ No newline at end of file
+    def score_all_students(self) -> int:
+        """
+        "Score everyone" mode: predicts the whole feature matrix in one call and
+        refreshes the cache table with one bulk upsert, ignoring existing cache rows.
+
+        Returns:
+            The number of students scored.
+        """
+        predictions = self._predict_batch()
+        self._save_recommendations_to_cache_batch(predictions)
+        logger.info(f"Scored and cached recommendations for {len(predictions)} students.")
+        return len(predictions)
@@ -0,0 +1,115 @@
+# inference/rescore.py
+from __future__ import annotations # Avoid importing RecommendationService (and its model stack) at runtime
+import threading
+from typing import TYPE_CHECKING, List
+
+from config.config import GLOBAL_CONFIG
+from database.execute_service import DBExecuteService as db
+from utils.logger import get_class_logger
+
+if TYPE_CHECKING:
+    from inference.predict import RecommendationService
+
+logger = get_class_logger(__name__, "StaleRecommendationRescorer")
+
+class StaleRecommendationRescorer:
+    """
+    Background thread that re-scores cached recommendations produced by an
+    older model, a small batch at a time.
+
+    Rows are walked in id_student order (keyset), so students that cannot be
+    re-scored (e.g. missing from the feature data) are skipped instead of
+    being retried forever. Students seen stale by interactive lookups are
+    moved to the front of the queue.
+    """
+    STALE_ROWS_QUERY = """
+        SELECT id_student FROM studentRecommendations
+        WHERE (model_version IS NULL OR model_version <> %s) AND id_student > %s
+        ORDER BY id_student
+        LIMIT %s
+    """
+
+    def __init__(self, service: RecommendationService, batch_size: int | None = None,
+                 pause_sec: float | None = None):
+        """
+        Args:
+            service: Service whose model and write path are used for re-scoring.
+            batch_size: Students re-scored per batch (default RESCORE_BATCH_SIZE).
+            pause_sec: Sleep between batches, to keep the database and CPU responsive (default RESCORE_PAUSE_SEC).
+        """
+        self.service = service
+        self.batch_size = batch_size or GLOBAL_CONFIG.RESCORE_BATCH_SIZE
+        self.pause_sec = pause_sec if pause_sec is not None else GLOBAL_CONFIG.RESCORE_PAUSE_SEC
+        self.rescored = 0
+        self._priority: dict[int, None] = {} # Insertion-ordered set
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None
+
+    def start(self) -> None:
+        """Starts the background pass if it is not already running."""
+        if self.service.model_version is None:
+            return
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="recommendation-rescore", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        self._stop.set()
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+
+    def prioritize(self, student_id: int) -> None:
+        """Re-scores this student in the next batch and makes sure the job is running."""
+        with self._lock:
+            self._priority[student_id] = None
+        self.start()
+
+    # --- Internal Helpers ---
+
+    def _run(self) -> None:
+        logger.info(f"Re-scoring recommendations not produced by model {self.service.model_version}.")
+        after_id = -1
+        table_done = False
+        while not self._stop.is_set():
+            batch = self._take_priority()
+            if len(batch) < self.batch_size and not table_done:
+                rows = db.fetch_all(self.STALE_ROWS_QUERY,
+                                    (self.service.model_version, after_id, self.batch_size - len(batch)),
+                                    cache_ttl=0)
+                if rows:
+                    after_id = int(rows[-1]['id_student'])
+                    batch.extend(int(row['id_student']) for row in rows if int(row['id_student']) not in batch)
+                else:
+                    table_done = True
+            if not batch:
+                with self._lock: # Exit decision and prioritize() must not interleave
+                    if not self._priority:
+                        self._thread = None
+                        break
+                continue
+
+            predictions = self.service._predict_batch(batch)
+            self.service._save_recommendations_to_cache_batch(predictions)
+            self.rescored += len(predictions)
+            logger.debug(f"Re-scored {len(predictions)}/{len(batch)} stale recommendation(s); {self.rescored} so far.")
+            self._stop.wait(self.pause_sec)
+        with self._lock:
+            if self._thread is threading.current_thread(): # Stopped early
+                self._thread = None
+        logger.info(f"Stale recommendation re-scoring finished: {self.rescored} row(s) updated.")
+
+    def _take_priority(self) -> List[int]:
+        with self._lock:
+            ids = list(self._priority)[:self.batch_size]
+            for sid in ids:
+                del self._priority[sid]
+        return ids
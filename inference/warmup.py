@@ -0,0 +1,215 @@
+# inference/warmup.py
+"""
+Pre-computes recommendations for every student in the feature data that has
+no current row in studentRecommendations (missing, or written by another
+model version), so interactive lookups are cache hits.
+
+Run it from the command line (add --restart to ignore the checkpoint):
+
+    python -m inference.warmup
+
+or let the GUI start it in the background once it is idle (WARMUP_ON_IDLE).
+"""
+from __future__ import annotations # Avoid importing RecommendationService (and its model stack) at runtime
+import json
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, List
+
+from config.config import GLOBAL_CONFIG
+from database.execute_service import DBExecuteService as db
+from utils.logger import get_class_logger
+
+if TYPE_CHECKING:
+    from inference.predict import RecommendationService
+
+logger = get_class_logger(__name__, "RecommendationWarmup")
+
+class RecommendationWarmup:
+    """
+    Walks the feature data in id_student order, one batch at a time, and
+    scores the students whose cache row is missing or stale.
+
+    Throttled by a pause between batches and by waiting while the service is
+    answering interactive lookups. After every batch the last processed id is
+    written to a checkpoint file, so an interrupted run resumes where it
+    stopped (as long as the model version is unchanged).
+    """
+    CURRENT_ROWS_QUERY = """
+        SELECT id_student FROM studentRecommendations
+        WHERE model_version = %s AND id_student IN ({placeholders})
+    """
+
+    def __init__(self, service: RecommendationService | None = None, batch_size: int | None = None,
+                 pause_sec: float | None = None, checkpoint_path: str | os.PathLike | None = None,
+                 on_progress: Callable[[Dict[str, Any]], None] | None = None):
+        """
+        Args:
+            service: Service whose model and write path are used; loaded by run() if None,
+                     so a background warm-up also loads the model off the calling thread.
+            batch_size: Students checked and scored per batch (default WARMUP_BATCH_SIZE).
+            pause_sec: Sleep between batches (default WARMUP_PAUSE_SEC).
+            checkpoint_path: Resume file (default WARMUP_CHECKPOINT_PATH).
+            on_progress: Called with progress() after every batch, from the worker thread.
+        """
+        self.service = service
+        self.batch_size = batch_size or GLOBAL_CONFIG.WARMUP_BATCH_SIZE
+        self.pause_sec = pause_sec if pause_sec is not None else GLOBAL_CONFIG.WARMUP_PAUSE_SEC
+        self.checkpoint_path = Path(checkpoint_path or GLOBAL_CONFIG.WARMUP_CHECKPOINT_PATH)
+        self.on_progress = on_progress
+        self.total = 0
+        self.checked = 0
+        self.scored = 0
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    # --- Control ---
+
+    def run(self, restart: bool = False) -> Dict[str, Any]:
+        """
+        Warms the cache on the calling thread until done or stop() is called.
+
+        Args:
+            restart: Ignore the checkpoint and check every student again.
+
+        Returns:
+            The final progress().
+        """
+        if self.service is None:
+            from inference.predict import RecommendationService # Heavy: model + feature store
+            self.service = RecommendationService(start_rescorer=False)
+        elif self.service.rescorer.running:
+            # Both would score the same stale rows; the warm-up covers them in its own pass
+            logger.info("Stopping background re-scoring while the warm-up runs.")
+            self.service.rescorer.stop()
+        store = self.service.feature_store
+        if self.service.model is None or store is None or self.service.model_version is None:
+            logger.warning("Model or feature data not loaded. Nothing to warm up.")
+            return self.progress()
+
+        student_ids: List[int] = sorted(store.index)
+        self.total = len(student_ids)
+        after_id = None if restart else self._read_checkpoint()
+        start = 0
+        if after_id is not None:
+            while start < len(student_ids) and student_ids[start] <= after_id:
+                start += 1
+            logger.info(f"Resuming warm-up after student {after_id} ({start}/{self.total} already checked).")
+        self.checked = start
+
+        for offset in range(start, len(student_ids), self.batch_size):
+            if not self._wait_until_idle():
+                break
+            batch = student_ids[offset:offset + self.batch_size]
+            missing = self._missing_ids(batch)
+            if missing is None:
+                logger.warning("Could not read the recommendation cache; warm-up paused until the next run.")
+                break
+            if missing:
+                predictions = self.service._predict_batch(missing)
+                self.service._save_recommendations_to_cache_batch(predictions)
+                self.scored += len(predictions)
+            self.checked = offset + len(batch)
+            self._write_checkpoint(batch[-1])
+            self._report()
+            self._stop.wait(self.pause_sec)
+        else:
+            self._write_checkpoint(None, complete=True)
+            logger.info(f"Warm-up complete: {self.scored} of {self.total} student(s) needed scoring.")
+        return self.progress()
+
+    def start(self, restart: bool = False) -> None:
+        """Runs the warm-up on a daemon thread if it is not already running."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self.run, args=(restart,), name="recommendation-warmup", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Stops after the current batch; the checkpoint keeps the position."""
+        self._stop.set()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def progress(self) -> Dict[str, Any]:
+        """checked/total students, how many were scored, and the completed fraction."""
+        return {
+            'checked': self.checked,
+            'total': self.total,
+            'scored': self.scored,
+            'fraction': self.checked / self.total if self.total else 1.0,
+        }
+
+    # --- Internal Helpers ---
+
+    def _wait_until_idle(self) -> bool:
+        """Waits until no interactive lookup happened for WARMUP_IDLE_SEC. False if stopped."""
+        while not self._stop.is_set():
+            busy_for = GLOBAL_CONFIG.WARMUP_IDLE_SEC - (time.monotonic() - self.service.last_lookup_at)
+            if busy_for <= 0:
+                return True
+            self._stop.wait(busy_for)
+        return False
+
+    def _missing_ids(self, batch: List[int]) -> List[int] | None:
+        """Ids of the batch without a row of the current model version, or None on a DB error."""
+        placeholders = ", ".join(["%s"] * len(batch))
+        # fetch_columns returns {} only on failure, unlike fetch_all's [] for both cases
+        columns = db.fetch_columns(self.CURRENT_ROWS_QUERY.format(placeholders=placeholders),
+                                   (self.service.model_version, *batch), cache_ttl=0)
+        if not columns:
+            return None
+        current = set(columns['id_student'].astype(int).tolist())
+        return [sid for sid in batch if sid not in current]
+
+    def _report(self) -> None:
+        progress = self.progress()
+        logger.info(f"Warm-up: {progress['checked']}/{progress['total']} checked "
+                    f"({progress['fraction']:.0%}), {progress['scored']} scored.")
+        if self.on_progress is not None:
+            try:
+                self.on_progress(progress)
+            except Exception as e:
+                logger.error(f"Warm-up progress callback failed: {e}", exc_info=True)
+
+    def _read_checkpoint(self) -> int | None:
+        """Last checked id of an unfinished run of the current model version, if any."""
+        try:
+            data = json.loads(self.checkpoint_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if data.get('model_version') != self.service.model_version or data.get('complete'):
+            return None
+        last_id = data.get('last_id')
+        return int(last_id) if last_id is not None else None
+
+    def _write_checkpoint(self, last_id: int | None, complete: bool = False) -> None:
+        data = {'model_version': self.service.model_version, 'last_id': last_id, 'complete': complete,
+                'checked': self.checked, 'total': self.total, 'updated_at': time.time()}
+        tmp_path = self.checkpoint_path.with_name(self.checkpoint_path.name + ".tmp")
+        try:
+            self.checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(json.dumps(data), encoding="utf-8")
+            os.replace(tmp_path, self.checkpoint_path) # Atomic: a crash never leaves half a checkpoint
+        except OSError as e:
+            logger.warning(f"Could not write warm-up checkpoint {self.checkpoint_path}: {e}")
+
+
+if __name__ == "__main__":
+    warmup = RecommendationWarmup()
+    try:
+        result = warmup.run(restart="--restart" in sys.argv)
+    except KeyboardInterrupt:
+        result = warmup.progress()
+        print("Interrupted; run again to resume from the checkpoint.")
+    warmup.service.flush_cache_writes()
+    print(f"Checked {result['checked']}/{result['total']} students, scored {result['scored']}.")
@@ -0,0 +1,111 @@
+# inference/write_buffer.py
+import atexit
+import threading
+import time
+import weakref
+from typing import Dict, Iterable, Tuple
+
+from config.config import GLOBAL_CONFIG
+from database.execute_service import DBExecuteService as db
+from utils.logger import get_class_logger
+
+logger = get_class_logger(__name__, "RecommendationWriteBuffer")
+
+# Buffers still alive, flushed at interpreter exit by one handler that does not keep them alive
+_live_buffers: "weakref.WeakSet[RecommendationWriteBuffer]" = weakref.WeakSet()
+
+@atexit.register
+def _flush_live_buffers() -> None:
+    for buffer in list(_live_buffers):
+        buffer.flush()
+
+class RecommendationWriteBuffer:
+    """
+    Collects recommendation upserts and writes them with one bulk statement.
+
+    Rows are keyed by student (a newer prediction replaces a pending one) and
+    flushed through DBExecuteService.execute_many when max_rows are pending,
+    when the oldest pending row is max_age_sec old, on flush() and at
+    interpreter exit. A failed flush is logged and dropped: the table is
+    only a cache, so a lost row is simply predicted again on its next lookup.
+    """
+    def __init__(self, upsert_query: str, model_version: str | None = None,
+                 max_rows: int | None = None, max_age_sec: float | None = None):
+        """
+        Args:
+            upsert_query: INSERT ... ON DUPLICATE KEY UPDATE with (id_student, study, engagement, model_version) placeholders.
+            model_version: Fingerprint of the model that produced the buffered predictions.
+            max_rows: Pending rows that trigger a flush (default RECOMMENDATION_WRITE_BUFFER_SIZE).
+            max_age_sec: Max time a row waits before being flushed (default RECOMMENDATION_WRITE_BUFFER_MAX_AGE_SEC).
+        """
+        self.upsert_query = upsert_query
+        self.model_version = model_version
+        self.max_rows = max_rows or GLOBAL_CONFIG.RECOMMENDATION_WRITE_BUFFER_SIZE
+        self.max_age_sec = max_age_sec if max_age_sec is not None else GLOBAL_CONFIG.RECOMMENDATION_WRITE_BUFFER_MAX_AGE_SEC
+        self._pending: Dict[int, Tuple[int, int]] = {}
+        self._oldest_at: float | None = None
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock() # Keeps flushes ordered so an older batch never overwrites a newer one
+        self._timer: threading.Timer | None = None
+        self.flushed_rows = 0
+        self.flush_count = 0
+        _live_buffers.add(self)
+
+    def add(self, student_id: int, study_method_id: int, engagement_level_id: int) -> None:
+        """Queues one prediction."""
+        self.add_many([(student_id, study_method_id, engagement_level_id)])
+
+    def add_many(self, rows: Iterable[Tuple[int, int, int]]) -> None:
+        """Queues (id_student, study_method_id, engagement_level_id) rows, flushing every max_rows."""
+        for student_id, study_method_id, engagement_level_id in rows:
+            with self._lock:
+                self._pending[student_id] = (study_method_id, engagement_level_id)
+                if self._oldest_at is None:
+                    self._oldest_at = time.monotonic()
+                    self._schedule_age_flush()
+                full = len(self._pending) >= self.max_rows
+            if full:
+                self.flush()
+
+    def get(self, student_id: int) -> Tuple[int, int] | None:
+        """Pending (not yet written) prediction of a student, so reads see their own writes."""
+        with self._lock:
+            return self._pending.get(student_id)
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def flush(self) -> int:
+        """
+        Writes every pending row now.
+
+        Returns:
+            The number of rows written (0 if nothing was pending or the write failed).
+        """
+        with self._flush_lock:
+            with self._lock:
+                pending, self._pending = self._pending, {}
+                self._oldest_at = None
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+            if not pending:
+                return 0
+
+            rows = [(sid, study, engage, self.model_version) for sid, (study, engage) in pending.items()]
+            success: bool | int = db.execute_many(self.upsert_query, rows)
+            if success is False:
+                logger.warning(f"Failed to flush {len(rows)} buffered recommendation(s); they will be re-predicted on demand.")
+                return 0
+            self.flushed_rows += len(rows)
+            self.flush_count += 1
+            logger.debug(f"Flushed {len(rows)} buffered recommendation(s).")
+            return len(rows)
+
+    # --- Internal Helpers ---
+
+    def _schedule_age_flush(self) -> None:
+        """Caller holds _lock. Makes sure a lone write is flushed after max_age_sec."""
+        self._timer = threading.Timer(self.max_age_sec, self.flush)
+        self._timer.daemon = True
+        self._timer.start()
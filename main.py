@@ -1,11 +1,18 @@
 import sys
+from utils.import_profiler import profile_imports_from_env
+IMPORT_PROFILER = profile_imports_from_env() # IMPORT_PROFILE=1 logs per-module import cost
+from PyQt6.QtCore import QTimer
 from PyQt6.QtWidgets import QMainWindow, QApplication
 from application.home_page_ex import CourseManagementEx
+from database.summary.student_course_score import ensure_student_course_score_async
 from ui.home_page import Ui_MainWindow
 
 if __name__ == "__main__":
   app = QApplication(sys.argv)
   course_management = CourseManagementEx()
+  ensure_student_course_score_async(parent=course_management) # Score queries read the summary table; created on first run
   course_management.show()
+  if IMPORT_PROFILER:
+    QTimer.singleShot(0, lambda: IMPORT_PROFILER.report("startup"))
   sys.exit(app.exec())
   
\ No newline at end of file
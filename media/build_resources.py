@@ -0,0 +1,153 @@
+# media/build_resources.py
+"""
+Compiles media/resource_from_qt.qrc into the binary resource file media/resources.rcc.
+
+The binary file is registered at runtime with QResource.registerResource(),
+which memory-maps it, so icons and images are no longer parsed and copied
+out of a Python module on every launch.
+
+Uses Qt's `rcc -binary` when it is on the PATH (PyQt6 does not ship it);
+otherwise the file is written by the pure-Python writer below, which emits
+the same "qres" format (version 3, uncompressed payloads).
+
+Run with:  python -m media.build_resources
+"""
+import shutil
+import struct
+import subprocess
+import sys
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+from utils.logger import get_class_logger
+
+logger = get_class_logger(__name__, "ResourceBuilder")
+
+MEDIA_DIR = Path(__file__).resolve().parent
+QRC_PATH = MEDIA_DIR / "resource_from_qt.qrc"
+RCC_PATH = MEDIA_DIR / "resources.rcc"
+
+_FORMAT_VERSION = 3
+_FLAG_DIRECTORY = 0x02
+_LANGUAGE_C = 1 # QLocale::C
+_TERRITORY_ANY = 0 # QLocale::AnyTerritory
+
+
+def qrc_entries(qrc_path: Path = QRC_PATH) -> list[tuple[str, Path]]:
+    """Returns (resource path, source file) pairs listed in a .qrc file, e.g. ("Icons/images/x.png", ...)."""
+    root = ET.parse(qrc_path).getroot()
+    entries = []
+    for qresource in root.iter("qresource"):
+        prefix = (qresource.get("prefix") or "").strip("/")
+        for file_node in qresource.iter("file"):
+            relative = file_node.text.strip()
+            alias = (file_node.get("alias") or relative).lstrip("/")
+            resource_path = f"{prefix}/{alias}" if prefix else alias
+            entries.append((resource_path, (qrc_path.parent / relative).resolve()))
+    return entries
+
+
+def is_stale(qrc_path: Path = QRC_PATH, rcc_path: Path = RCC_PATH) -> bool:
+    """True when the .rcc is missing or older than the .qrc or any file it lists."""
+    if not rcc_path.exists():
+        return True
+    built_at = rcc_path.stat().st_mtime_ns
+    sources = [qrc_path] + [source for _, source in qrc_entries(qrc_path)]
+    return any(not source.exists() or source.stat().st_mtime_ns > built_at for source in sources)
+
+
+def build(qrc_path: Path = QRC_PATH, rcc_path: Path = RCC_PATH) -> Path:
+    """
+    Compiles the .qrc into a binary .rcc file.
+
+    Returns:
+        The path of the written .rcc file.
+    """
+    rcc_tool = shutil.which("rcc")
+    tmp_path = rcc_path.with_name(rcc_path.name + ".tmp")
+    if rcc_tool:
+        subprocess.run([rcc_tool, "-binary", str(qrc_path), "-o", str(tmp_path)], check=True)
+    else:
+        tmp_path.write_bytes(_compile(qrc_entries(qrc_path)))
+    tmp_path.replace(rcc_path) # Never leave a half-written file behind for a running app
+    logger.info(f"Compiled {qrc_path.name} -> {rcc_path} ({rcc_path.stat().st_size} bytes).")
+    return rcc_path
+
+
+# --- Binary Writer ---
+
+def _qt_hash(name: str) -> int:
+    """Qt's qt_hash() over UTF-16 code units; used to order and look up tree nodes."""
+    h = 0
+    for unit in struct.unpack(f">{len(name.encode('utf-16-be')) // 2}H", name.encode("utf-16-be")):
+        h = (h << 4) + unit
+        h ^= (h & 0xF0000000) >> 23
+        h &= 0x0FFFFFFF
+    return h
+
+
+class _Node:
+    def __init__(self, name: str, source: Path | None = None):
+        self.name = name
+        self.source = source
+        self.children: dict[str, _Node] = {}
+
+    @property
+    def is_dir(self) -> bool:
+        return self.source is None
+
+    def sorted_children(self) -> list["_Node"]:
+        return sorted(self.children.values(), key=lambda node: _qt_hash(node.name))
+
+
+def _compile(entries: list[tuple[str, Path]]) -> bytes:
+    root = _Node("")
+    for resource_path, source in entries:
+        node = root
+        *dirs, file_name = resource_path.split("/")
+        for part in dirs:
+            node = node.children.setdefault(part, _Node(part))
+        node.children[file_name] = _Node(file_name, source)
+
+    # Nodes in breadth-first order; the children of a directory are contiguous
+    ordered = [root]
+    for node in ordered:
+        if node.is_dir:
+            ordered.extend(node.sorted_children())
+    index_of = {id(node): i for i, node in enumerate(ordered)}
+
+    data = bytearray()
+    data_offsets: dict[int, int] = {}
+    names = bytearray()
+    name_offsets: dict[str, int] = {}
+    for node in ordered[1:]:
+        if node.name not in name_offsets:
+            name_offsets[node.name] = len(names)
+            encoded = node.name.encode("utf-16-be")
+            names += struct.pack(">HI", len(encoded) // 2, _qt_hash(node.name)) + encoded
+        if not node.is_dir:
+            payload = node.source.read_bytes()
+            data_offsets[id(node)] = len(data)
+            data += struct.pack(">I", len(payload)) + payload
+
+    tree = bytearray()
+    for node in ordered:
+        name_offset = name_offsets.get(node.name, 0)
+        if node.is_dir:
+            children = node.sorted_children()
+            first_child = index_of[id(children[0])] if children else 0
+            tree += struct.pack(">IHII", name_offset, _FLAG_DIRECTORY, len(children), first_child)
+        else:
+            tree += struct.pack(">IHHHI", name_offset, 0, _TERRITORY_ANY, _LANGUAGE_C, data_offsets[id(node)])
+        tree += struct.pack(">Q", 0) # Last modified (ms since epoch); 0 = unknown
+
+    header_size = 4 + 5 * 4
+    data_offset = header_size
+    names_offset = data_offset + len(data)
+    tree_offset = names_offset + len(names)
+    header = b"qres" + struct.pack(">IIIII", _FORMAT_VERSION, tree_offset, data_offset, names_offset, 0)
+    return header + bytes(data) + bytes(names) + bytes(tree)
+
+
+if __name__ == "__main__":
+    build(Path(sys.argv[1]) if len(sys.argv) > 1 else QRC_PATH)
@@ -0,0 +1,43 @@
+# media/resources.py
+from PyQt6.QtCore import QResource
+
+from config.config import GLOBAL_CONFIG
+from media import build_resources
+from utils.logger import get_class_logger
+
+logger = get_class_logger(__name__, "Resources")
+
+_loaded = False
+
+
+def load_resources() -> bool:
+    """
+    Registers the application's Qt resources (the ":/Icons/..." and ":/Images/..." paths).
+
+    With QT_RESOURCE_MODE=rcc (default) the compiled media/resources.rcc is
+    memory-mapped by Qt; it is (re)built first when missing or older than the
+    .qrc sources. With QT_RESOURCE_MODE=python, or if the .rcc cannot be built
+    or registered, the generated module media/resource_from_qt.py is imported.
+    Safe to call more than once.
+
+    Returns:
+        True if the resources are available.
+    """
+    global _loaded
+    if _loaded:
+        return True
+
+    if GLOBAL_CONFIG.QT_RESOURCE_MODE == "rcc":
+        try:
+            if build_resources.is_stale():
+                build_resources.build()
+            _loaded = QResource.registerResource(str(build_resources.RCC_PATH))
+            if not _loaded:
+                logger.warning(f"Qt rejected {build_resources.RCC_PATH}; falling back to the Python resource module.")
+        except Exception as e:
+            logger.warning(f"Could not build {build_resources.RCC_PATH} ({e}); falling back to the Python resource module.")
+
+    if not _loaded:
+        import media.resource_from_qt # Registers its embedded data on import
+        _loaded = True
+    return _loaded
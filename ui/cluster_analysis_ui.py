@@ -367,7 +367,7 @@ class Ui_MainWindow(object):
         self.horizontalLayout_8 = QtWidgets.QHBoxLayout(self.frame_6)
         self.horizontalLayout_8.setContentsMargins(0, 0, 5, 0)
         self.horizontalLayout_8.setObjectName("horizontalLayout_8")
-        self.analysis_table = QtWidgets.QTableWidget(parent=self.frame_6)
+        self.analysis_table = QtWidgets.QTableView(parent=self.frame_6)
         sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Maximum, QtWidgets.QSizePolicy.Policy.Expanding)
         sizePolicy.setHorizontalStretch(0)
         sizePolicy.setVerticalStretch(0)
@@ -376,14 +376,6 @@ class Ui_MainWindow(object):
         self.analysis_table.setMinimumSize(QtCore.QSize(420, 0))
         self.analysis_table.setStyleSheet("color: black")
         self.analysis_table.setObjectName("analysis_table")
-        self.analysis_table.setColumnCount(3)
-        self.analysis_table.setRowCount(0)
-        item = QtWidgets.QTableWidgetItem()
-        self.analysis_table.setHorizontalHeaderItem(0, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.analysis_table.setHorizontalHeaderItem(1, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.analysis_table.setHorizontalHeaderItem(2, item)
         self.analysis_table.horizontalHeader().setDefaultSectionSize(140)
         self.horizontalLayout_8.addWidget(self.analysis_table)
         self.widget = QtWidgets.QWidget(parent=self.frame_6)
@@ -543,12 +535,6 @@ class Ui_MainWindow(object):
         self.analysis_filter.setText(_translate("MainWindow", "Filter"))
         self.analysis_create.setText(_translate("MainWindow", "+ Create"))
         self.header.setText(_translate("MainWindow", " Analysis"))
-        item = self.analysis_table.horizontalHeaderItem(0)
-        item.setText(_translate("MainWindow", "Code module"))
-        item = self.analysis_table.horizontalHeaderItem(1)
-        item.setText(_translate("MainWindow", "Code presentation"))
-        item = self.analysis_table.horizontalHeaderItem(2)
-        item.setText(_translate("MainWindow", "ID Student"))
         self.analysis_previous.setText(_translate("MainWindow", "<- Previous"))
         self.analysis_page_1.setText(_translate("MainWindow", "1"))
         self.analysis_page_2.setText(_translate("MainWindow", "2"))
@@ -392,19 +392,9 @@ class Ui_MainWindow(object):
         self.frame_6.setObjectName("frame_6")
         self.horizontalLayout_8 = QtWidgets.QHBoxLayout(self.frame_6)
         self.horizontalLayout_8.setObjectName("horizontalLayout_8")
-        self.course_assessment_table = QtWidgets.QTableWidget(parent=self.frame_6)
+        self.course_assessment_table = QtWidgets.QTableView(parent=self.frame_6)
         self.course_assessment_table.setStyleSheet("color: black")
         self.course_assessment_table.setObjectName("course_assessment_table")
-        self.course_assessment_table.setColumnCount(4)
-        self.course_assessment_table.setRowCount(0)
-        item = QtWidgets.QTableWidgetItem()
-        self.course_assessment_table.setHorizontalHeaderItem(0, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.course_assessment_table.setHorizontalHeaderItem(1, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.course_assessment_table.setHorizontalHeaderItem(2, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.course_assessment_table.setHorizontalHeaderItem(3, item)
         self.course_assessment_table.horizontalHeader().setDefaultSectionSize(152)
         self.horizontalLayout_8.addWidget(self.course_assessment_table)
         self.verticalLayout_2.addWidget(self.frame_6)
@@ -555,14 +545,6 @@ class Ui_MainWindow(object):
         self.course_assessment_search_lineEdit.setPlaceholderText(_translate("MainWindow", "Search"))
         self.course_assessment_filter.setText(_translate("MainWindow", "Filter"))
         self.course_assessment_create.setText(_translate("MainWindow", "+ Create"))
-        item = self.course_assessment_table.horizontalHeaderItem(0)
-        item.setText(_translate("MainWindow", "ID Assessment"))
-        item = self.course_assessment_table.horizontalHeaderItem(1)
-        item.setText(_translate("MainWindow", "Assessment type"))
-        item = self.course_assessment_table.horizontalHeaderItem(2)
-        item.setText(_translate("MainWindow", "Date"))
-        item = self.course_assessment_table.horizontalHeaderItem(3)
-        item.setText(_translate("MainWindow", "Weight"))
         self.course_assessment_previous.setText(_translate("MainWindow", "<- Previous"))
         self.course_assessment_page_1.setText(_translate("MainWindow", "1"))
         self.course_assessment_page_2.setText(_translate("MainWindow", "2"))
@@ -391,21 +391,9 @@ class Ui_MainWindow(object):
         self.frame_6.setObjectName("frame_6")
         self.horizontalLayout_8 = QtWidgets.QHBoxLayout(self.frame_6)
         self.horizontalLayout_8.setObjectName("horizontalLayout_8")
-        self.course_student_table = QtWidgets.QTableWidget(parent=self.frame_6)
+        self.course_student_table = QtWidgets.QTableView(parent=self.frame_6)
         self.course_student_table.setStyleSheet("color: black")
         self.course_student_table.setObjectName("course_student_table")
-        self.course_student_table.setColumnCount(5)
-        self.course_student_table.setRowCount(0)
-        item = QtWidgets.QTableWidgetItem()
-        self.course_student_table.setHorizontalHeaderItem(0, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.course_student_table.setHorizontalHeaderItem(1, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.course_student_table.setHorizontalHeaderItem(2, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.course_student_table.setHorizontalHeaderItem(3, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.course_student_table.setHorizontalHeaderItem(4, item)
         self.course_student_table.horizontalHeader().setDefaultSectionSize(140)
         self.horizontalLayout_8.addWidget(self.course_student_table)
         self.verticalLayout_2.addWidget(self.frame_6)
@@ -557,16 +545,6 @@ class Ui_MainWindow(object):
         self.course_student_search_lineEdit.setPlaceholderText(_translate("MainWindow", "Search"))
         self.course_student_filter.setText(_translate("MainWindow", "Filter"))
         self.course_student_create.setText(_translate("MainWindow", "+ Create"))
-        item = self.course_student_table.horizontalHeaderItem(0)
-        item.setText(_translate("MainWindow", "ID Student"))
-        item = self.course_student_table.horizontalHeaderItem(1)
-        item.setText(_translate("MainWindow", "Date Registration"))
-        item = self.course_student_table.horizontalHeaderItem(2)
-        item.setText(_translate("MainWindow", "Date Unregistration"))
-        item = self.course_student_table.horizontalHeaderItem(3)
-        item.setText(_translate("MainWindow", "ID Assessment"))
-        item = self.course_student_table.horizontalHeaderItem(4)
-        item.setText(_translate("MainWindow", "Score"))
         self.course_student_previous.setText(_translate("MainWindow", "<- Previous"))
         self.course_student_page_1.setText(_translate("MainWindow", "1"))
         self.course_student_page_2.setText(_translate("MainWindow", "2"))
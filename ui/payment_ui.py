@@ -370,25 +370,9 @@ class Ui_MainWindow(object):
         self.frame_6.setObjectName("frame_6")
         self.horizontalLayout_8 = QtWidgets.QHBoxLayout(self.frame_6)
         self.horizontalLayout_8.setObjectName("horizontalLayout_8")
-        self.payment_table = QtWidgets.QTableWidget(parent=self.frame_6)
+        self.payment_table = QtWidgets.QTableView(parent=self.frame_6)
         self.payment_table.setStyleSheet("color: black")
         self.payment_table.setObjectName("payment_table")
-        self.payment_table.setColumnCount(7)
-        self.payment_table.setRowCount(0)
-        item = QtWidgets.QTableWidgetItem()
-        self.payment_table.setHorizontalHeaderItem(0, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.payment_table.setHorizontalHeaderItem(1, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.payment_table.setHorizontalHeaderItem(2, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.payment_table.setHorizontalHeaderItem(3, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.payment_table.setHorizontalHeaderItem(4, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.payment_table.setHorizontalHeaderItem(5, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.payment_table.setHorizontalHeaderItem(6, item)
         self.payment_table.horizontalHeader().setDefaultSectionSize(150)
         self.horizontalLayout_8.addWidget(self.payment_table)
         self.verticalLayout_2.addWidget(self.frame_6)
@@ -540,20 +524,6 @@ class Ui_MainWindow(object):
         self.payment_filter.setText(_translate("MainWindow", "Filter"))
         self.payment_create.setText(_translate("MainWindow", "+ Create"))
         self.header.setText(_translate("MainWindow", " Payment"))
-        item = self.payment_table.horizontalHeaderItem(0)
-        item.setText(_translate("MainWindow", "ID Invoice"))
-        item = self.payment_table.horizontalHeaderItem(1)
-        item.setText(_translate("MainWindow", "ID Student"))
-        item = self.payment_table.horizontalHeaderItem(2)
-        item.setText(_translate("MainWindow", "Code Module"))
-        item = self.payment_table.horizontalHeaderItem(3)
-        item.setText(_translate("MainWindow", "Code Presentation"))
-        item = self.payment_table.horizontalHeaderItem(4)
-        item.setText(_translate("MainWindow", "Date"))
-        item = self.payment_table.horizontalHeaderItem(5)
-        item.setText(_translate("MainWindow", "Amount"))
-        item = self.payment_table.horizontalHeaderItem(6)
-        item.setText(_translate("MainWindow", "Status"))
         self.payment_previous.setText(_translate("MainWindow", "<- Previous"))
         self.payment_page_1.setText(_translate("MainWindow", "1"))
         self.payment_page_2.setText(_translate("MainWindow", "2"))
@@ -373,31 +373,9 @@ class Ui_MainWindow(object):
         self.frame_6.setObjectName("frame_6")
         self.horizontalLayout_8 = QtWidgets.QHBoxLayout(self.frame_6)
         self.horizontalLayout_8.setObjectName("horizontalLayout_8")
-        self.student_table = QtWidgets.QTableWidget(parent=self.frame_6)
+        self.student_table = QtWidgets.QTableView(parent=self.frame_6)
         self.student_table.setStyleSheet("color: black")
         self.student_table.setObjectName("student_table")
-        self.student_table.setColumnCount(10)
-        self.student_table.setRowCount(0)
-        item = QtWidgets.QTableWidgetItem()
-        self.student_table.setHorizontalHeaderItem(0, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.student_table.setHorizontalHeaderItem(1, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.student_table.setHorizontalHeaderItem(2, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.student_table.setHorizontalHeaderItem(3, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.student_table.setHorizontalHeaderItem(4, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.student_table.setHorizontalHeaderItem(5, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.student_table.setHorizontalHeaderItem(6, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.student_table.setHorizontalHeaderItem(7, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.student_table.setHorizontalHeaderItem(8, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.student_table.setHorizontalHeaderItem(9, item)
         self.student_table.horizontalHeader().setDefaultSectionSize(150)
         self.horizontalLayout_8.addWidget(self.student_table)
         self.verticalLayout_2.addWidget(self.frame_6)
@@ -552,26 +530,6 @@ class Ui_MainWindow(object):
         self.student_filter.setText(_translate("MainWindow", "Filter"))
         self.student_create.setText(_translate("MainWindow", "+ Create"))
         self.header.setText(_translate("MainWindow", " Profile"))
-        item = self.student_table.horizontalHeaderItem(0)
-        item.setText(_translate("MainWindow", "Code module"))
-        item = self.student_table.horizontalHeaderItem(1)
-        item.setText(_translate("MainWindow", "Code presentation"))
-        item = self.student_table.horizontalHeaderItem(2)
-        item.setText(_translate("MainWindow", "ID student"))
-        item = self.student_table.horizontalHeaderItem(3)
-        item.setText(_translate("MainWindow", "Gender"))
-        item = self.student_table.horizontalHeaderItem(4)
-        item.setText(_translate("MainWindow", "Region"))
-        item = self.student_table.horizontalHeaderItem(5)
-        item.setText(_translate("MainWindow", "Highest education"))
-        item = self.student_table.horizontalHeaderItem(6)
-        item.setText(_translate("MainWindow", "IMB band"))
-        item = self.student_table.horizontalHeaderItem(7)
-        item.setText(_translate("MainWindow", "Age band"))
-        item = self.student_table.horizontalHeaderItem(8)
-        item.setText(_translate("MainWindow", "Previous attempt"))
-        item = self.student_table.horizontalHeaderItem(9)
-        item.setText(_translate("MainWindow", "Studied credit"))
         self.student_previous.setText(_translate("MainWindow", "<- Previous"))
         self.student_page_1.setText(_translate("MainWindow", "1"))
         self.student_page_2.setText(_translate("MainWindow", "2"))
@@ -0,0 +1,147 @@
+# utils/async_task.py
+from __future__ import annotations # Allow type hinting TaskHandle within the module
+import itertools
+import threading
+from typing import Any, Callable
+
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal, pyqtSlot
+from utils.logger import get_class_logger
+
+class TaskHandle:
+    """
+    Handle of a task submitted to an AsyncTaskRunner.
+
+    Cancelling a handle guarantees its callbacks are never invoked. If the task
+    has not started yet it is also removed from the thread pool queue.
+    """
+    def __init__(self, task_id: int, runner: AsyncTaskRunner):
+        self.task_id = task_id
+        self._runner = runner
+        self._cancel_event = threading.Event()
+        self._done = False
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+
+    @property
+    def done(self) -> bool:
+        return self._done
+
+    def cancel(self) -> None:
+        """Drops the task: queued work is skipped and late results are discarded."""
+        if self._done or self.cancelled:
+            return
+        self._cancel_event.set()
+        self._runner._forget(self)
+
+
+class _TaskRunnable(QRunnable):
+    """QRunnable that runs one callable on a pool thread and reports back through a signal."""
+    def __init__(self, handle: TaskHandle, fn: Callable, args: tuple, kwargs: dict, finished_signal):
+        super().__init__()
+        self.handle = handle
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.finished_signal = finished_signal
+
+    def run(self):
+        if self.handle.cancelled:
+            return
+        try:
+            result = self.fn(*self.args, **self.kwargs)
+            error = None
+        except Exception as e:
+            result, error = None, e
+        if self.handle.cancelled:
+            return
+        try:
+            self.finished_signal.emit(self.handle.task_id, result, error)
+        except RuntimeError:
+            pass # The owning runner was destroyed while the task was running
+
+
+class AsyncTaskRunner(QObject):
+    """
+    Runs blocking callables on a QThreadPool and delivers results on the GUI thread.
+
+    Callbacks passed to submit() are invoked through a queued signal, so they
+    always run in the thread that owns the runner (normally the GUI thread) and
+    may safely touch widgets. Each page should own its runner and call
+    cancel_all() when it is hidden so in-flight work is dropped.
+    """
+    _task_finished = pyqtSignal(int, object, object)
+    _ids = itertools.count(1)
+
+    def __init__(self, parent: QObject | None = None, thread_pool: QThreadPool | None = None):
+        super().__init__(parent)
+        self.logger = get_class_logger(__name__, self.__class__.__name__)
+        self.thread_pool = thread_pool if thread_pool is not None else QThreadPool.globalInstance()
+        self._pending: dict[int, tuple[TaskHandle, _TaskRunnable, Callable | None, Callable | None]] = {}
+        self._task_finished.connect(self._on_task_finished)
+
+    def submit(self, fn: Callable, *args,
+               on_result: Callable[[Any], None] | None = None,
+               on_error: Callable[[Exception], None] | None = None,
+               **kwargs) -> TaskHandle:
+        """
+        Schedules fn(*args, **kwargs) on the thread pool.
+
+        Args:
+            fn: Blocking callable to run off the GUI thread.
+            on_result: Called with the return value on the GUI thread.
+            on_error: Called with the raised exception on the GUI thread.
+
+        Returns:
+            A TaskHandle that can cancel the task.
+        """
+        handle = TaskHandle(next(self._ids), self)
+        runnable = _TaskRunnable(handle, fn, args, kwargs, self._task_finished)
+        self._pending[handle.task_id] = (handle, runnable, on_result, on_error)
+        self.thread_pool.start(runnable)
+        self.logger.debug(f"Submitted task {handle.task_id} ({getattr(fn, '__name__', fn)}).")
+        return handle
+
+    def cancel_all(self) -> None:
+        """Cancels every task that has not delivered its result yet."""
+        handles = [entry[0] for entry in self._pending.values()]
+        for handle in handles:
+            handle.cancel()
+        if handles:
+            self.logger.info(f"Cancelled {len(handles)} in-flight task(s).")
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._pending)
+
+    def _forget(self, handle: TaskHandle) -> None:
+        """Removes a cancelled task; dequeues it if it has not started yet."""
+        entry = self._pending.pop(handle.task_id, None)
+        if entry is None:
+            return
+        try:
+            self.thread_pool.tryTake(entry[1])
+        except RuntimeError:
+            pass # Already started and deleted by the pool; the cancel flag drops its result
+
+    @pyqtSlot(int, object, object)
+    def _on_task_finished(self, task_id: int, result: Any, error: Exception | None) -> None:
+        entry = self._pending.pop(task_id, None)
+        if entry is None:
+            return # Cancelled while the result was in flight
+        handle, _, on_result, on_error = entry
+        handle._done = True
+        if handle.cancelled:
+            return
+
+        try:
+            if error is not None:
+                if on_error:
+                    on_error(error)
+                else:
+                    self.logger.error(f"Task {task_id} failed: {error}", exc_info=error)
+            elif on_result:
+                on_result(result)
+        except Exception as e:
+            self.logger.error(f"Callback of task {task_id} raised: {e}", exc_info=True)
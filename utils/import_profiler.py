@@ -0,0 +1,106 @@
+# utils/import_profiler.py
+"""
+Per-module import cost instrumentation.
+
+Start the app with IMPORT_PROFILE=1 to log, once the first window has painted
+and again at exit, which modules were imported and how long each took
+(inclusive = with everything it imported, self = its own module body).
+IMPORT_PROFILE_TOP sets how many modules are listed (default 30).
+
+This module only uses the standard library so it can be installed before
+any other application import.
+"""
+import atexit
+import builtins
+import importlib.util
+import os
+import sys
+import threading
+import time
+
+
+class ImportProfiler:
+    """Times every import statement that loads a module not yet in sys.modules."""
+
+    def __init__(self):
+        self._records: dict[str, list[float]] = {} # module -> [inclusive_sec, self_sec]
+        self._lock = threading.Lock()
+        self._local = threading.local() # per-thread stack of child-time accumulators
+        self._original_import = None
+        self.installed_at = 0.0
+
+    def install(self) -> None:
+        if self._original_import is not None:
+            return
+        self._original_import = builtins.__import__
+        builtins.__import__ = self._timed_import
+        self.installed_at = time.perf_counter()
+
+    def uninstall(self) -> None:
+        if self._original_import is not None:
+            builtins.__import__ = self._original_import
+            self._original_import = None
+
+    def records(self) -> list[tuple[str, float, float]]:
+        """Returns (module, inclusive_ms, self_ms), most expensive first."""
+        with self._lock:
+            rows = [(name, incl * 1000, own * 1000) for name, (incl, own) in self._records.items()]
+        return sorted(rows, key=lambda row: row[1], reverse=True)
+
+    def report(self, label: str, top: int | None = None) -> list[tuple[str, float, float]]:
+        """Logs the most expensive imports so far and returns all records."""
+        from utils.logger import get_class_logger
+        logger = get_class_logger(__name__, "ImportProfiler")
+
+        top = top if top is not None else int(os.getenv("IMPORT_PROFILE_TOP", 30))
+        rows = self.records()
+        elapsed = (time.perf_counter() - self.installed_at) * 1000
+        lines = [f"{'inclusive ms':>12} {'self ms':>9}  module"]
+        lines += [f"{incl:12.1f} {own:9.1f}  {name}" for name, incl, own in rows[:top]]
+        logger.info(f"[{label}] {len(rows)} modules imported, {elapsed:.0f} ms since profiling started:\n" + "\n".join(lines))
+        return rows
+
+    # --- Internal Helpers ---
+
+    def _timed_import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        target = self._resolve(name, globals, level)
+        if target is None or target in sys.modules:
+            return self._original_import(name, globals, locals, fromlist, level)
+
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            return self._original_import(name, globals, locals, fromlist, level)
+        finally:
+            inclusive = time.perf_counter() - start
+            children = stack.pop()
+            if stack:
+                stack[-1] += inclusive
+            if target in sys.modules:
+                with self._lock:
+                    self._records[target] = [inclusive, inclusive - children]
+
+    @staticmethod
+    def _resolve(name: str, globals, level: int) -> str | None:
+        if level == 0:
+            return name
+        package = (globals or {}).get("__package__") or (globals or {}).get("__name__")
+        if not package:
+            return None
+        try:
+            return importlib.util.resolve_name("." * level + name, package)
+        except ImportError:
+            return None
+
+
+def profile_imports_from_env() -> ImportProfiler | None:
+    """Installs an ImportProfiler (reporting again at exit) when IMPORT_PROFILE is set."""
+    if os.getenv("IMPORT_PROFILE", "").lower() not in ("1", "true", "yes"):
+        return None
+    profiler = ImportProfiler()
+    profiler.install()
+    atexit.register(profiler.report, "session")
+    return profiler
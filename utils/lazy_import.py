@@ -0,0 +1,72 @@
+# utils/lazy_import.py
+import sys
+import threading
+import time
+import types
+from typing import Any
+
+from utils.logger import get_class_logger
+
+logger = get_class_logger(__name__, "LazyModule")
+
+
+class LazyModule(types.ModuleType):
+    """
+    Stand-in for a module that is imported on first attribute access.
+
+    Lets heavy stacks (pandas, seaborn, pyplot, joblib, ...) be declared at the
+    top of a file as usual while only being loaded when a code path actually
+    uses them:
+
+        pd = lazy_import("pandas")
+        ...
+        df = pd.DataFrame(rows) # pandas is imported here, once
+    """
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.__dict__["_lazy_module"] = None
+        self.__dict__["_lazy_lock"] = threading.Lock()
+
+    # Method names are prefixed so they never shadow the real module's attributes (e.g. joblib.load)
+    def _lazy_load(self) -> types.ModuleType:
+        """Imports the real module (if not done yet) and returns it."""
+        module = self.__dict__["_lazy_module"]
+        if module is not None:
+            return module
+        with self.__dict__["_lazy_lock"]:
+            module = self.__dict__["_lazy_module"]
+            if module is None:
+                already_loaded = self.__name__ in sys.modules
+                start = time.perf_counter()
+                __import__(self.__name__) # Goes through builtins.__import__, so ImportProfiler sees it
+                module = sys.modules[self.__name__]
+                if not already_loaded:
+                    logger.debug(f"Imported '{self.__name__}' on first use in {(time.perf_counter() - start) * 1000:.1f} ms.")
+                self.__dict__["_lazy_module"] = module
+        return module
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._lazy_load(), attr)
+
+    def __dir__(self) -> list[str]:
+        return dir(self._lazy_load())
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.__dict__["_lazy_module"] is not None else "not loaded"
+        return f"<lazy module '{self.__name__}' ({state})>"
+
+
+def lazy_import(name: str) -> types.ModuleType:
+    """
+    Returns the module if it is already imported, otherwise a LazyModule proxy.
+
+    Args:
+        name: Absolute module name, e.g. "matplotlib.pyplot".
+    """
+    module = sys.modules.get(name)
+    return module if module is not None else LazyModule(name)
+
+
+def is_loaded(module: types.ModuleType) -> bool:
+    """True for real modules and for LazyModule proxies whose module has been imported."""
+    return not isinstance(module, LazyModule) or module.__dict__["_lazy_module"] is not None
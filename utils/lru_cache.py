@@ -0,0 +1,119 @@
+# utils/lru_cache.py
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+_MISSING = object()
+
+class TTLLRUCache:
+    """
+    Thread-safe LRU cache with per-entry TTL, optional memory bound and hit/miss stats.
+
+    Entries are evicted least-recently-used first when max_entries or
+    max_bytes is exceeded; sizes come from size_of (a rough estimate is fine).
+    """
+    def __init__(self, max_entries: int = 256, default_ttl_sec: float | None = None,
+                 max_bytes: int | None = None, size_of: Callable[[Any], int] | None = None):
+        """
+        Args:
+            max_entries: Maximum number of entries kept.
+            default_ttl_sec: Lifetime of entries stored without an explicit TTL (None = no expiry).
+            max_bytes: Optional bound on the summed size estimate of all values.
+            size_of: Size estimator used with max_bytes (defaults to sys.getsizeof).
+        """
+        self.max_entries = max_entries
+        self.default_ttl_sec = default_ttl_sec
+        self.max_bytes = max_bytes
+        self.size_of = size_of or sys.getsizeof
+        self._entries: OrderedDict[Hashable, tuple[Any, float | None, int]] = OrderedDict() # key -> (value, expires_at, size)
+        self._bytes = 0
+        self._lock = threading.RLock()
+        self._stats = {'hits': 0, 'misses': 0, 'evictions': 0, 'expirations': 0, 'invalidations': 0}
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Returns the cached value (marking it recently used) or default."""
+        with self._lock:
+            entry = self._entries.get(key, _MISSING)
+            if entry is _MISSING:
+                self._stats['misses'] += 1
+                return default
+            value, expires_at, _ = entry
+            if expires_at is not None and time.monotonic() >= expires_at:
+                self._remove(key)
+                self._stats['expirations'] += 1
+                self._stats['misses'] += 1
+                return default
+            self._entries.move_to_end(key)
+            self._stats['hits'] += 1
+            return value
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            entry = self._entries.get(key, _MISSING)
+            return entry is not _MISSING and (entry[1] is None or time.monotonic() < entry[1])
+
+    def set(self, key: Hashable, value: Any, ttl_sec: float | None = None) -> None:
+        """Stores a value; ttl_sec overrides default_ttl_sec for this entry."""
+        ttl_sec = self.default_ttl_sec if ttl_sec is None else ttl_sec
+        expires_at = time.monotonic() + ttl_sec if ttl_sec is not None else None
+        size = self.size_of(value) if self.max_bytes is not None else 0
+        if self.max_bytes is not None and size > self.max_bytes:
+            return # Larger than the whole cache; not worth evicting everything else
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (value, expires_at, size)
+            self._bytes += size
+            self._evict_overflow()
+
+    def invalidate(self, key: Hashable) -> bool:
+        """Removes one entry; returns True if it was present."""
+        with self._lock:
+            if key not in self._entries:
+                return False
+            self._remove(key)
+            self._stats['invalidations'] += 1
+            return True
+
+    def invalidate_where(self, predicate: Callable[[Hashable], bool]) -> int:
+        """Removes every entry whose key matches predicate; returns how many were removed."""
+        with self._lock:
+            keys = [key for key in self._entries if predicate(key)]
+            for key in keys:
+                self._remove(key)
+            self._stats['invalidations'] += len(keys)
+            return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._stats['invalidations'] += len(self._entries)
+            self._entries.clear()
+            self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> dict:
+        """Returns counters plus current size and hit rate."""
+        with self._lock:
+            snapshot = dict(self._stats)
+            snapshot['entries'] = len(self._entries)
+            snapshot['bytes'] = self._bytes
+            lookups = snapshot['hits'] + snapshot['misses']
+            snapshot['hit_rate'] = snapshot['hits'] / lookups if lookups else 0.0
+        return snapshot
+
+    # --- Internal Helpers ---
+
+    def _remove(self, key: Hashable) -> None:
+        _, _, size = self._entries.pop(key)
+        self._bytes -= size
+
+    def _evict_overflow(self) -> None:
+        while self._entries and (len(self._entries) > self.max_entries or
+                                 (self.max_bytes is not None and self._bytes > self.max_bytes)):
+            key = next(iter(self._entries))
+            self._remove(key)
+            self._stats['evictions'] += 1
@@ -1,16 +1,62 @@
-from database.course.course import get_dropout_percentage
+import math
+
 from utils.plot.plot_manager import PlotManager, MplCanvas
 from PyQt6.QtWidgets import QWidget
 
 class CourseInfoVisualizer():
+  PIE_KIND = 'dropout_pie' # Retained-artist key on MplCanvas
+  # ax.pie defaults, reproduced when wedges are updated in place
+  LABEL_DISTANCE = 1.1
+  PCT_DISTANCE = 0.6
+
   @staticmethod
   def create_dropout_rate_pie(data: dict, target_widget: QWidget) -> PlotManager:
-    
+
     canvas = PlotManager._find_or_create_canvas(target_widget=target_widget)
-    
+
     ax = canvas.axes
     fig = canvas.figure
-    
-    drop_out_dict = data
-    ax.pie(x=drop_out_dict.values(), labels= drop_out_dict.keys(), autopct="%1.1f%%")
-    return PlotManager(figure=fig, axes=ax)
\ No newline at end of file
+
+    drop_out_dict = data or {}
+    retained = canvas.retained(CourseInfoVisualizer.PIE_KIND)
+    if retained is not None and CourseInfoVisualizer._update_pie(canvas, retained, drop_out_dict):
+      return PlotManager(figure=fig, axes=ax)
+
+    canvas.forget_retained()
+    ax.clear()
+    if not drop_out_dict:
+      ax.text(0.5, 0.5, "No registrations", ha='center', va='center', transform=ax.transAxes)
+      ax.set_xticks([]); ax.set_yticks([])
+    else:
+      wedges, texts, autotexts = ax.pie(x=list(drop_out_dict.values()), labels=list(drop_out_dict.keys()), autopct="%1.1f%%")
+      canvas.retain(CourseInfoVisualizer.PIE_KIND, {'labels': list(drop_out_dict.keys()), 'wedges': wedges,
+                                                    'texts': texts, 'autotexts': autotexts})
+    canvas._is_empty = not drop_out_dict
+    canvas.draw_idle()
+    return PlotManager(figure=fig, axes=ax)
+
+  @staticmethod
+  def _update_pie(canvas: MplCanvas, artists: dict, data: dict) -> bool:
+    """Re-angles the retained wedges and moves their labels; False if the slices differ."""
+    if list(data.keys()) != artists['labels'] or sum(data.values()) <= 0:
+      return False
+    total = float(sum(data.values()))
+    theta1 = 0.0
+    for value, wedge, text, autotext in zip(data.values(), artists['wedges'], artists['texts'], artists['autotexts']):
+      frac = value / total # Same as ax.pie(normalize=True), the default
+      theta2 = theta1 + 360.0 * frac
+      wedge.set_theta1(theta1)
+      wedge.set_theta2(theta2)
+      mid = math.radians((theta1 + theta2) / 2)
+      x, y = math.cos(mid), math.sin(mid)
+      text.set_position((CourseInfoVisualizer.LABEL_DISTANCE * x, CourseInfoVisualizer.LABEL_DISTANCE * y))
+      text.set_horizontalalignment('left' if x > 0 else 'right')
+      autotext.set_position((CourseInfoVisualizer.PCT_DISTANCE * x, CourseInfoVisualizer.PCT_DISTANCE * y))
+      autotext.set_text(f"{100 * frac:.1f}%")
+      theta1 = theta2
+    for artist in canvas.retained_artists():
+      artist.set_visible(True)
+    full = canvas._is_empty # Back from the cleared/"Loading..." state: the title changes too
+    canvas._is_empty = False
+    canvas.redraw(full=full)
+    return True
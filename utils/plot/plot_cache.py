@@ -0,0 +1,176 @@
+# utils/plot/plot_cache.py
+"""
+Disk cache of rendered plots (PNG), keyed by what determines the pixels:
+visualizer, its parameters, a fingerprint of the data, canvas size and DPI.
+
+Past presentations never change, so revisiting their dashboards can show the
+stored image at once instead of recomputing and re-rasterizing the figure.
+"""
+import hashlib
+import os
+import threading
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any
+
+from config.config import GLOBAL_CONFIG
+from utils.logger import get_class_logger
+
+logger = get_class_logger(__name__, "PlotImageCache")
+
+
+def data_fingerprint(data: Any, digest: Any = None) -> str:
+    """
+    SHA-256 of a plot's input: NumPy arrays (dtype, shape and bytes), mappings
+    (by sorted key), sequences and scalars, nested in any combination.
+    """
+    digest = digest or hashlib.sha256()
+    _feed(digest, data)
+    return digest.hexdigest()
+
+
+def _feed(digest: Any, value: Any) -> None:
+    if hasattr(value, 'dtype') and hasattr(value, 'tobytes') and getattr(value, 'ndim', 0) > 0:
+        digest.update(f"array:{value.dtype.str}:{value.shape}:".encode())
+        if value.dtype.kind == 'O': # Object arrays hold pointers; hash their values instead
+            digest.update(repr(value.tolist()).encode())
+        else:
+            digest.update(value.tobytes()) # tobytes() is C-ordered for any memory layout
+    elif isinstance(value, Mapping):
+        digest.update(f"map:{len(value)}:".encode())
+        for key in sorted(value, key=str):
+            _feed(digest, str(key))
+            _feed(digest, value[key])
+    elif isinstance(value, (list, tuple)):
+        digest.update(f"seq:{len(value)}:".encode())
+        for item in value:
+            _feed(digest, item)
+    else:
+        digest.update(f"{type(value).__name__}:{value!r};".encode())
+
+
+class PlotImageCache:
+    """
+    Directory of PNG files named by cache key, bounded to max_bytes.
+
+    File mtimes double as the LRU order: get() touches the file, put()
+    evicts the least recently used files once the total size is exceeded.
+    The index is built from the directory on first use, so it survives restarts.
+    """
+    SUFFIX = ".png"
+
+    def __init__(self, directory: str | os.PathLike, max_bytes: int):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._sizes: dict[str, int] | None = None # key -> file size, loaded lazily
+        self._total = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(visualizer: str, params: Mapping[str, Any], data: Any,
+                 size: tuple[int, int], dpi: float) -> str:
+        """Cache key of a rendered plot; any change in input, size or resolution gives a new key."""
+        digest = hashlib.sha256(f"{visualizer}|{int(size[0])}x{int(size[1])}|{round(float(dpi), 2)}|".encode())
+        _feed(digest, dict(params))
+        return data_fingerprint(data, digest)
+
+    def get(self, key: str) -> bytes | None:
+        """The stored PNG for key, or None."""
+        path = self._path(key)
+        with self._lock:
+            self._ensure_index()
+            if key not in self._sizes:
+                self.misses += 1
+                return None
+            try:
+                png = path.read_bytes()
+                os.utime(path) # Mark as recently used
+            except OSError:
+                self._drop(key)
+                self.misses += 1
+                return None
+            self.hits += 1
+            return png
+
+    def put(self, key: str, png: bytes) -> None:
+        """Stores (or replaces) the PNG for key, then evicts down to max_bytes."""
+        if len(png) > self.max_bytes:
+            return
+        path = self._path(key)
+        tmp_path = path.with_name(path.name + ".tmp")
+        with self._lock:
+            self._ensure_index()
+            try:
+                self.directory.mkdir(parents=True, exist_ok=True)
+                tmp_path.write_bytes(png)
+                os.replace(tmp_path, path) # Readers never see half a file
+            except OSError as e:
+                logger.warning(f"Could not write cached plot {path}: {e}")
+                return
+            self._total += len(png) - self._sizes.get(key, 0)
+            self._sizes[key] = len(png)
+            self._evict()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._ensure_index()
+            for key in list(self._sizes):
+                self._path(key).unlink(missing_ok=True)
+                self._drop(key)
+
+    def stats(self) -> dict:
+        with self._lock:
+            self._ensure_index()
+            return {'entries': len(self._sizes), 'bytes': self._total, 'max_bytes': self.max_bytes,
+                    'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions}
+
+    # --- Internal Helpers (caller holds _lock) ---
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}{self.SUFFIX}"
+
+    def _ensure_index(self) -> None:
+        if self._sizes is not None:
+            return
+        self._sizes = {}
+        self._total = 0
+        if self.directory.is_dir():
+            for path in self.directory.glob(f"*{self.SUFFIX}"):
+                try:
+                    size = path.stat().st_size
+                except OSError:
+                    continue
+                self._sizes[path.stem] = size
+                self._total += size
+
+    def _drop(self, key: str) -> None:
+        self._total -= self._sizes.pop(key, 0)
+
+    def _evict(self) -> None:
+        if self._total <= self.max_bytes:
+            return
+        def last_used(key: str) -> float:
+            try:
+                return self._path(key).stat().st_mtime
+            except OSError:
+                return 0.0
+        for key in sorted(self._sizes, key=last_used):
+            if self._total <= self.max_bytes:
+                break
+            self._path(key).unlink(missing_ok=True)
+            self._drop(key)
+            self.evictions += 1
+        logger.debug(f"Evicted cached plots down to {self._total / 2**20:.1f} MB.")
+
+
+_plot_cache: PlotImageCache | None = None
+
+def get_plot_cache() -> PlotImageCache | None:
+    """The shared cache configured by PLOT_CACHE_DIR/PLOT_CACHE_MAX_MB, or None if disabled."""
+    global _plot_cache
+    if _plot_cache is None and GLOBAL_CONFIG.PLOT_CACHE_MAX_MB > 0:
+        _plot_cache = PlotImageCache(GLOBAL_CONFIG.PLOT_CACHE_DIR, int(GLOBAL_CONFIG.PLOT_CACHE_MAX_MB * 2**20))
+    return _plot_cache
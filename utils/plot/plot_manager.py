@@ -1,18 +1,21 @@
 # utils/plot/plot_manager.py
 
 from __future__ import annotations # Allow type hinting PlotManager within the class
-from typing import Optional
+from contextlib import contextmanager, nullcontext
+from typing import Any, ContextManager, Iterator, Optional
 
-from PyQt6.QtWidgets import QWidget, QSizePolicy, QVBoxLayout # Added QVBoxLayout
+from PyQt6.QtCore import QBuffer, QIODevice
+from PyQt6.QtGui import QImage, QPixmap
+from PyQt6.QtWidgets import QWidget, QSizePolicy, QVBoxLayout, QLabel # Added QVBoxLayout
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 from matplotlib.axes import Axes
-import pandas as pd
-import seaborn as sns
+from matplotlib.artist import Artist
 from utils.logger import get_class_logger
-import scienceplots
-import matplotlib.pyplot as plt
-import numpy as np
+from utils.lazy_import import lazy_import
+from utils.plot.plot_cache import PlotImageCache, get_plot_cache
+
+plt = lazy_import("matplotlib.pyplot") # Only needed for fallback figures
 
 # ====================================================================
 # 1. Matplotlib Canvas Class (Display Widget)
@@ -21,6 +24,22 @@ class MplCanvas(FigureCanvas):
     """
     A Qt Widget that embeds and displays a Matplotlib Figure.
     Plotting is done directly onto its 'axes' attribute.
+
+    Visualizers can also use it in retained mode: after building a plot they
+    retain() its data artists (bars, lines, wedges, legend, ...), and on new
+    data they update those artists in place and call redraw(). While the axes
+    limits and canvas size stay the same, redraw() only blits the retained
+    artists over a cached background instead of re-rendering ticks, grid
+    and labels.
+
+    Inside `with canvas.batch():` draw requests are only recorded and one
+    draw (or blit) happens when the outermost batch exits. draw_stats()
+    counts requests, full renders and blits, to check that building a page
+    renders each canvas once.
+
+    show_image() covers the canvas with a cached PNG of a previous render
+    until the live figure has been drawn; cache_next_render() stores the
+    next finished render in the plot image cache.
     """
     logger = get_class_logger(__name__, "MplCanvas") # Logger for the canvas itself
 
@@ -39,6 +58,17 @@ class MplCanvas(FigureCanvas):
             )
             self.updateGeometry()
             self._is_empty = True
+            self._retained_kind: str | None = None
+            self._retained: dict[str, Any] = {}
+            self._background = None # Figure without the retained artists, captured on every full draw
+            self._batch_depth = 0
+            self._deferred: str | None = None # 'full' or 'blit' while batching
+            self.draw_request_count = 0
+            self.draw_count = 0
+            self.blit_count = 0
+            self._image_label: QLabel | None = None # Cached image shown over the canvas
+            self._pending_cache: tuple[str, tuple[int, int]] | None = None # (key, pixel size) to store
+            self.mpl_connect('draw_event', self._on_draw)
             self.clear_display() # Start in a clean state
             MplCanvas.logger.debug("MplCanvas initialized successfully.")
         except Exception as e:
@@ -50,6 +80,15 @@ class MplCanvas(FigureCanvas):
     def clear_display(self):
         """Clears the axes, displays an empty state message, and redraws."""
         try:
+            if self._retained:
+                # Hide rather than delete, so the next plot of the same kind can reuse the artists
+                for artist in self.retained_artists():
+                    artist.set_visible(False)
+                self.axes.set_title("Plot Area")
+                self.figure.canvas.draw_idle()
+                self._is_empty = True
+                MplCanvas.logger.debug("MplCanvas display cleared (retained artists hidden).")
+                return
             self.axes.clear()
             self.axes.set_title("Plot Area") # Generic title for empty state
             self.axes.set_xticks([])
@@ -60,15 +99,217 @@ class MplCanvas(FigureCanvas):
         except Exception as e:
             MplCanvas.logger.error(f"Error clearing MplCanvas display: {e}", exc_info=True)
 
+    # --- Draw Batching & Instrumentation ---
+
+    def draw_idle(self, *args, **kwargs):
+        """Schedules a full redraw, or defers it to the end of the current batch."""
+        self.draw_request_count += 1
+        if self._batch_depth:
+            self._deferred = 'full'
+            return
+        super().draw_idle(*args, **kwargs)
+
+    def draw(self):
+        self.draw_count += 1
+        MplCanvas.logger.debug(f"Render #{self.draw_count} of canvas in '{self.parent().objectName() if self.parent() else '?'}'.")
+        super().draw()
+
+    def blit(self, bbox=None):
+        self.blit_count += 1
+        super().blit(bbox)
+
+    @contextmanager
+    def batch(self) -> Iterator[MplCanvas]:
+        """Collects every draw request made inside the block into one draw at its end. Nestable."""
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._deferred is not None:
+                full, self._deferred = self._deferred == 'full', None
+                self.redraw(full=full)
+
+    def draw_stats(self) -> dict[str, int]:
+        """Draw requests, full renders and blits since creation (or the last reset)."""
+        return {'requests': self.draw_request_count, 'draws': self.draw_count, 'blits': self.blit_count}
+
+    def reset_draw_stats(self) -> None:
+        self.draw_request_count = self.draw_count = self.blit_count = 0
+
     @property
     def is_empty(self) -> bool:
         """Returns True if the canvas is cleared or hasn't displayed a plot."""
         try:
              # Check if axes contains lines, collections, patches etc.
-            return not bool(self.axes.has_data())
+            return self._is_empty or not bool(self.axes.has_data())
         except Exception:
              return True # Assume empty if error occurs during check
 
+    # --- Retained-Mode Layer ---
+
+    def retained(self, kind: str) -> dict[str, Any] | None:
+        """Artists retained by the last plot of this kind, or None if the canvas shows something else."""
+        return self._retained if self._retained_kind == kind and self._retained else None
+
+    def retain(self, kind: str, artists: dict[str, Any]) -> None:
+        """
+        Keeps the data artists of a freshly built plot for in-place updates.
+
+        Args:
+            kind: Plot type, e.g. 'score_distribution'; retained(kind) returns the artists.
+            artists: Name -> artist (or list of artists), plus any plain values the visualizer
+                     needs to decide whether an update fits. Artists are marked animated, so full
+                     draws leave them out of the cached background and blit them on top.
+        """
+        self._retained_kind = kind
+        self._retained = artists
+        for artist in self.retained_artists():
+            artist.set_animated(True)
+        self._background = None
+
+    def forget_retained(self) -> None:
+        """Drops the retained artists, e.g. before the axes are cleared for another plot."""
+        for artist in self.retained_artists():
+            artist.set_animated(False)
+        self._retained_kind = None
+        self._retained = {}
+        self._background = None
+
+    def retained_artists(self) -> Iterator[Artist]:
+        """Every retained artist; other retained values (e.g. the labels a plot was built for) are skipped."""
+        for value in self._retained.values():
+            for item in value if isinstance(value, (list, tuple)) else (value,):
+                if isinstance(item, Artist):
+                    yield item
+
+    def redraw(self, full: bool = False) -> None:
+        """
+        Shows updated retained artists.
+
+        Args:
+            full: Limits, ticks or other non-retained parts changed: re-render everything.
+                  Otherwise the artists are blitted over the cached background.
+        """
+        if self._batch_depth:
+            blit_only = not full and self._deferred != 'full'
+            self._deferred = 'blit' if blit_only else 'full'
+            return
+        if full or self._background is None or not self._retained:
+            self.draw_idle()
+            return
+        self.restore_region(self._background)
+        self._draw_retained()
+        self.blit(self.figure.bbox)
+        self._after_render()
+
+    # Room above the tallest value when the y limit is (re)set
+    Y_HEADROOM = 1.25
+
+    def fit_limits(self, x0: float, x1: float, y_top: float,
+                   x_domain: tuple[float, float] | None = None) -> bool:
+        """
+        Keeps the view stable across data sets so that updates can blit.
+
+        The x range only ever widens: it starts at x_domain (e.g. the 0-100
+        score scale) and grows when data falls outside it. The y limit keeps
+        Y_HEADROOM above the tallest value and is only reset when the new data
+        no longer fits under it or fills less than half of the axis.
+
+        Args:
+            x0, x1: Data range on the x axis.
+            y_top: Tallest value (the y axis starts at 0).
+            x_domain: Resets the view to this x range (widened to the data) and y to y_top;
+                      used when a plot is built.
+
+        Returns:
+            True if the limits changed, i.e. a full redraw is needed.
+        """
+        if x_domain is not None:
+            cur_x0, cur_x1 = x_domain
+            cur_top = 0.0
+        else:
+            cur_x0, cur_x1 = self.axes.get_xlim()
+            _, cur_top = self.axes.get_ylim()
+        changed = x_domain is not None
+        if x0 < cur_x0 or x1 > cur_x1:
+            pad = 0.05 * (x1 - x0) or 1.0
+            cur_x0, cur_x1 = min(cur_x0, x0 - pad), max(cur_x1, x1 + pad)
+            changed = True
+        if changed:
+            self.axes.set_xlim(cur_x0, cur_x1)
+        if not 0.5 * cur_top <= y_top <= cur_top:
+            self.axes.set_ylim(0, y_top * self.Y_HEADROOM or 1.0)
+            changed = True
+        return changed
+
+    def _on_draw(self, event) -> None:
+        """After a full draw: capture the background, then paint the (animated) retained artists."""
+        if not self._retained:
+            self._background = None
+        else:
+            self._background = self.copy_from_bbox(self.figure.bbox)
+            self._draw_retained()
+        self._after_render()
+
+    # --- Rendered-Image Cache ---
+
+    def pixel_size(self) -> tuple[int, int]:
+        """Size of the rendered buffer in device pixels."""
+        ratio = self.devicePixelRatioF()
+        return round(self.width() * ratio), round(self.height() * ratio)
+
+    def show_image(self, png: bytes) -> bool:
+        """Covers the canvas with a previously rendered PNG until the live figure is drawn."""
+        pixmap = QPixmap()
+        if not pixmap.loadFromData(png, "PNG"):
+            return False
+        pixmap.setDevicePixelRatio(self.devicePixelRatioF())
+        if self._image_label is None:
+            self._image_label = QLabel(self)
+        self._image_label.setPixmap(pixmap)
+        self._image_label.setGeometry(self.rect())
+        self._image_label.show()
+        self._image_label.raise_()
+        return True
+
+    def hide_image(self) -> None:
+        if self._image_label is not None:
+            self._image_label.hide()
+
+    def cache_next_render(self, key: str) -> None:
+        """Stores the next completed render under key (skipped if the size changes meanwhile)."""
+        self._pending_cache = (key, self.pixel_size())
+
+    def resizeEvent(self, event):
+        if self._image_label is not None:
+            self._image_label.setGeometry(self.rect())
+        super().resizeEvent(event)
+
+    def _after_render(self) -> None:
+        """The agg buffer now holds a finished frame: drop the cached image, store the frame if requested."""
+        if self._is_empty:
+            return # Still a loading/empty state; keep the cached image up
+        self.hide_image()
+        if self._pending_cache is None:
+            return
+        key, size = self._pending_cache
+        self._pending_cache = None
+        cache = get_plot_cache()
+        buffer = self.buffer_rgba()
+        if cache is None or (buffer.shape[1], buffer.shape[0]) != size:
+            return
+        image = QImage(bytes(buffer), size[0], size[1], QImage.Format.Format_RGBA8888)
+        data = QBuffer()
+        data.open(QIODevice.OpenModeFlag.WriteOnly)
+        if image.save(data, "PNG"):
+            cache.put(key, bytes(data.data()))
+
+    def _draw_retained(self) -> None:
+        for artist in self.retained_artists():
+            if artist.get_visible():
+                self.figure.draw_artist(artist)
+
 
 # ====================================================================
 # 2. Plot Manager Class (Plotting Controller & Configurator)
@@ -104,6 +345,8 @@ class PlotManager:
     def set_title(self, title: str, **kwargs) -> PlotManager:
         """Sets the title of the referenced plot and redraws the canvas."""
         try:
+            if not kwargs and self.axes.get_title() == title:
+                return self # Unchanged: keep a blitted update from turning into a full redraw
             self.axes.set_title(title, **kwargs)
             if self.figure.canvas: # Check if canvas exists
                 self.figure.canvas.draw_idle()
@@ -160,6 +403,101 @@ class PlotManager:
             PlotManager.logger.error(f"Error adding legend: {e}", exc_info=True)
         return self
 
+    # --- Batched Configuration ---
+
+    def batch(self) -> ContextManager[PlotManager]:
+        """
+        Context manager applying every configuration call in the block with a single draw:
+
+            with plot.batch():
+                plot.set_title("Scores").set_xlabel("Score").apply_grid()
+        """
+        canvas = self.figure.canvas
+        if not isinstance(canvas, MplCanvas):
+            return nullcontext(self) # Placeholder figure: nothing is displayed anyway
+        return self._batch_on(canvas)
+
+    @contextmanager
+    def _batch_on(self, canvas: MplCanvas) -> Iterator[PlotManager]:
+        with canvas.batch():
+            yield self
+
+    def configure(self, title: str | None = None, xlabel: str | None = None, ylabel: str | None = None,
+                  grid: bool | None = None, legend: bool = False) -> PlotManager:
+        """Builder-style spec: sets any of title/labels/grid/legend and draws once."""
+        with self.batch():
+            if title is not None:
+                self.set_title(title)
+            if xlabel is not None:
+                self.set_xlabel(xlabel)
+            if ylabel is not None:
+                self.set_ylabel(ylabel)
+            if grid is not None:
+                self.apply_grid(grid)
+            if legend:
+                self.add_legend()
+        return self
+
+    @staticmethod
+    def deferred_draw(target_widget: QWidget) -> ContextManager[Optional[MplCanvas]]:
+        """
+        Batches the canvas of target_widget (created if needed) across a visualizer
+        call and the configuration that follows, so the whole build draws once.
+        """
+        canvas = PlotManager._find_or_create_canvas(target_widget)
+        return canvas.batch() if canvas is not None else nullcontext(None)
+
+    # --- Rendered-Image Cache ---
+
+    @staticmethod
+    def image_cache_key(target_widget: QWidget, visualizer: str, params: dict, data: Any) -> str | None:
+        """
+        Key of the plot visualizer would render from data into target_widget's canvas
+        (None if the cache is disabled). params must cover everything else that
+        changes the pixels, such as the title the page sets.
+        """
+        if get_plot_cache() is None:
+            return None
+        canvas = PlotManager._find_or_create_canvas(target_widget)
+        if canvas is None:
+            return None
+        return PlotImageCache.make_key(visualizer, params, data, canvas.pixel_size(), canvas.figure.dpi)
+
+    @staticmethod
+    def show_cached_image(target_widget: QWidget, key: str | None) -> bool:
+        """Shows the cached render for key over the canvas right away. Returns False on a miss."""
+        canvas = PlotManager._find_or_create_canvas(target_widget)
+        if canvas is None:
+            return False
+        cache = get_plot_cache()
+        png = cache.get(key) if cache is not None and key else None
+        if png is None:
+            canvas.hide_image() # Never leave another plot's image up
+            return False
+        shown = canvas.show_image(png)
+        if shown:
+            PlotManager.logger.debug(f"Showing cached plot image in '{target_widget.objectName()}'.")
+        return shown
+
+    @staticmethod
+    def hide_cached_image(target_widget: QWidget) -> None:
+        canvas = target_widget.findChild(MplCanvas)
+        if canvas is not None:
+            canvas.hide_image()
+
+    @staticmethod
+    def cache_render(target_widget: QWidget, key: str | None) -> None:
+        """Stores the canvas' next finished render under key."""
+        canvas = target_widget.findChild(MplCanvas)
+        if key and canvas is not None:
+            canvas.cache_next_render(key)
+
+    @staticmethod
+    def draw_stats(target_widget: QWidget) -> dict[str, int]:
+        """Draw counters of the canvas in target_widget (empty if it has none)."""
+        canvas = target_widget.findChild(MplCanvas)
+        return canvas.draw_stats() if canvas is not None else {}
+
     # --- State Property ---
 
     @property
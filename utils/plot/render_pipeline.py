@@ -0,0 +1,109 @@
+# utils/plot/render_pipeline.py
+from typing import Any, Callable
+
+from PyQt6.QtCore import QObject
+from PyQt6.QtWidgets import QWidget
+from utils.async_task import AsyncTaskRunner, TaskHandle
+from utils.logger import get_class_logger
+from utils.plot.plot_manager import PlotManager
+
+class PlotRenderPipeline(QObject):
+    """
+    Splits a plot into a compute step on the thread pool and a draw step on
+    the GUI thread.
+
+    compute(*args) does the number crunching (binning, KDE, ...) and must not
+    touch widgets; draw(target_widget, computed) only creates the artists and
+    returns a PlotManager. Each target widget renders its latest request
+    only: submitting a new one cancels the pending one, whose result is then
+    dropped without being drawn.
+
+        pipeline.render(widget, StudentScoreVisualizer.compute_distribution,
+                        StudentScoreVisualizer.draw_distribution, scores,
+                        on_drawn=lambda plot: plot.set_title("Scores"))
+
+    Data that needs no computing is drawn synchronously with render_now().
+    """
+    def __init__(self, parent: QObject | None = None):
+        super().__init__(parent)
+        self.logger = get_class_logger(__name__, self.__class__.__name__)
+        self.runner = AsyncTaskRunner(parent=self)
+        self._latest: dict[int, TaskHandle] = {} # id(target_widget) -> pending render
+
+    def render(self, target_widget: QWidget, compute: Callable[..., Any],
+               draw: Callable[[QWidget, Any], PlotManager], *args,
+               on_drawn: Callable[[PlotManager], None] | None = None,
+               cache_key: str | None = None, **kwargs) -> TaskHandle:
+        """
+        Computes compute(*args, **kwargs) in the background, then draws it into target_widget.
+
+        A compute error is passed to draw as the exception, so the visualizer
+        can show its error state. With a cache_key (PlotManager.image_cache_key)
+        a cached render is shown at once and the live figure replaces it when
+        drawn; a fresh render is stored under the key.
+
+        Returns:
+            The TaskHandle of the compute step.
+        """
+        key = self._drop_pending(target_widget)
+
+        def finish(computed: Any) -> None:
+            if self._latest.get(key) is handle:
+                del self._latest[key]
+            self._draw(target_widget, draw, computed, on_drawn, cache_key)
+
+        if cache_key:
+            PlotManager.show_cached_image(target_widget, cache_key)
+        handle = self.runner.submit(compute, *args, on_result=finish, on_error=finish, **kwargs)
+        self._latest[key] = handle
+        return handle
+
+    def render_now(self, target_widget: QWidget, draw: Callable[[QWidget, Any], PlotManager], data: Any,
+                   on_drawn: Callable[[PlotManager], None] | None = None,
+                   cache_key: str | None = None) -> PlotManager | None:
+        """
+        Draws data that needs no computing right away, on the calling (GUI) thread.
+
+        Same drawing, cached-image and latest-wins behaviour as render(): a pending
+        background render of target_widget is dropped so it cannot overwrite this one.
+
+        Returns:
+            The PlotManager returned by draw.
+        """
+        self._drop_pending(target_widget)
+        if cache_key:
+            PlotManager.show_cached_image(target_widget, cache_key)
+        return self._draw(target_widget, draw, data, on_drawn, cache_key)
+
+    def cancel_all(self) -> None:
+        """Drops every render that has not been drawn yet."""
+        self._latest.clear()
+        self.runner.cancel_all()
+
+    @property
+    def pending_count(self) -> int:
+        return self.runner.pending_count
+
+    # --- Internal Helpers ---
+
+    def _drop_pending(self, target_widget: QWidget) -> int:
+        """Cancels the pending render of target_widget, if any. Returns its key in _latest."""
+        key = id(target_widget)
+        previous = self._latest.pop(key, None)
+        if previous is not None and not previous.done:
+            previous.cancel()
+            self.logger.debug(f"Dropped stale render of '{target_widget.objectName()}'.")
+        return key
+
+    @staticmethod
+    def _draw(target_widget: QWidget, draw: Callable[[QWidget, Any], PlotManager], data: Any,
+              on_drawn: Callable[[PlotManager], None] | None, cache_key: str | None) -> PlotManager | None:
+        with PlotManager.deferred_draw(target_widget): # Artists + on_drawn configuration: one draw
+            plot = draw(target_widget, data)
+            if on_drawn is not None and plot is not None:
+                on_drawn(plot)
+            if cache_key and plot is not None and plot.has_plot:
+                PlotManager.cache_render(target_widget, cache_key)
+            elif cache_key:
+                PlotManager.hide_cached_image(target_widget) # Empty/error state: not cached, shown right away
+        return plot
@@ -1,18 +1,177 @@
+from typing import Any, Mapping, TypedDict
+
 from utils.plot.plot_manager import PlotManager
 from PyQt6.QtWidgets import QWidget
-import seaborn as sns
-import matplotlib.pyplot as plt
-import pandas as pd
+from utils.lazy_import import lazy_import
+
+# Loaded when the first distribution is drawn, not when the page module is imported
+plt = lazy_import("matplotlib.pyplot")
+np = lazy_import("numpy")
+
+class ScoreDistribution(TypedDict):
+    """Everything needed to draw a score distribution, computed off the GUI thread."""
+    edges: Any      # Histogram bin edges (bins + 1)
+    density: Any    # Histogram height per bin (stat='density')
+    kde_x: Any      # KDE evaluation grid, empty if the KDE is undefined (fewer than 2 distinct scores)
+    kde_y: Any
+    mean: float
+    median: float
+    count: int
 
 class StudentScoreVisualizer():
+    SCORE_COL = 'avg_score'
+    BINS = 20
+    KDE_POINTS = 200 # Grid size of the KDE curve
+    KDE_CHUNK = 4096 # Scores per KDE evaluation step
+    PLOT_KIND = 'score_distribution' # Retained-artist key on MplCanvas
+    SCORE_RANGE = (0.0, 100.0) # Fixed x domain, so switching courses keeps the axes and can blit
+
+    @staticmethod
+    def score_values(score_data: Any) -> Any:
+        """
+        Normalizes score input to a float64 NumPy array without NaNs.
+
+        Accepts an array/sequence of scores, a column mapping holding
+        'avg_score' (e.g. from DBExecuteService.fetch_columns) or, for older
+        callers, a list of row dictionaries. Returns None if 'avg_score' is missing.
+        """
+        col = StudentScoreVisualizer.SCORE_COL
+        if score_data is None:
+            return np.empty(0)
+        if isinstance(score_data, Mapping):
+            if col not in score_data:
+                return None
+            score_data = score_data[col]
+        elif isinstance(score_data, list) and score_data and isinstance(score_data[0], Mapping):
+            if col not in score_data[0]:
+                return None
+            score_data = [row.get(col) for row in score_data]
+        values = np.array([np.nan if v is None else v for v in score_data], dtype=np.float64) \
+            if isinstance(score_data, list) else np.asarray(score_data, dtype=np.float64)
+        return values[~np.isnan(values)]
+
+    @staticmethod
+    def compute_distribution(score_data: Any, bins: int | None = None,
+                             kde_points: int | None = None) -> ScoreDistribution | None:
+        """
+        Computes histogram, KDE curve and mean/median of the scores.
+
+        Pure NumPy and touches no widget, so it is safe to run in a worker
+        thread (see PlotRenderPipeline). The KDE is a Gaussian kernel with
+        Scott's bandwidth evaluated over the data range, like seaborn's
+        histplot(kde=True).
+
+        Returns:
+            The distribution, or None if score_data has no 'avg_score'.
+        """
+        bins = bins or StudentScoreVisualizer.BINS
+        kde_points = kde_points or StudentScoreVisualizer.KDE_POINTS
+        scores = StudentScoreVisualizer.score_values(score_data)
+        if scores is None:
+            return None
+        empty = np.empty(0)
+        if len(scores) == 0:
+            return ScoreDistribution(edges=empty, density=empty, kde_x=empty, kde_y=empty,
+                                     mean=float('nan'), median=float('nan'), count=0)
+
+        density, edges = np.histogram(scores, bins=bins, density=True)
+        kde_x, kde_y = empty, empty
+        std = float(scores.std(ddof=1)) if len(scores) > 1 else 0.0
+        if std > 0:
+            bandwidth = std * len(scores) ** (-1 / 5) # Scott's rule
+            kde_x = np.linspace(scores.min(), scores.max(), kde_points)
+            kde_y = np.zeros(kde_points)
+            chunk = StudentScoreVisualizer.KDE_CHUNK
+            for start in range(0, len(scores), chunk): # Bounded (kde_points x chunk) temporaries
+                z = (kde_x[:, None] - scores[None, start:start + chunk]) / bandwidth
+                kde_y += np.exp(-0.5 * z * z).sum(axis=1)
+            kde_y /= len(scores) * bandwidth * np.sqrt(2 * np.pi)
+
+        return ScoreDistribution(edges=edges, density=density, kde_x=kde_x, kde_y=kde_y,
+                                 mean=float(scores.mean()), median=float(np.median(scores)),
+                                 count=len(scores))
+
     @staticmethod
-    def create_score_distribution(target_widget: QWidget, score_data: list[dict]) -> PlotManager:
+    def compute_distribution_from_bins(histogram: Mapping[str, Any] | None,
+                                       kde_points: int | None = None) -> ScoreDistribution | None:
+        """
+        Distribution from a pre-binned histogram (see get_student_score_histogram).
+
+        Cost is O(bins) whatever the number of students: the KDE is the binned
+        approximation, a Gaussian (Scott's bandwidth from the exact variance)
+        placed at every bin centre and weighted by the bin count, and the
+        median is interpolated within its bin.
+
+        Returns:
+            The distribution, or None if there is no histogram.
+        """
+        if histogram is None:
+            return None
+        kde_points = kde_points or StudentScoreVisualizer.KDE_POINTS
+        empty = np.empty(0)
+        count = int(histogram['count'])
+        if count == 0:
+            return ScoreDistribution(edges=empty, density=empty, kde_x=empty, kde_y=empty,
+                                     mean=float('nan'), median=float('nan'), count=0)
+
+        width = float(histogram['bin_width'])
+        bins = np.asarray(histogram['bins'], dtype=np.int64)
+        first = int(bins.min())
+        counts = np.zeros(int(bins.max()) - first + 1)
+        counts[bins - first] = histogram['counts'] # Dense, including empty bins in between
+        edges = (first + np.arange(len(counts) + 1)) * width
+        density = counts / (count * width)
+
+        cumulative = np.cumsum(counts)
+        median_bin = int(np.searchsorted(cumulative, count / 2))
+        below = cumulative[median_bin - 1] if median_bin else 0.0
+        median = edges[median_bin] + (count / 2 - below) / counts[median_bin] * width
+
+        kde_x, kde_y = empty, empty
+        variance = float(histogram['variance'])
+        if count > 1 and variance > 0:
+            bandwidth = np.sqrt(variance) * count ** (-1 / 5) # Scott's rule
+            centres = edges[:-1] + width / 2
+            kde_x = np.linspace(edges[0], edges[-1], kde_points)
+            z = (kde_x[:, None] - centres[None, :]) / bandwidth
+            kde_y = (np.exp(-0.5 * z * z) * counts).sum(axis=1) / (count * bandwidth * np.sqrt(2 * np.pi))
+
+        return ScoreDistribution(edges=edges, density=density, kde_x=kde_x, kde_y=kde_y,
+                                 mean=float(histogram['mean']), median=float(median), count=count)
+
+    @staticmethod
+    def create_score_distribution(target_widget: QWidget, score_data: Any) -> PlotManager:
         """
         Finds/Creates canvas in target_widget, clears it, draws score distribution.
 
+        Computes and draws on the calling thread; pages should prefer
+        PlotRenderPipeline.render with compute_distribution/draw_distribution.
+
         Args:
             target_widget: The QWidget to draw the plot in.
-            score_data: List of dictionaries with 'avg_score'.
+            score_data: Scores as an array, an 'avg_score' column mapping or a list of row dicts
+                        (see score_values).
+
+        Returns:
+            A PlotManager instance referencing the canvas's axes for configuration.
+        """
+        try:
+            distribution = StudentScoreVisualizer.compute_distribution(score_data)
+        except Exception as e:
+            PlotManager.logger.error(f"Error computing score distribution: {e}", exc_info=True)
+            distribution = e
+        return StudentScoreVisualizer.draw_distribution(target_widget, distribution)
+
+    @staticmethod
+    def draw_distribution(target_widget: QWidget, distribution: ScoreDistribution | Exception | None) -> PlotManager:
+        """
+        Draws a precomputed distribution (GUI thread only): bars, KDE line and
+        mean/median markers.
+
+        Args:
+            target_widget: The QWidget to draw the plot in.
+            distribution: Result of compute_distribution; None means invalid input and
+                          an exception shows the error state.
 
         Returns:
             A PlotManager instance referencing the canvas's axes for configuration.
@@ -29,22 +188,22 @@ class StudentScoreVisualizer():
         PlotManager.logger.info(f"Attempting to create score distribution plot in '{target_widget.objectName()}'...")
 
         try:
-            ax.clear() # Clear canvas before drawing new plot
-            SCORE_COL = 'avg_score'
+            SCORE_COL = StudentScoreVisualizer.SCORE_COL
+            if isinstance(distribution, Exception):
+                raise distribution
 
-            # --- Data Validation ---
-            if not score_data:
-                ax.set_title("No Data Available")
-                ax.text(0.5, 0.5, "No scores provided", ha='center', va='center', transform=ax.transAxes)
-                ax.set_xticks([]); ax.set_yticks([])
-                PlotManager.logger.warning("No data provided for score distribution.")
-                canvas.draw_idle()
-                canvas._is_empty = True
+            # --- Retained Mode: move the existing artists to the new data ---
+            retained = canvas.retained(StudentScoreVisualizer.PLOT_KIND)
+            if (retained is not None and distribution is not None and distribution['count'] > 0
+                    and StudentScoreVisualizer._update_distribution(canvas, retained, distribution)):
+                PlotManager.logger.info("Score distribution plot updated in place.")
                 return PlotManager(fig, ax)
 
-            df = pd.DataFrame(score_data)
+            canvas.forget_retained()
+            ax.clear() # Clear canvas before drawing new plot
 
-            if SCORE_COL not in df.columns or df[SCORE_COL].isnull().all() or df[SCORE_COL].empty:
+            # --- Data Validation ---
+            if distribution is None:
                 ax.set_title(f"Invalid Data ('{SCORE_COL}')")
                 ax.text(0.5, 0.5, f"Column '{SCORE_COL}' missing\nor contains no valid scores.", ha='center', va='center', transform=ax.transAxes, wrap=True)
                 ax.set_xticks([]); ax.set_yticks([])
@@ -53,25 +212,32 @@ class StudentScoreVisualizer():
                 canvas._is_empty = True
                 return PlotManager(fig, ax)
 
-            # --- Apply Style (Optional) ---
-            try:
-                PlotManager.logger.debug("Applied 'science' style.")
-            except Exception as style_err:
-                 PlotManager.logger.warning(f"Could not apply 'science' style: {style_err}. Using default.")
+            if distribution['count'] == 0:
+                ax.set_title("No Data Available")
+                ax.text(0.5, 0.5, "No scores provided", ha='center', va='center', transform=ax.transAxes)
+                ax.set_xticks([]); ax.set_yticks([])
+                PlotManager.logger.warning("No data provided for score distribution.")
+                canvas.draw_idle()
+                canvas._is_empty = True
+                return PlotManager(fig, ax)
 
-            # --- Plotting ---
-            sns.histplot(data=df, x=SCORE_COL, kde=True, ax=ax, bins=20, stat='density',
-                         color='skyblue', edgecolor='black')
+            # --- Plotting (only artist creation; the numbers are precomputed) ---
+            edges = distribution['edges']
+            bars = ax.bar(edges[:-1], distribution['density'], width=np.diff(edges), align='edge',
+                          color='skyblue', edgecolor='black')
+            kde_line, = ax.plot(distribution['kde_x'], distribution['kde_y'], color='skyblue', linewidth=1.5)
+            kde_line.set_visible(len(distribution['kde_x']) > 0)
 
-            mean_score = df[SCORE_COL].mean()
-            median_score = df[SCORE_COL].median()
+            mean_score = distribution['mean']
+            median_score = distribution['median']
             line_styles = {'linewidth': 1.5}
             legend_needed = False
-            if pd.notna(mean_score):
-                 ax.axvline(mean_score, color='red', linestyle='--', label=f'Mean ({mean_score:.1f})', **line_styles)
+            mean_line = median_line = legend = None
+            if not np.isnan(mean_score):
+                 mean_line = ax.axvline(mean_score, color='red', linestyle='--', label=f'Mean ({mean_score:.1f})', **line_styles)
                  legend_needed = True
-            if pd.notna(median_score):
-                ax.axvline(median_score, color='green', linestyle=':', label=f'Median ({median_score:.1f})', **line_styles)
+            if not np.isnan(median_score):
+                median_line = ax.axvline(median_score, color='green', linestyle=':', label=f'Median ({median_score:.1f})', **line_styles)
                 legend_needed = True
 
             # --- Default Labels/Title ---
@@ -79,8 +245,12 @@ class StudentScoreVisualizer():
             ax.set_xlabel("Average Score")
             ax.set_ylabel("Density / Frequency")
             if legend_needed:
-                ax.legend()
+                legend = ax.legend()
             ax.grid(True, linestyle='--', alpha=0.6)
+            canvas.fit_limits(float(edges[0]), float(edges[-1]), StudentScoreVisualizer._peak(distribution),
+                              x_domain=StudentScoreVisualizer.SCORE_RANGE)
+            canvas.retain(StudentScoreVisualizer.PLOT_KIND, {'bars': list(bars), 'kde': kde_line, 'mean': mean_line,
+                                                             'median': median_line, 'legend': legend})
 
             # --- Redraw Canvas ---
             canvas.draw_idle()
@@ -94,6 +264,7 @@ class StudentScoreVisualizer():
             PlotManager.logger.error(f"Error creating score distribution plot: {e}", exc_info=True)
             # Display error message on the canvas
             try:
+                canvas.forget_retained()
                 ax.clear()
                 ax.set_title("Plotting Error")
                 ax.text(0.5, 0.5, f"Could not generate plot:\n{type(e).__name__}", ha='center', va='center', transform=ax.transAxes, wrap=True)
@@ -104,4 +275,49 @@ class StudentScoreVisualizer():
                  PlotManager.logger.error(f"Further error displaying plot error message: {display_err}", exc_info=True)
             # Return manager referencing the axes in error state
             return PlotManager(fig, ax)
-    
\ No newline at end of file
+
+    @staticmethod
+    def _update_distribution(canvas: Any, artists: dict[str, Any], distribution: ScoreDistribution) -> bool:
+        """
+        Moves the retained bars/lines/legend of a previous distribution to new data.
+
+        Returns:
+            False if they cannot show it (more bins than bars, no mean/median lines);
+            the caller then rebuilds the plot.
+        """
+        edges, density = distribution['edges'], distribution['density']
+        bars = artists['bars']
+        if len(density) > len(bars) or artists['mean'] is None or artists['median'] is None:
+            return False
+
+        widths = np.diff(edges)
+        for i, bar in enumerate(bars): # Extra bars from a wider previous histogram are hidden
+            if i < len(density):
+                bar.set_x(edges[i]); bar.set_width(widths[i]); bar.set_height(density[i])
+            bar.set_visible(i < len(density))
+        kde_x, kde_y = distribution['kde_x'], distribution['kde_y']
+        artists['kde'].set_data(kde_x, kde_y)
+        artists['kde'].set_visible(len(kde_x) > 0)
+
+        legend_texts = artists['legend'].get_texts() # Mean, Median (the only labeled artists)
+        for text, key, name in zip(legend_texts, ('mean', 'median'), ('Mean', 'Median')):
+            value = distribution[key]
+            artists[key].set_xdata([value, value])
+            artists[key].set_label(f'{name} ({value:.1f})')
+            artists[key].set_visible(True)
+            text.set_text(f'{name} ({value:.1f})')
+        artists['legend'].set_visible(True)
+
+        full = canvas._is_empty # Back from the cleared/"Loading..." state: the title changes too
+        if canvas._is_empty:
+            canvas.axes.set_title("Student Score Distribution")
+        full = canvas.fit_limits(float(edges[0]), float(edges[-1]), StudentScoreVisualizer._peak(distribution)) or full
+        canvas._is_empty = False
+        canvas.redraw(full=full)
+        return True
+
+    @staticmethod
+    def _peak(distribution: ScoreDistribution) -> float:
+        """Tallest bar or KDE value."""
+        kde_y = distribution['kde_y']
+        return max(float(distribution['density'].max()), float(kde_y.max()) if len(kde_y) else 0.0)
@@ -1,14 +1,19 @@
+from typing import Any, Mapping, Sequence
 from PyQt6.QtWidgets import (
     QTableWidgetItem,
     QTableWidget,
+    QTableView,
     QHeaderView
 )
 from PyQt6.QtCore import Qt
 from utils.logger import get_class_logger
+from utils.table.table_model import ColumnarTableModel
 
-class TableWidgetManager:
+class TableManagerBase:
     """
-    Manager class to handle operations for a specific QTableWidget instance.
+    Configuration and column helpers shared by the QTableWidget and QTableView
+    managers. They only use the QTableView API, which QTableWidget inherits;
+    filling the table is left to the subclasses.
     """
 
     # Class attribute for shared settings across instances
@@ -16,118 +21,32 @@ class TableWidgetManager:
         'no_id': {'hidden_columns': ['id']}
     }
 
-    def __init__(self, table_widget: QTableWidget):
+    def __init__(self, table: QTableView):
         """
-        Initialize the manager for a specific QTableWidget.
-
         Args:
-            table_widget: The QTableWidget instance this manager will control.
+            table: The table (QTableWidget or QTableView) this manager will control.
         """
-        if not isinstance(table_widget, QTableWidget):
-            raise TypeError("Expected a QTableWidget instance.")
-        self.table_widget = table_widget
+        self.table = table
         self.header_labels: list[str] | None = None # Store headers after loading
         self._configure_table() # Apply initial configuration
-        self.logger = get_class_logger(__name__,self.__class__.__name__)
+        self.logger = get_class_logger(__name__, self.__class__.__name__)
 
     def _configure_table(self):
         """Apply default table configuration to the managed table."""
-        self.table_widget.setSelectionMode(QTableWidget.SelectionMode.SingleSelection)
-        self.table_widget.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.table_widget.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
-        self.table_widget.verticalHeader().setVisible(False)
+        self.table.setSelectionMode(QTableView.SelectionMode.SingleSelection)
+        self.table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        self.table.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
+        self.table.verticalHeader().setVisible(False)
         # Optional: Add stretching for the last column
-        # self.table_widget.horizontalHeader().setStretchLastSection(True)
-
-    def load_data(self, data: list[dict],
-                  header_labels: list[str] | None = None, table_type: str |None = None,
-                  hidden_column_names: list[str] | None = None):
-        """Load data (list of dictionaries) into the managed table widget.
-
-        Args:
-            data: List of dictionaries (each dict is a row).
-            header_labels: Optional list of column headers to display. If None,
-                           keys from the first data dictionary are used.
-            table_type: Optional type of table for predefined settings (e.g., hiding columns).
-            hidden_column_names: Optional explicit list of header names to hide.
-                                 Overrides table_type settings if provided.
-        """
-        try:
-        # Determine headers
-          if data:
-              # Use provided header_labels if they exist, otherwise use dict keys
-              self.header_labels = header_labels if header_labels is not None else list(data[0].keys())
-          elif header_labels is not None:
-              # Data is empty, but headers were provided
-              self.header_labels = header_labels
-          else: # data is empty and no headers provided
-              self.header_labels = []
-
-          self._populate_data(data) # Uses self.header_labels
-        
-
-          # Determine columns to hide
-          columns_to_hide = []
-          if hidden_column_names is not None:
-              columns_to_hide = hidden_column_names # Explicit list takes precedence
-          elif table_type and table_type in self._table_settings_defaults:
-              settings = self._table_settings_defaults[table_type]
-              if 'hidden_columns' in settings:
-                  columns_to_hide = settings['hidden_columns']
-
-          if columns_to_hide and self.header_labels:
-              self._hide_columns_by_name(columns_to_hide) # Uses self.header_labels
-        except Exception as e:
-          self.logger.warning(f"Loading data error: {e}")
-
-    def _populate_data(self, data: list[dict]):
-        """Populate managed table with data using stored headers."""
-        self.table_widget.setRowCount(0)  # Clears table rows
-        self.table_widget.setColumnCount(0) # Clears columns
-
-        if not self.header_labels: # Cannot proceed without headers
-             return
-
-        self.table_widget.setColumnCount(len(self.header_labels))
-        self.table_widget.setHorizontalHeaderLabels(self.header_labels)
-
-        if not data: # If data is empty, headers are set, just return
-            return
-
-        self.table_widget.setRowCount(len(data))
-
-        # Initialize column widths with header widths
-        fm = self.table_widget.fontMetrics()
-        column_widths = [0] * len(self.header_labels)
-
-        for col, header in enumerate(self.header_labels):
-            header_width = fm.horizontalAdvance(str(header))
-            column_widths[col] = max(column_widths[col], header_width)
-
-        # Populate rows and calculate content widths
-        for row_index, row_dict in enumerate(data):
-            for col_index, header in enumerate(self.header_labels):
-                # Get data using header as key, default to "" if key missing
-                cell_data = row_dict.get(header, "")
-                item = QTableWidgetItem(str(cell_data))
-                item.setFlags(Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEnabled)
-                self.table_widget.setItem(row_index, col_index, item)
-
-                # Calculate content width using font metrics
-                content_width = fm.horizontalAdvance(str(cell_data))
-                column_widths[col_index] = max(column_widths[col_index], content_width)
-
-        # Apply calculated widths with padding
-        for col, width in enumerate(column_widths):
-            padding = 40  # Adjust padding as needed
-            final_width = min(width + padding, 400)  # Maximum width of 400px
-
-            # Special handling for date columns by header name
-            if any(date_keyword in self.header_labels[col].lower() for date_keyword in ['date', 'time']):
-                final_width = max(final_width, 120)  # Minimum width for date columns
-
-            self.table_widget.setColumnWidth(col, final_width)
+        # self.table.horizontalHeader().setStretchLastSection(True)
 
+    def _columns_to_hide(self, table_type: str | None, hidden_column_names: list[str] | None) -> list[str]:
+        """Header names to hide: the explicit list, else the table_type settings."""
+        if hidden_column_names is not None:
+            return hidden_column_names # Explicit list takes precedence
+        if table_type and table_type in self._table_settings_defaults:
+            return self._table_settings_defaults[table_type].get('hidden_columns', [])
+        return []
 
     def _hide_columns_by_name(self, headers_to_hide: list[str]):
         """Hide specified columns by their header name in the managed table.
@@ -142,7 +61,7 @@ class TableWidgetManager:
         for header_name in headers_to_hide:
             col_index = header_indices.get(header_name)
             if col_index is not None:
-                self.table_widget.setColumnHidden(col_index, True)
+                self.table.setColumnHidden(col_index, True)
 
     def rearrange_columns_visual(self, first_header: str, second_header: str):
         """Visually moves the column with 'first_header' to be before 'second_header'.
@@ -157,11 +76,11 @@ class TableWidgetManager:
             print(f"Warning: Headers missing or specified headers ('{first_header}', '{second_header}') not found.")
             return  # Skip if headers are missing
 
-        header_view = self.table_widget.horizontalHeader()
+        header_view = self.table.horizontalHeader()
 
         # --- Added Check ---
         if header_view is None:
-            print("Error: Table widget's horizontal header is None. Cannot rearrange columns.")
+            print("Error: Table's horizontal header is None. Cannot rearrange columns.")
             return
         # --- End Added Check ---
 
@@ -231,4 +150,212 @@ class TableWidgetManager:
                  new_row[header1] = new_row.pop(header2)
             new_data.append(new_row)
 
-        return new_headers, new_data
\ No newline at end of file
+        return new_headers, new_data
+
+
+class TableWidgetManager(TableManagerBase):
+    """
+    Manager class to handle operations for a specific QTableWidget instance.
+    """
+
+    def __init__(self, table_widget: QTableWidget):
+        """
+        Initialize the manager for a specific QTableWidget.
+
+        Args:
+            table_widget: The QTableWidget instance this manager will control.
+        """
+        if not isinstance(table_widget, QTableWidget):
+            raise TypeError("Expected a QTableWidget instance.")
+        self.table_widget = table_widget
+        super().__init__(table_widget)
+
+    def load_data(self, data: list[dict],
+                  header_labels: list[str] | None = None, table_type: str |None = None,
+                  hidden_column_names: list[str] | None = None):
+        """Load data (list of dictionaries) into the managed table widget.
+
+        Args:
+            data: List of dictionaries (each dict is a row).
+            header_labels: Optional list of column headers to display. If None,
+                           keys from the first data dictionary are used.
+            table_type: Optional type of table for predefined settings (e.g., hiding columns).
+            hidden_column_names: Optional explicit list of header names to hide.
+                                 Overrides table_type settings if provided.
+        """
+        try:
+        # Determine headers
+          if data:
+              # Use provided header_labels if they exist, otherwise use dict keys
+              self.header_labels = header_labels if header_labels is not None else list(data[0].keys())
+          elif header_labels is not None:
+              # Data is empty, but headers were provided
+              self.header_labels = header_labels
+          else: # data is empty and no headers provided
+              self.header_labels = []
+
+          self._populate_data(data) # Uses self.header_labels
+        
+
+          # Determine columns to hide
+          columns_to_hide = self._columns_to_hide(table_type, hidden_column_names)
+
+          if columns_to_hide and self.header_labels:
+              self._hide_columns_by_name(columns_to_hide) # Uses self.header_labels
+        except Exception as e:
+          self.logger.warning(f"Loading data error: {e}")
+
+    def _populate_data(self, data: list[dict]):
+        """Populate managed table with data using stored headers."""
+        self.table_widget.setRowCount(0)  # Clears table rows
+        self.table_widget.setColumnCount(0) # Clears columns
+
+        if not self.header_labels: # Cannot proceed without headers
+             return
+
+        self.table_widget.setColumnCount(len(self.header_labels))
+        self.table_widget.setHorizontalHeaderLabels(self.header_labels)
+
+        if not data: # If data is empty, headers are set, just return
+            return
+
+        self.table_widget.setRowCount(len(data))
+
+        # Initialize column widths with header widths
+        fm = self.table_widget.fontMetrics()
+        column_widths = [0] * len(self.header_labels)
+
+        for col, header in enumerate(self.header_labels):
+            header_width = fm.horizontalAdvance(str(header))
+            column_widths[col] = max(column_widths[col], header_width)
+
+        # Populate rows and calculate content widths
+        for row_index, row_dict in enumerate(data):
+            for col_index, header in enumerate(self.header_labels):
+                # Get data using header as key, default to "" if key missing
+                cell_data = row_dict.get(header, "")
+                item = QTableWidgetItem(str(cell_data))
+                item.setFlags(Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEnabled)
+                self.table_widget.setItem(row_index, col_index, item)
+
+                # Calculate content width using font metrics
+                content_width = fm.horizontalAdvance(str(cell_data))
+                column_widths[col_index] = max(column_widths[col_index], content_width)
+
+        # Apply calculated widths with padding
+        for col, width in enumerate(column_widths):
+            padding = 40  # Adjust padding as needed
+            final_width = min(width + padding, 400)  # Maximum width of 400px
+
+            # Special handling for date columns by header name
+            if any(date_keyword in self.header_labels[col].lower() for date_keyword in ['date', 'time']):
+                final_width = max(final_width, 120)  # Minimum width for date columns
+
+            self.table_widget.setColumnWidth(col, final_width)
+
+
+class TableViewManager(TableManagerBase):
+    """
+    Manager for a QTableView backed by a ColumnarTableModel.
+
+    Same API as TableWidgetManager, but no per-cell items are created: the
+    model serves cells lazily and hands rows to the view in batches, and
+    column widths are measured on a sample of rows instead of every cell.
+    """
+
+    # Rows measured when sizing columns
+    WIDTH_SAMPLE_ROWS = 200
+    # Column titles of the designer tables, by objectName. A QTableView in a .ui
+    # file cannot hold column labels, so they are set here before any data is loaded.
+    HEADERS: dict[str, list[str]] = {
+        'student_table': ["Code module", "Code presentation", "ID student", "Gender", "Region",
+                          "Highest education", "IMB band", "Age band", "Previous attempt", "Studied credit"],
+        'payment_table': ["ID Invoice", "ID Student", "Code Module", "Code Presentation", "Date", "Amount", "Status"],
+        'course_student_table': ["ID Student", "Date Registration", "Date Unregistration", "ID Assessment", "Score"],
+        'course_assessment_table': ["ID Assessment", "Assessment type", "Date", "Weight"],
+        'analysis_table': ["Code module", "Code presentation", "ID Student"],
+    }
+
+    def __init__(self, table_view: QTableView, batch_size: int = 500,
+                 header_labels: list[str] | None = None):
+        """
+        Initialize the manager for a specific QTableView.
+
+        Args:
+            table_view: The QTableView instance this manager will control.
+            batch_size: Rows handed to the view per incremental fetch.
+            header_labels: Column titles shown while the table is empty
+                           (default HEADERS[table_view.objectName()], if any).
+        """
+        if not isinstance(table_view, QTableView) or isinstance(table_view, QTableWidget):
+            raise TypeError("Expected a QTableView instance (use TableWidgetManager for QTableWidget).")
+        self.table_view = table_view
+        super().__init__(table_view)
+        self.model = ColumnarTableModel(batch_size=batch_size, parent=table_view)
+        self.table_view.setModel(self.model)
+        if header_labels is None:
+            header_labels = self.HEADERS.get(table_view.objectName())
+        if header_labels:
+            self.load_data([], header_labels=header_labels)
+
+    def load_data(self, data: list[dict],
+                  header_labels: list[str] | None = None, table_type: str | None = None,
+                  hidden_column_names: list[str] | None = None):
+        """Load data (list of dictionaries) into the model. Same arguments as TableWidgetManager.load_data."""
+        try:
+            if header_labels is None:
+                header_labels = list(data[0].keys()) if data else []
+            columns = [[row.get(header, "") for row in data] for header in header_labels]
+            self.load_columns(header_labels, columns, table_type, hidden_column_names)
+        except Exception as e:
+            self.logger.warning(f"Loading data error: {e}")
+
+    def load_columns(self, header_labels: list[str], columns: Sequence[Sequence[Any]],
+                     table_type: str | None = None, hidden_column_names: list[str] | None = None):
+        """Load column-oriented data (one sequence or NumPy array per header) without row dicts.
+
+        Args:
+            header_labels: Column names, in display order.
+            columns: One sequence of values per header.
+            table_type: Optional type of table for predefined settings (e.g., hiding columns).
+            hidden_column_names: Optional explicit list of header names to hide.
+        """
+        try:
+            self.header_labels = list(header_labels)
+            for col in range(self.model.columnCount()):
+                self.table_view.setColumnHidden(col, False)
+            self.model.set_columns(self.header_labels, columns)
+            self._apply_column_widths()
+
+            columns_to_hide = self._columns_to_hide(table_type, hidden_column_names)
+            if columns_to_hide and self.header_labels:
+                self._hide_columns_by_name(columns_to_hide)
+        except Exception as e:
+            self.logger.warning(f"Loading data error: {e}")
+
+    def load_column_map(self, columns: Mapping[str, Sequence[Any]],
+                        header_labels: list[str] | None = None, table_type: str | None = None,
+                        hidden_column_names: list[str] | None = None):
+        """Load {name: column} data as returned by DBExecuteService.fetch_columns().
+
+        Args:
+            columns: Column name -> sequence or NumPy array, in display order.
+            header_labels: Optional display labels, one per column (defaults to the column names).
+        """
+        names = list(columns.keys())
+        self.load_columns(header_labels if header_labels is not None else names,
+                          [columns[name] for name in names], table_type, hidden_column_names)
+
+    def _apply_column_widths(self):
+        """Size columns from the header and a sample of rows (same limits as TableWidgetManager)."""
+        fm = self.table_view.fontMetrics()
+        for col, header in enumerate(self.header_labels or []):
+            width = fm.horizontalAdvance(str(header))
+            for value in self.model.column_values(col, self.WIDTH_SAMPLE_ROWS):
+                width = max(width, fm.horizontalAdvance("" if value is None else str(value)))
+
+            padding = 40  # Adjust padding as needed
+            final_width = min(width + padding, 400)  # Maximum width of 400px
+            if any(date_keyword in header.lower() for date_keyword in ['date', 'time']):
+                final_width = max(final_width, 120)  # Minimum width for date columns
+            self.table_view.setColumnWidth(col, final_width)
@@ -0,0 +1,112 @@
+from __future__ import annotations # Allow type hinting ColumnarTableModel within the class
+from typing import Any, Sequence
+
+from PyQt6.QtCore import QAbstractTableModel, QModelIndex, Qt
+from utils.logger import get_class_logger
+
+class ColumnarTableModel(QAbstractTableModel):
+    """
+    Read-only table model over column-oriented data.
+
+    Cells are never materialized as items: data() looks the value up in the
+    column sequence when the view paints it, so memory and paint time scale
+    with the visible rows. Rows are exposed to the view incrementally via
+    canFetchMore()/fetchMore(), batch_size rows at a time.
+    """
+    def __init__(self, headers: list[str] | None = None,
+                 columns: Sequence[Sequence[Any]] | None = None,
+                 batch_size: int = 500, parent=None):
+        """
+        Args:
+            headers: Column names, in display order.
+            columns: One sequence (list, tuple or NumPy array) per header.
+            batch_size: Rows added to the view per fetchMore() call.
+        """
+        super().__init__(parent)
+        self.logger = get_class_logger(__name__, self.__class__.__name__)
+        self.batch_size = batch_size
+        self._headers: list[str] = []
+        self._columns: list[Sequence[Any]] = []
+        self._total_rows = 0
+        self._loaded_rows = 0
+        self.set_columns(headers or [], columns or [])
+
+    # --- Loading ---
+
+    def set_columns(self, headers: list[str], columns: Sequence[Sequence[Any]]) -> None:
+        """Replaces the whole data set. Only the first batch is exposed to the view."""
+        if len(headers) != len(columns):
+            raise ValueError(f"Got {len(headers)} headers but {len(columns)} columns.")
+        lengths = {len(col) for col in columns}
+        if len(lengths) > 1:
+            raise ValueError(f"Columns have different lengths: {sorted(lengths)}.")
+
+        self.beginResetModel()
+        self._headers = list(headers)
+        self._columns = list(columns)
+        self._total_rows = lengths.pop() if lengths else 0
+        self._loaded_rows = min(self.batch_size, self._total_rows)
+        self.endResetModel()
+        self.logger.debug(f"Model reset: {self._total_rows} rows x {len(self._headers)} columns.")
+
+    @classmethod
+    def from_records(cls, data: list[dict], headers: list[str] | None = None, **kwargs) -> ColumnarTableModel:
+        """Builds a model from a list of row dictionaries (missing keys become "")."""
+        headers = headers if headers is not None else (list(data[0].keys()) if data else [])
+        columns = [[row.get(header, "") for row in data] for header in headers]
+        return cls(headers, columns, **kwargs)
+
+    @property
+    def headers(self) -> list[str]:
+        return self._headers
+
+    @property
+    def total_rows(self) -> int:
+        """Rows in the data set, including those not yet fetched by the view."""
+        return self._total_rows
+
+    def column_values(self, column: int, limit: int | None = None) -> Sequence[Any]:
+        """Raw values of a column (optionally only the first `limit`)."""
+        values = self._columns[column]
+        return values if limit is None else values[:limit]
+
+    # --- QAbstractTableModel Interface ---
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._loaded_rows
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._headers)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid() or role != Qt.ItemDataRole.DisplayRole:
+            return None
+        value = self._columns[index.column()][index.row()]
+        return "" if value is None or value != value else str(value) # value != value: NaN/NaT from NumPy columns
+
+    def headerData(self, section: int, orientation: Qt.Orientation,
+                   role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return self._headers[section] if 0 <= section < len(self._headers) else None
+        return str(section + 1)
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        return Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEnabled
+
+    def canFetchMore(self, parent: QModelIndex = QModelIndex()) -> bool:
+        return not parent.isValid() and self._loaded_rows < self._total_rows
+
+    def fetchMore(self, parent: QModelIndex = QModelIndex()) -> None:
+        if parent.isValid():
+            return
+        remaining = self._total_rows - self._loaded_rows
+        to_fetch = min(self.batch_size, remaining)
+        if to_fetch <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._loaded_rows, self._loaded_rows + to_fetch - 1)
+        self._loaded_rows += to_fetch
+        self.endInsertRows()